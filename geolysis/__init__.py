@@ -1,4 +1,32 @@
-from . import bearing_capacity, foundation, soil_classifier, spt
+from . import (
+    bearing_capacity,
+    borehole,
+    correlations,
+    foundation,
+    io,
+    lab_tests,
+    liquefaction,
+    parallel,
+    soil_classifier,
+    soil_profile,
+    spatial,
+    spt,
+    stats,
+)
 
 __version__ = "0.24.1"
-__all__ = ["foundation", "soil_classifier", "spt", "bearing_capacity"]
+__all__ = [
+    "foundation",
+    "soil_classifier",
+    "spt",
+    "bearing_capacity",
+    "borehole",
+    "io",
+    "soil_profile",
+    "spatial",
+    "correlations",
+    "liquefaction",
+    "stats",
+    "parallel",
+    "lab_tests",
+]
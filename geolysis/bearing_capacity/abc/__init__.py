@@ -8,6 +8,7 @@ from ._cohl import (
     TerzaghiABC4PadFoundation,
     create_abc_4_cohesionless_soils,
 )
+from ._sizing import FootingSizingResult, size_footing, size_footings
 
 __all__ = [
     "BowlesABC4PadFoundation",
@@ -18,4 +19,7 @@ __all__ = [
     "TerzaghiABC4MatFoundation",
     "ABCMethod",
     "create_abc_4_cohesionless_soils",
+    "FootingSizingResult",
+    "size_footing",
+    "size_footings",
 ]
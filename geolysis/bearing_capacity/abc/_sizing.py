@@ -0,0 +1,361 @@
+from dataclasses import dataclass
+from typing import Annotated, Optional, Sequence
+
+from func_validator import (
+    MustBeMemberOf,
+    MustBePositive,
+    MustHaveLengthGreaterThan,
+    validate_params,
+)
+
+from geolysis.borehole import Borehole
+from geolysis.foundation import FoundationType, Shape
+from geolysis.spt import SPTDesignMethod
+from geolysis.utils import inf
+
+from ._cohl import ABCMethod, create_abc_4_cohesionless_soils
+from ._cohl._core import AllowableBearingCapacity
+
+__all__ = ["FootingSizingResult", "size_footing", "size_footings"]
+
+
+@dataclass(frozen=True, slots=True)
+class FootingSizingResult:
+    """Result of sizing a footing against a borehole.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    width: float
+    """Minimum width of the footing that carries the applied load (m)."""
+
+    n_design: float
+    """SPT N-design over the influence zone of the sized footing."""
+
+    allowable_bearing_capacity: float
+    """Allowable bearing capacity of the sized footing ($kPa$)."""
+
+    allowable_applied_load: float
+    """Allowable applied load of the sized footing ($kN$)."""
+
+    iterations: int
+    """Number of fixed-point iterations performed."""
+
+    converged: bool
+    """Whether the fixed-point iteration converged. When it did not, the
+    width was obtained by scanning the coupled problem instead."""
+
+
+class _FootingSizer:
+    """Sizes a single footing by coupling the SPT influence zone with
+    the allowable bearing capacity classes.
+    """
+
+    def __init__(
+        self,
+        borehole: Borehole,
+        tol_settlement: float,
+        ground_water_level: float,
+        shape: Shape,
+        foundation_type: FoundationType,
+        abc_method: ABCMethod,
+        spt_design_method: SPTDesignMethod,
+        length_to_width_ratio: float,
+        min_width: float,
+        max_width: float,
+        tol: float,
+        max_iter: int,
+    ):
+        self.borehole = borehole
+        self.tol_settlement = tol_settlement
+        self.ground_water_level = ground_water_level
+        self.shape = shape
+        self.foundation_type = foundation_type
+        self.abc_method = abc_method
+        self.spt_design_method = spt_design_method
+        self.length_to_width_ratio = length_to_width_ratio
+        self.min_width = min_width
+        self.max_width = max_width
+        self.tol = tol
+        self.max_iter = max_iter
+
+    def _create_abc(self, depth: float) -> AllowableBearingCapacity:
+        # The bearing capacity object is created once per footing and
+        # mutated in place while iterating on the width.
+        n_design = self._n_design(depth, self.min_width)
+        return create_abc_4_cohesionless_soils(
+            corrected_spt_n_value=n_design,
+            tol_settlement=self.tol_settlement,
+            depth=depth,
+            width=self.min_width,
+            length=self.min_width * self.length_to_width_ratio,
+            ground_water_level=self.ground_water_level,
+            shape=self.shape,
+            foundation_type=self.foundation_type,
+            abc_method=self.abc_method,
+        )
+
+    def _n_design(self, depth: float, width: float) -> float:
+        # Bowles uses the influence zone 0.5B to 2B below the base.
+        start = 0.5 if self.abc_method == ABCMethod.BOWLES else 0.0
+        return self.borehole.n_design(
+            depth, width, method=self.spt_design_method, start=start
+        )
+
+    def _set_width(self, abc: AllowableBearingCapacity, width: float):
+        abc.foundation_size.width = width
+        if self.shape == Shape.RECTANGLE:
+            abc.foundation_size.length = width * self.length_to_width_ratio
+
+    def _residual(
+        self,
+        abc: AllowableBearingCapacity,
+        width: float,
+        applied_load: float,
+        n_design: Optional[float] = None,
+    ) -> float:
+        """Return the allowable applied load in excess of the applied
+        load for the given width. The N-design is recomputed for the
+        width when it is not provided.
+        """
+        if n_design is None:
+            n_design = self._n_design(abc.foundation_size.depth, width)
+        abc.corrected_spt_n_value = n_design
+        self._set_width(abc, width)
+        return abc.allowable_applied_load() - applied_load
+
+    def _bisect(
+        self,
+        abc: AllowableBearingCapacity,
+        applied_load: float,
+        n_design: Optional[float],
+        lo: float,
+        hi: float,
+    ) -> float:
+        """Return the smallest width between `lo` and `hi` within the
+        tolerance that carries the applied load, given that `hi` carries
+        it.
+        """
+        if self._residual(abc, lo, applied_load, n_design) >= 0.0:
+            return lo
+
+        while hi - lo > self.tol:
+            mid = 0.5 * (lo + hi)
+            if self._residual(abc, mid, applied_load, n_design) >= 0.0:
+                hi = mid
+            else:
+                lo = mid
+
+        return hi
+
+    def _zone_widths(self, depth: float, max_width: float) -> list[float]:
+        """Return the widths between `min_width` and `max_width` at which
+        an edge of the influence zone crosses a reading, with both
+        bounds, in ascending order.
+        """
+        start = 0.5 if self.abc_method == ABCMethod.BOWLES else 0.0
+        widths = {self.min_width, max_width}
+        for spt_depth in self.borehole.depths:
+            for factor in (start, 2.0):
+                if factor > 0.0:
+                    width = (spt_depth - depth) / factor
+                    if self.min_width < width < max_width:
+                        widths.add(width)
+        return sorted(widths)
+
+    def _scan(
+        self,
+        abc: AllowableBearingCapacity,
+        applied_load: float,
+        depth: float,
+        max_width: float,
+    ) -> Optional[float]:
+        """Return the smallest width up to `max_width` that carries the
+        applied load, or `None` when there is none.
+
+        The N-design only changes where an edge of the influence zone
+        crosses a reading, so the intervals between these widths are
+        scanned upwards and the first one that carries the load is
+        bisected with its N-design.
+        """
+        widths = self._zone_widths(depth, max_width)
+        for lo, hi in zip(widths, widths[1:]):
+            n_design = self._n_design(depth, 0.5 * (lo + hi))
+            if self._residual(abc, hi, applied_load, n_design) < 0.0:
+                continue
+            width = self._bisect(abc, applied_load, n_design, lo, hi)
+            # At the ends of the interval, the N-design can be that of
+            # the neighbouring interval.
+            if self._residual(abc, width, applied_load) >= 0.0:
+                return width
+        return None
+
+    def size(self, applied_load: float, depth: float) -> FootingSizingResult:
+        abc = self._create_abc(depth)
+
+        width = self.min_width
+        widths = [width]
+        converged = False
+        iterations = 0
+
+        while iterations < self.max_iter:
+            iterations += 1
+            n_design = self._n_design(depth, width)
+            if self._residual(abc, self.max_width, applied_load, n_design) < 0.0:
+                break
+
+            new_width = self._bisect(
+                abc, applied_load, n_design, self.min_width, self.max_width
+            )
+
+            if abs(new_width - width) <= self.tol:
+                width = new_width
+                converged = True
+                break
+
+            # The N-design is piecewise constant in the width, so the
+            # iteration can cycle between a few widths. Stop early and
+            # scan the coupled problem instead.
+            if any(abs(new_width - w) <= self.tol for w in widths):
+                break
+
+            width = new_width
+            widths.append(width)
+
+        # A fixed point is not necessarily the smallest width, as a
+        # narrower footing can have a larger N-design, so the widths
+        # below it are scanned as well.
+        smallest = self._scan(
+            abc, applied_load, depth, width if converged else self.max_width
+        )
+        if smallest is not None:
+            width = smallest
+        elif not converged:
+            msg = (
+                f"A footing of width {self.max_width} m cannot carry an "
+                f"applied load of {applied_load} kN, increase max_width."
+            )
+            raise ValueError(msg)
+
+        n_design = self._n_design(depth, width)
+        self._residual(abc, width, applied_load, n_design)
+
+        return FootingSizingResult(
+            width=width,
+            n_design=n_design,
+            allowable_bearing_capacity=abc.allowable_bearing_capacity(),
+            allowable_applied_load=abc.allowable_applied_load(),
+            iterations=iterations,
+            converged=converged,
+        )
+
+
+@validate_params
+def size_footings(
+    applied_loads: Sequence[float],
+    depths: Sequence[float],
+    spt_depths: Annotated[Sequence[float], MustHaveLengthGreaterThan(1)],
+    corrected_spt_n_values: Annotated[Sequence[float], MustHaveLengthGreaterThan(1)],
+    tol_settlement: float,
+    ground_water_level: float = inf,
+    shape: Annotated[Shape | str, MustBeMemberOf(Shape)] = "square",
+    foundation_type: Annotated[
+        FoundationType | str, MustBeMemberOf(FoundationType)
+    ] = "pad",
+    abc_method: Annotated[ABCMethod | str, MustBeMemberOf(ABCMethod)] = "meyerhof",
+    spt_design_method: Annotated[
+        SPTDesignMethod | str, MustBeMemberOf(SPTDesignMethod)
+    ] = "avg",
+    length_to_width_ratio: Annotated[float, MustBePositive()] = 1.0,
+    min_width: Annotated[float, MustBePositive()] = 0.3,
+    max_width: Annotated[float, MustBePositive()] = 10.0,
+    tol: Annotated[float, MustBePositive()] = 1e-3,
+    max_iter: Annotated[int, MustBePositive()] = 20,
+) -> list[FootingSizingResult]:
+    r"""Size a schedule of footings founded on the same borehole.
+
+    The N-value used in the allowable bearing capacity depends on the
+    influence zone below the footing, which in turn depends on the width
+    being solved for. Each footing is sized by a fixed-point iteration
+    that alternates between computing the N-design for the current
+    width and solving for the width that carries the applied load with
+    that N-design. As the N-design only changes where an edge of the
+    influence zone crosses a reading, the intervals between these widths
+    are then scanned upwards for a narrower footing, which also sizes
+    the footings for which the iteration does not settle. The result is
+    the minimum width that carries the load, within `tol`.
+
+    !!! info "Added in v0.25.0"
+
+    :param applied_loads: Applied load on each footing ($kN$).
+    :param depths: Depth of each footing (m).
+    :param spt_depths: Depths of the SPT readings (m).
+    :param corrected_spt_n_values: Corrected SPT N-values at
+                                   `spt_depths`.
+    :param tol_settlement: Tolerable settlement of foundation (mm).
+    :param ground_water_level: Depth of water below ground level (m).
+    :param shape: Shape of foundation footing.
+    :param foundation_type: Type of foundation.
+    :param abc_method: Type of allowable bearing capacity calculation to
+                       apply.
+    :param spt_design_method: Method used to compute the N-design over
+                              the influence zone.
+    :param length_to_width_ratio: Length to width ratio of rectangular
+                                  footings.
+    :param min_width: Smallest width considered (m).
+    :param max_width: Largest width considered (m).
+    :param tol: Width tolerance (m).
+    :param max_iter: Maximum number of fixed-point iterations.
+
+    :raises ValueError: Raised when a footing cannot be sized within
+                        `max_width` or the borehole does not have enough
+                        readings below a footing.
+    """
+    if len(applied_loads) != len(depths):
+        raise ValueError("applied_loads and depths must have the same length.")
+
+    sizer = _FootingSizer(
+        borehole=Borehole(spt_depths, corrected_spt_n_values),
+        tol_settlement=tol_settlement,
+        ground_water_level=ground_water_level,
+        shape=Shape(str(shape).casefold()),
+        foundation_type=FoundationType(foundation_type),
+        abc_method=ABCMethod(abc_method),
+        spt_design_method=SPTDesignMethod(spt_design_method),
+        length_to_width_ratio=length_to_width_ratio,
+        min_width=min_width,
+        max_width=max_width,
+        tol=tol,
+        max_iter=max_iter,
+    )
+
+    return [
+        sizer.size(applied_load=load, depth=depth)
+        for load, depth in zip(applied_loads, depths)
+    ]
+
+
+def size_footing(
+    applied_load: float,
+    depth: float,
+    spt_depths: Sequence[float],
+    corrected_spt_n_values: Sequence[float],
+    tol_settlement: float,
+    **kwargs,
+) -> FootingSizingResult:
+    """Size a single footing founded on a borehole.
+
+    See [size_footings][geolysis.bearing_capacity.abc.size_footings]
+    for the description of the parameters.
+
+    !!! info "Added in v0.25.0"
+    """
+    (result,) = size_footings(
+        [applied_load],
+        [depth],
+        spt_depths=spt_depths,
+        corrected_spt_n_values=corrected_spt_n_values,
+        tol_settlement=tol_settlement,
+        **kwargs,
+    )
+    return result
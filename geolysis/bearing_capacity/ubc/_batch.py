@@ -0,0 +1,163 @@
+from array import array
+from dataclasses import dataclass
+from typing import Annotated, Optional, Sequence
+
+from func_validator import MustBeMemberOf, MustHaveLengthGreaterThan, validate_params
+
+from geolysis.correlations import FrictionAngleMethod, correlate_spt_n_values
+from geolysis.foundation import Shape
+from geolysis.utils import broadcast, inf
+
+from ._core import UltimateBearingCapacity
+from ._factory import UBCMethod, create_ubc_4_all_soils
+
+__all__ = [
+    "UBCBatchResult",
+    "ultimate_bearing_capacities",
+    "ultimate_bearing_capacities_from_spt",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class UBCBatchResult:
+    """Bearing capacities of a batch of soils.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    ultimate_bearing_capacities: array
+    """Ultimate bearing capacity of each soil ($kPa$)."""
+
+    allowable_bearing_capacities: array
+    """Allowable bearing capacity of each soil ($kPa$)."""
+
+    allowable_applied_loads: array
+    """Allowable applied load of each soil ($kN$)."""
+
+
+@validate_params
+def ultimate_bearing_capacities(
+    friction_angles: Annotated[Sequence[float], MustHaveLengthGreaterThan(0)],
+    cohesions: float | Sequence[float],
+    moist_unit_wgts: float | Sequence[float],
+    depth: float | Sequence[float],
+    width: float,
+    length: Optional[float] = None,
+    factor_of_safety: float = 3.0,
+    saturated_unit_wgts: float | Sequence[float] = 20.5,
+    eccentricity: float = 0.0,
+    ground_water_level: Optional[float] = inf,
+    load_angle: float = 0.0,
+    apply_local_shear: bool = False,
+    shape: Shape | str = "square",
+    ubc_method: Annotated[UBCMethod | str, MustBeMemberOf(UBCMethod)] = "vesic",
+) -> UBCBatchResult:
+    """Batch version of
+    [create_ubc_4_all_soils][geolysis.bearing_capacity.ubc.create_ubc_4_all_soils].
+
+    Computes the bearing capacity of the same footing on a column of
+    soils, e.g. the soil at each SPT reading of a borehole. A single
+    bearing capacity object is created and updated for each soil, and
+    the results are identical to creating one object per soil.
+
+    `cohesions`, `moist_unit_wgts`, `depth` and `saturated_unit_wgts`
+    can either be a single value used for every soil or a column of the
+    same length as `friction_angles`.
+
+    !!! info "Added in v0.25.0"
+
+    :param friction_angles: Internal angle of friction of each soil
+                            (degrees).
+    :param cohesions: Cohesion of each soil ($kPa$).
+    :param moist_unit_wgts: Moist unit weight of each soil ($kN/m^3$).
+    :param depth: Depth of foundation (m).
+    :param width: Width of foundation footing (m).
+
+    See [create_ubc_4_all_soils][geolysis.bearing_capacity.ubc.create_ubc_4_all_soils]
+    for the description of the other parameters.
+
+    :raises ValidationError: Raised when a soil parameter is invalid.
+    """
+    size = len(friction_angles)
+    cohesions = broadcast(cohesions, size)
+    moist_unit_wgts = broadcast(moist_unit_wgts, size)
+    saturated_unit_wgts = broadcast(saturated_unit_wgts, size)
+    depths = broadcast(depth, size)
+
+    ubc: UltimateBearingCapacity = create_ubc_4_all_soils(
+        friction_angle=friction_angles[0],
+        cohesion=cohesions[0],
+        moist_unit_wgt=moist_unit_wgts[0],
+        depth=depths[0],
+        width=width,
+        length=length,
+        factor_of_safety=factor_of_safety,
+        saturated_unit_wgt=saturated_unit_wgts[0],
+        eccentricity=eccentricity,
+        ground_water_level=ground_water_level,
+        load_angle=load_angle,
+        apply_local_shear=apply_local_shear,
+        shape=shape,
+        ubc_method=ubc_method,
+    )
+    area = ubc.foundation_size.foundation_area()
+
+    ult_bcs, allow_bcs, allow_loads = array("d"), array("d"), array("d")
+    for i in range(size):
+        ubc.friction_angle = friction_angles[i]
+        ubc.cohesion = cohesions[i]
+        ubc.moist_unit_wgt = moist_unit_wgts[i]
+        ubc.saturated_unit_wgt = saturated_unit_wgts[i]
+        ubc.foundation_size.depth = depths[i]
+
+        # The allowable applied load is computed from the allowable
+        # bearing capacity as in `allowable_applied_load`, without
+        # evaluating the bearing capacity a third time.
+        allow_bc = ubc.allowable_bearing_capacity()
+        ult_bcs.append(ubc.ultimate_bearing_capacity())
+        allow_bcs.append(allow_bc)
+        allow_loads.append(round(allow_bc * area, 1))
+
+    return UBCBatchResult(
+        ultimate_bearing_capacities=ult_bcs,
+        allowable_bearing_capacities=allow_bcs,
+        allowable_applied_loads=allow_loads,
+    )
+
+
+def ultimate_bearing_capacities_from_spt(
+    corrected_spt_n_values: Sequence[float],
+    depth: float | Sequence[float],
+    width: float,
+    friction_angle_method: FrictionAngleMethod | str = "peck_hanson_thornburn",
+    **kwargs,
+) -> UBCBatchResult:
+    """Return the bearing capacity of a footing on cohesionless soils
+    characterised by their corrected SPT N-values.
+
+    The friction angle and moist unit weight of each soil are obtained
+    with [correlate_spt_n_values][geolysis.correlations.correlate_spt_n_values]
+    and passed to
+    [ultimate_bearing_capacities][geolysis.bearing_capacity.ubc.ultimate_bearing_capacities]
+    with no cohesion.
+
+    !!! info "Added in v0.25.0"
+
+    :param corrected_spt_n_values: Corrected SPT N-values, e.g.
+                                   `SPTCorrectionResult.corrected_spt_n_values`.
+    :param depth: Depth of foundation (m).
+    :param width: Width of foundation footing (m).
+    :param friction_angle_method: Friction angle correlation.
+    :param kwargs: Other arguments of `ultimate_bearing_capacities`.
+    """
+    soils = correlate_spt_n_values(
+        corrected_spt_n_values, friction_angle_method=friction_angle_method
+    )
+    return ultimate_bearing_capacities(
+        friction_angles=soils.friction_angles,
+        cohesions=0.0,
+        moist_unit_wgts=soils.moist_unit_wgts,
+        depth=depth,
+        width=width,
+        **kwargs,
+    )
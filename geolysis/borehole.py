@@ -0,0 +1,588 @@
+import functools
+from array import array
+from bisect import bisect_left, bisect_right
+from fractions import Fraction
+from typing import Annotated, Optional, Sequence
+
+from func_validator import (
+    MustHaveValuesBetween,
+    MustHaveValuesGreaterThanOrEqual,
+    ValidationError,
+    validate_params,
+)
+
+from .soil_profile import SoilProfile
+from .spt import (
+    SPT,
+    HammerType,
+    SamplerType,
+    SPTCorrectionResult,
+    SPTDesignMethod,
+    correct_spt_n_values,
+)
+from .utils import inf, nan
+
+__all__ = ["Borehole", "SPTDataset"]
+
+
+class Borehole:
+    """Corrected SPT N-values of a borehole indexed by depth.
+
+    Readings are kept sorted by depth so that the N-values within the
+    influence zone of a foundation are found by binary search instead of
+    scanning the whole borehole. This makes evaluating many candidate
+    foundations against the same borehole cheap.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    @validate_params
+    def __init__(
+        self,
+        depths: Annotated[Sequence[float], MustHaveValuesGreaterThanOrEqual(0.0)],
+        corrected_spt_n_values: Annotated[
+            Sequence[float], MustHaveValuesBetween(min_value=1.0, max_value=100.0)
+        ],
+        borehole_id: Optional[str] = None,
+    ):
+        """
+        :param depths: Depth of each SPT reading (m).
+        :param corrected_spt_n_values: Corrected SPT N-value of each
+                                       reading.
+        :param borehole_id: Identifier of the borehole.
+
+        :raises ValueError: Raised when `depths` and
+                            `corrected_spt_n_values` have different
+                            lengths.
+        """
+        if len(depths) != len(corrected_spt_n_values):
+            msg = "depths and corrected_spt_n_values must have the same length."
+            raise ValueError(msg)
+
+        readings = sorted(zip(depths, corrected_spt_n_values))
+        self._depths = array("d", (d for d, _ in readings))
+        self._corrected_spt_n_values = array("d", (n for _, n in readings))
+        self.borehole_id = borehole_id
+
+    def __len__(self) -> int:
+        return len(self._depths)
+
+    def __repr__(self) -> str:
+        return f"Borehole(borehole_id={self.borehole_id!r}, readings={len(self)})"
+
+    @property
+    def depths(self) -> memoryview:
+        """Depth of each SPT reading in ascending order (m)."""
+        return memoryview(self._depths)
+
+    @property
+    def corrected_spt_n_values(self) -> memoryview:
+        """Corrected SPT N-values ordered by depth."""
+        return memoryview(self._corrected_spt_n_values)
+
+    def _slice(self, top: float, bottom: float) -> slice:
+        return slice(
+            bisect_left(self._depths, top), bisect_right(self._depths, bottom)
+        )
+
+    def n_values_between(self, top: float, bottom: float) -> memoryview:
+        """Return the N-values of the readings between `top` and
+        `bottom` (inclusive) without copying them.
+
+        :param top: Depth of the top of the range (m).
+        :param bottom: Depth of the bottom of the range (m).
+        """
+        return self.corrected_spt_n_values[self._slice(top, bottom)]
+
+    def influence_zone(
+        self,
+        depth: float,
+        width: float,
+        start: float = 0.0,
+        end: float = 2.0,
+    ) -> memoryview:
+        r"""Return the N-values within the influence zone of a foundation.
+
+        The influence zone extends from $D_f + start \cdot B$ to
+        $D_f + end \cdot B$, i.e. $D_f$ to $D_f + 2B$ by default. For
+        `Bowles (1997)`, use `start=0.5`. When fewer than two readings
+        fall within the zone, the two readings immediately below the
+        top of the zone are returned instead.
+
+        :param depth: Depth of foundation (m).
+        :param width: Width of foundation footing (m).
+        :param start: Top of the influence zone below the foundation
+                      level, as a multiple of the width.
+        :param end: Bottom of the influence zone below the foundation
+                    level, as a multiple of the width.
+
+        :raises ValueError: Raised when fewer than two readings are
+                            available below the top of the zone.
+        """
+        top = depth + start * width
+        zone = self._slice(top, depth + end * width)
+
+        if zone.stop - zone.start < 2:
+            zone = slice(zone.start, zone.start + 2)
+
+        n_values = self.corrected_spt_n_values[zone]
+        if len(n_values) < 2:
+            msg = (
+                f"Not enough SPT N-values below {top} m to compute the "
+                f"N-design of a foundation at depth {depth} m."
+            )
+            raise ValueError(msg)
+
+        return n_values
+
+    def n_design(
+        self,
+        depth: float,
+        width: float,
+        method: SPTDesignMethod | str = "wgt",
+        start: float = 0.0,
+        end: float = 2.0,
+    ) -> float:
+        """Return the SPT N-design within the influence zone of a
+        foundation.
+
+        This is equivalent to
+        `SPT(borehole.influence_zone(...), method).n_design()`.
+
+        :param depth: Depth of foundation (m).
+        :param width: Width of foundation footing (m).
+        :param method: SPT design method.
+        :param start: Top of the influence zone below the foundation
+                      level, as a multiple of the width.
+        :param end: Bottom of the influence zone below the foundation
+                    level, as a multiple of the width.
+        """
+        n_values = self.influence_zone(depth, width, start=start, end=end)
+        method = SPTDesignMethod(method)
+
+        if method == SPTDesignMethod.MINIMUM:
+            n_design = SPT._min_spt_n_design(n_values)
+        elif method == SPTDesignMethod.AVERAGE:
+            n_design = SPT._avg_spt_n_design(n_values)
+        else:
+            n_design = SPT._wgt_spt_n_design(n_values)
+
+        return round(n_design, ndigits=1)
+
+    @functools.cached_property
+    def _prefix_sums(self) -> list[Fraction]:
+        """Prefix sums of the N-values, `P[i] = N[0] + ... + N[i-1]`.
+
+        The sums are kept exact so that the sum of any window, once
+        rounded, is the same as `math.fsum` of the window. This keeps
+        the average N-design identical to `SPT.n_design`.
+        """
+        prefix_sums = [Fraction(0)]
+        for n in self._corrected_spt_n_values:
+            prefix_sums.append(prefix_sums[-1] + Fraction(n))
+        return prefix_sums
+
+    @functools.cached_property
+    def _sparse_table(self) -> list[array]:
+        """Sparse table of range minimums, where `table[k][i]` is the
+        minimum of `N[i : i + 2**k]`.
+        """
+        table = [self._corrected_spt_n_values]
+        span = 1
+        while 2 * span <= len(self):
+            prev = table[-1]
+            table.append(
+                array("d", map(min, prev[: len(prev) - span], prev[span:]))
+            )
+            span *= 2
+        return table
+
+    @functools.cached_property
+    def _weights(self) -> tuple[array, array]:
+        """Weights `1/i**2` and their running sums for the weighted
+        N-design.
+        """
+        weights, weight_sums = array("d"), array("d", [0.0])
+        total_wgt = 0.0
+        for i in range(1, len(self) + 1):
+            wgt = 1 / i**2
+            total_wgt += wgt
+            weights.append(wgt)
+            weight_sums.append(total_wgt)
+        return weights, weight_sums
+
+    def _range_min(self, lo: int, hi: int) -> float:
+        level = (hi - lo).bit_length() - 1
+        row = self._sparse_table[level]
+        return min(row[lo], row[hi - (1 << level)])
+
+    def rolling_n_design(
+        self,
+        depths: Sequence[float],
+        width: float,
+        method: SPTDesignMethod | str = "wgt",
+        start: float = 0.0,
+        end: float = 2.0,
+    ) -> array:
+        """Return the SPT N-design for a foundation of the given width
+        placed at each of `depths`.
+
+        This gives the same result as calling
+        [n_design][geolysis.borehole.Borehole.n_design] for each depth,
+        but the overlapping windows share precomputed prefix sums (for
+        `avg`) and a sparse table of range minimums (for `min`), so each
+        depth costs a binary search plus constant time. The weights of
+        `wgt` depend on the position of each reading within its window,
+        so the weighted sum is still computed per window (linear in the
+        number of readings in the zone), with only the weights and their
+        sums precomputed.
+
+        Depths for which there are not enough readings below the
+        foundation are assigned `nan`.
+
+        :param depths: Candidate depths of foundation (m).
+        :param width: Width of foundation footing (m).
+        :param method: SPT design method.
+        :param start: Top of the influence zone below the foundation
+                      level, as a multiple of the width.
+        :param end: Bottom of the influence zone below the foundation
+                    level, as a multiple of the width.
+        """
+        method = SPTDesignMethod(method)
+        n_values = self._corrected_spt_n_values
+        n_readings = len(self)
+        n_designs = array("d", bytes(8 * len(depths)))
+
+        if method == SPTDesignMethod.AVERAGE:
+            prefix_sums = self._prefix_sums
+        elif method == SPTDesignMethod.WEIGHTED:
+            weights, weight_sums = self._weights
+
+        for k, depth in enumerate(depths):
+            zone = self._slice(depth + start * width, depth + end * width)
+            lo, hi = zone.start, max(zone.stop, zone.start + 2)
+
+            if hi > n_readings:
+                n_designs[k] = nan
+                continue
+
+            if method == SPTDesignMethod.MINIMUM:
+                n_design = self._range_min(lo, hi)
+            elif method == SPTDesignMethod.AVERAGE:
+                n_design = float(prefix_sums[hi] - prefix_sums[lo]) / (hi - lo)
+            else:
+                total_wgted_spt = 0.0
+                for i in range(lo, hi):
+                    total_wgted_spt += weights[i - lo] * n_values[i]
+                n_design = total_wgted_spt / weight_sums[hi - lo]
+
+            n_designs[k] = round(n_design, ndigits=1)
+
+        return n_designs
+
+
+class _CodedColumn(Sequence):
+    """Read-only column of categories stored as small integer codes."""
+
+    __slots__ = ("codes", "categories")
+
+    def __init__(self, codes: Sequence[int], categories: Sequence):
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return _CodedColumn(self.codes[item], self.categories)
+        return self.categories[self.codes[item]]
+
+
+def _encode(values: Sequence, categories: Sequence, name: str) -> array:
+    """Encode `values` as indices into `categories`."""
+    index = {category: code for code, category in enumerate(categories)}
+    codes = array("B")
+    for value in values:
+        try:
+            codes.append(index[value])
+        except KeyError:
+            key = str(value).casefold()
+            if key not in index:
+                msg = f"{name}: {value} must be in {list(categories)}"
+                raise ValidationError(msg) from None
+            codes.append(index[key])
+    return codes
+
+
+class SPTDataset:
+    """Columnar store of SPT readings from many boreholes.
+
+    Readings are stored in typed arrays, one per field, with hammer and
+    sampler types encoded as small integer codes and borehole ids
+    interned. Readings are sorted by borehole and depth, so the readings
+    of a borehole (or a depth range within it) are a contiguous slice
+    that is returned as a view without copying.
+
+    The columns can be fed directly to
+    [correct_spt_n_values][geolysis.spt.correct_spt_n_values] and to
+    [Borehole][geolysis.borehole.Borehole] for N-design calculations.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    _HAMMER_TYPES = tuple(HammerType)
+    _SAMPLER_TYPES = tuple(SamplerType)
+
+    @validate_params
+    def __init__(
+        self,
+        borehole_ids: Sequence[str],
+        depths: Sequence[float],
+        recorded_spt_n_values: Annotated[
+            Sequence[int], MustHaveValuesBetween(min_value=0, max_value=100)
+        ],
+        rod_lengths: Optional[Sequence[float]] = None,
+        borehole_diameters: Optional[Sequence[float]] = None,
+        hammer_types: Optional[Sequence[HammerType]] = None,
+        sampler_types: Optional[Sequence[SamplerType]] = None,
+    ):
+        """
+        :param borehole_ids: Borehole id of each reading.
+        :param depths: Depth of each reading (m).
+        :param recorded_spt_n_values: Recorded SPT N-value of each
+                                      reading.
+        :param rod_lengths: Length of SPT rod of each reading (m),
+                            defaults to 3.0 m.
+        :param borehole_diameters: Borehole diameter of each reading
+                                   (mm), defaults to 65.0 mm.
+        :param hammer_types: Hammer type of each reading, defaults to
+                             `HammerType.DONUT_1`.
+        :param sampler_types: Sampler type of each reading, defaults to
+                              `SamplerType.STANDARD`.
+
+        :raises ValueError: Raised when the columns have different
+                            lengths.
+        :raises ValidationError: Raised when a recorded SPT N-value is
+                                 not a whole number between 0 and 100.
+        """
+        size = len(depths)
+        rod_lengths = rod_lengths if rod_lengths is not None else [3.0] * size
+        if borehole_diameters is None:
+            borehole_diameters = [65.0] * size
+        if hammer_types is None:
+            hammer_types = [HammerType.DONUT_1] * size
+        if sampler_types is None:
+            sampler_types = [SamplerType.STANDARD] * size
+
+        columns = (
+            borehole_ids,
+            recorded_spt_n_values,
+            rod_lengths,
+            borehole_diameters,
+            hammer_types,
+            sampler_types,
+        )
+        if any(len(column) != size for column in columns):
+            raise ValueError("All columns must have the same length.")
+
+        for i, n in enumerate(recorded_spt_n_values):
+            if n != int(n):
+                msg = f"recorded_spt_n_values: {n} at index {i} must be an integer"
+                raise ValidationError(msg)
+
+        ids = tuple(dict.fromkeys(borehole_ids))
+        id_codes = {borehole_id: code for code, borehole_id in enumerate(ids)}
+        borehole_codes = [id_codes[b] for b in borehole_ids]
+        order = sorted(range(size), key=lambda i: (borehole_codes[i], depths[i]))
+
+        self._borehole_ids = ids
+        self._borehole_codes = id_codes
+        self._depths = array("d", (depths[i] for i in order))
+        self._recorded_spt_n_values = array(
+            "B", (int(recorded_spt_n_values[i]) for i in order)
+        )
+        self._rod_lengths = array("d", (rod_lengths[i] for i in order))
+        self._borehole_diameters = array(
+            "d", (borehole_diameters[i] for i in order)
+        )
+        self._hammer_codes = _encode(
+            [hammer_types[i] for i in order], self._HAMMER_TYPES, "hammer_type"
+        )
+        self._sampler_codes = _encode(
+            [sampler_types[i] for i in order], self._SAMPLER_TYPES, "sampler_type"
+        )
+
+        # offsets[k]:offsets[k + 1] are the rows of borehole k.
+        counts = [0] * len(ids)
+        for code in borehole_codes:
+            counts[code] += 1
+        offsets = array("Q", [0])
+        for count in counts:
+            offsets.append(offsets[-1] + count)
+        self._offsets = offsets
+        # Object holding the memory of the columns, when they are views.
+        self._owner = None
+
+    @classmethod
+    def _from_columns(
+        cls,
+        borehole_ids: Sequence[str],
+        offsets: Sequence[int],
+        depths: Sequence[float],
+        recorded_spt_n_values: Sequence[int],
+        rod_lengths: Sequence[float],
+        borehole_diameters: Sequence[float],
+        hammer_codes: Sequence[int],
+        sampler_codes: Sequence[int],
+        owner: object = None,
+    ) -> "SPTDataset":
+        """Create a dataset from columns that are already sorted and
+        encoded, without copying them.
+
+        `owner` is kept alive with the dataset, e.g. the archive whose
+        mapped file the columns are views of.
+        """
+        dataset = cls.__new__(cls)
+        dataset._borehole_ids = tuple(borehole_ids)
+        dataset._borehole_codes = {b: i for i, b in enumerate(borehole_ids)}
+        dataset._offsets = offsets
+        dataset._depths = depths
+        dataset._recorded_spt_n_values = recorded_spt_n_values
+        dataset._rod_lengths = rod_lengths
+        dataset._borehole_diameters = borehole_diameters
+        dataset._hammer_codes = hammer_codes
+        dataset._sampler_codes = sampler_codes
+        dataset._owner = owner
+        return dataset
+
+    def __len__(self) -> int:
+        return len(self._depths)
+
+    def __repr__(self) -> str:
+        return (
+            f"SPTDataset(boreholes={len(self._borehole_ids)}, readings={len(self)})"
+        )
+
+    @property
+    def borehole_ids(self) -> tuple[str, ...]:
+        """Ids of the boreholes in the dataset."""
+        return self._borehole_ids
+
+    @property
+    def depths(self) -> memoryview:
+        """Depth of each reading (m)."""
+        return memoryview(self._depths)
+
+    @property
+    def recorded_spt_n_values(self) -> memoryview:
+        """Recorded SPT N-value of each reading."""
+        return memoryview(self._recorded_spt_n_values)
+
+    @property
+    def rod_lengths(self) -> memoryview:
+        """Length of SPT rod of each reading (m)."""
+        return memoryview(self._rod_lengths)
+
+    @property
+    def borehole_diameters(self) -> memoryview:
+        """Borehole diameter of each reading (mm)."""
+        return memoryview(self._borehole_diameters)
+
+    @property
+    def hammer_types(self) -> Sequence[HammerType]:
+        """Hammer type of each reading."""
+        return _CodedColumn(memoryview(self._hammer_codes), self._HAMMER_TYPES)
+
+    @property
+    def sampler_types(self) -> Sequence[SamplerType]:
+        """Sampler type of each reading."""
+        return _CodedColumn(memoryview(self._sampler_codes), self._SAMPLER_TYPES)
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes held by the columns of the dataset."""
+        columns = (
+            self._depths,
+            self._recorded_spt_n_values,
+            self._rod_lengths,
+            self._borehole_diameters,
+            self._hammer_codes,
+            self._sampler_codes,
+            self._offsets,
+        )
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def rows(
+        self,
+        borehole_id: str,
+        top: float = 0.0,
+        bottom: float = inf,
+    ) -> slice:
+        """Return the rows of the readings of a borehole between `top`
+        and `bottom` (inclusive).
+
+        :param borehole_id: Id of the borehole.
+        :param top: Depth of the top of the range (m).
+        :param bottom: Depth of the bottom of the range (m).
+
+        :raises KeyError: Raised when the borehole is not in the
+                          dataset.
+        """
+        code = self._borehole_codes[borehole_id]
+        lo, hi = self._offsets[code], self._offsets[code + 1]
+        return slice(
+            bisect_left(self._depths, top, lo, hi),
+            bisect_right(self._depths, bottom, lo, hi),
+        )
+
+    def correct(
+        self,
+        rows: slice = slice(None),
+        *,
+        eop: Sequence[float] | SoilProfile,
+        **kwargs,
+    ) -> SPTCorrectionResult:
+        """Correct the recorded SPT N-values of `rows` with
+        [correct_spt_n_values][geolysis.spt.correct_spt_n_values].
+
+        When `eop` is a [SoilProfile][geolysis.soil_profile.SoilProfile],
+        the depth column of the dataset is used.
+
+        :param rows: Rows to correct, e.g. as returned by
+                     [rows][geolysis.borehole.SPTDataset.rows].
+        :param eop: Effective overburden pressure at each reading
+                    ($kPa$) or the soil profile it is computed from.
+        :param kwargs: Other arguments of `correct_spt_n_values`.
+        """
+        if isinstance(eop, SoilProfile):
+            kwargs["depth"] = self.depths[rows]
+
+        return correct_spt_n_values(
+            self.recorded_spt_n_values[rows],
+            eop=eop,
+            rod_length=self.rod_lengths[rows],
+            borehole_diameter=self.borehole_diameters[rows],
+            hammer_type=self.hammer_types[rows],
+            sampler_type=self.sampler_types[rows],
+            **kwargs,
+        )
+
+    def borehole(
+        self,
+        borehole_id: str,
+        corrected_spt_n_values: Sequence[float],
+    ) -> Borehole:
+        """Return the [Borehole][geolysis.borehole.Borehole] of
+        `borehole_id` for N-design calculations.
+
+        :param borehole_id: Id of the borehole.
+        :param corrected_spt_n_values: Corrected SPT N-values of the
+                                       readings of the borehole, e.g.
+                                       from
+                                       [correct][geolysis.borehole.SPTDataset.correct].
+        """
+        rows = self.rows(borehole_id)
+        return Borehole(
+            self.depths[rows], corrected_spt_n_values, borehole_id=borehole_id
+        )
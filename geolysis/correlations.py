@@ -0,0 +1,177 @@
+import enum
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Annotated, Final, Sequence
+
+from func_validator import MustBeMemberOf, MustHaveValuesBetween, validate_params
+
+from .utils import AbstractStrEnum, sqrt
+
+__all__ = [
+    "FrictionAngleMethod",
+    "SPTCorrelations",
+    "friction_angles",
+    "relative_densities",
+    "moist_unit_wgts",
+    "correlate_spt_n_values",
+]
+
+
+class FrictionAngleMethod(AbstractStrEnum):
+    """Enumeration of SPT N-value to friction angle correlations."""
+
+    PECK_HANSON_THORNBURN = enum.auto()
+    """Peck, Hanson and Thornburn (1974), as fitted by Wolff (1989)."""
+
+    HATANAKA_UCHIDA = enum.auto()
+    """Hatanaka and Uchida (1996)."""
+
+
+# Typical moist unit weights of granular soils (Bowles, 1997), taken at
+# the middle of the N-value range of each relative density class, i.e.
+# very loose, loose, medium, dense and very dense.
+_UNIT_WGT_N_VALUES: Final = (2.0, 7.0, 20.0, 40.0, 60.0)
+_UNIT_WGTS: Final = (13.5, 16.0, 18.5, 19.5, 21.5)
+
+_CorrectedSPTNValues = Annotated[
+    Sequence[float], MustHaveValuesBetween(min_value=0.0, max_value=100.0)
+]
+
+
+def _peck_hanson_thornburn(n: float) -> float:
+    return 27.1 + 0.3 * n - 0.00054 * n**2
+
+
+def _hatanaka_uchida(n: float) -> float:
+    return sqrt(20.0 * n) + 20.0
+
+
+_friction_angle_funcs: Final = {
+    FrictionAngleMethod.PECK_HANSON_THORNBURN: _peck_hanson_thornburn,
+    FrictionAngleMethod.HATANAKA_UCHIDA: _hatanaka_uchida,
+}
+
+
+def _moist_unit_wgt(n: float) -> float:
+    if n <= _UNIT_WGT_N_VALUES[0]:
+        return _UNIT_WGTS[0]
+    if n >= _UNIT_WGT_N_VALUES[-1]:
+        return _UNIT_WGTS[-1]
+    i = bisect_right(_UNIT_WGT_N_VALUES, n)
+    n0, n1 = _UNIT_WGT_N_VALUES[i - 1], _UNIT_WGT_N_VALUES[i]
+    g0, g1 = _UNIT_WGTS[i - 1], _UNIT_WGTS[i]
+    return g0 + (g1 - g0) * (n - n0) / (n1 - n0)
+
+
+@validate_params
+def friction_angles(
+    corrected_spt_n_values: _CorrectedSPTNValues,
+    method: Annotated[
+        FrictionAngleMethod | str, MustBeMemberOf(FrictionAngleMethod)
+    ] = "peck_hanson_thornburn",
+) -> array:
+    r"""Return the internal angle of friction (degrees) of granular soils
+    from their corrected SPT N-values.
+
+    Peck, Hanson and Thornburn (1974), as fitted by Wolff (1989):
+
+    $$
+    \phi = 27.1 + 0.3(N_1)_{60} - 0.00054(N_1)_{60}^2
+    $$
+
+    Hatanaka and Uchida (1996):
+
+    $$
+    \phi = \sqrt{20(N_1)_{60}} + 20
+    $$
+
+    !!! info "Added in v0.25.0"
+
+    :param corrected_spt_n_values: Corrected SPT N-values.
+    :param method: Friction angle correlation.
+    """
+    func = _friction_angle_funcs[FrictionAngleMethod(method)]
+    return array("d", (round(func(n), 1) for n in corrected_spt_n_values))
+
+
+@validate_params
+def relative_densities(corrected_spt_n_values: _CorrectedSPTNValues) -> array:
+    r"""Return the relative density (%) of granular soils from their
+    corrected SPT N-values, after Skempton (1986).
+
+    $$
+    D_r = 100 \sqrt{\dfrac{(N_1)_{60}}{60}} \le 100
+    $$
+
+    !!! info "Added in v0.25.0"
+
+    :param corrected_spt_n_values: Corrected SPT N-values.
+    """
+    return array(
+        "d",
+        (round(min(100.0 * sqrt(n / 60.0), 100.0), 1) for n in corrected_spt_n_values),
+    )
+
+
+@validate_params
+def moist_unit_wgts(corrected_spt_n_values: _CorrectedSPTNValues) -> array:
+    r"""Return the moist unit weight ($kN/m^3$) of granular soils from
+    their corrected SPT N-values.
+
+    The unit weight is interpolated linearly between the typical values
+    of very loose (13.5), loose (16.0), medium (18.5), dense (19.5) and
+    very dense (21.5) granular soils given by Bowles (1997), taken at
+    N-values of 2, 7, 20, 40 and 60 respectively. N-values outside this
+    range get the unit weight of the nearest class.
+
+    !!! info "Added in v0.25.0"
+
+    :param corrected_spt_n_values: Corrected SPT N-values.
+    """
+    return array(
+        "d", (round(_moist_unit_wgt(n), 1) for n in corrected_spt_n_values)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class SPTCorrelations:
+    """Soil parameters correlated from corrected SPT N-values.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    friction_angles: array
+    """Internal angle of friction of each reading (degrees)."""
+
+    relative_densities: array
+    """Relative density of each reading (%)."""
+
+    moist_unit_wgts: array
+    """Moist unit weight of each reading ($kN/m^3$)."""
+
+
+def correlate_spt_n_values(
+    corrected_spt_n_values: Sequence[float],
+    friction_angle_method: FrictionAngleMethod | str = "peck_hanson_thornburn",
+) -> SPTCorrelations:
+    """Return the friction angle, relative density and moist unit weight
+    of granular soils from their corrected SPT N-values.
+
+    See [friction_angles][geolysis.correlations.friction_angles],
+    [relative_densities][geolysis.correlations.relative_densities] and
+    [moist_unit_wgts][geolysis.correlations.moist_unit_wgts].
+
+    !!! info "Added in v0.25.0"
+
+    :param corrected_spt_n_values: Corrected SPT N-values, e.g.
+                                   `SPTCorrectionResult.corrected_spt_n_values`.
+    :param friction_angle_method: Friction angle correlation.
+    """
+    return SPTCorrelations(
+        friction_angles=friction_angles(
+            corrected_spt_n_values, method=friction_angle_method
+        ),
+        relative_densities=relative_densities(corrected_spt_n_values),
+        moist_unit_wgts=moist_unit_wgts(corrected_spt_n_values),
+    )
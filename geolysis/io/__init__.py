@@ -0,0 +1,38 @@
+from ._ags4 import AGS4Chunk, read_ags4
+from ._archive import (
+    ColumnArchive,
+    open_archive,
+    open_spt_archive,
+    write_archive,
+    write_spt_archive,
+)
+from ._lab_pipeline import (
+    ClassificationIndex,
+    ClassificationStats,
+    LabColumns,
+    classify_lab_csv,
+)
+from ._spt_pipeline import (
+    SPTColumns,
+    StreamStats,
+    correct_spt_csv,
+    correct_spt_records,
+)
+
+__all__ = [
+    "AGS4Chunk",
+    "read_ags4",
+    "ColumnArchive",
+    "write_archive",
+    "open_archive",
+    "write_spt_archive",
+    "open_spt_archive",
+    "SPTColumns",
+    "StreamStats",
+    "correct_spt_records",
+    "correct_spt_csv",
+    "LabColumns",
+    "ClassificationStats",
+    "ClassificationIndex",
+    "classify_lab_csv",
+]
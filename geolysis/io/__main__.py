@@ -0,0 +1,5 @@
+import sys
+
+from ._lab_pipeline import _main
+
+sys.exit(_main())
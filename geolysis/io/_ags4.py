@@ -0,0 +1,159 @@
+import csv
+import re
+from array import array
+from dataclasses import dataclass
+from typing import IO, Iterator, Sequence
+
+from geolysis.utils import nan
+
+__all__ = ["AGS4Chunk", "read_ags4"]
+
+# AGS4 data types holding numbers, e.g. 2DP, 3SF, 2SCI, MC and U.
+_NUMERIC_TYPE = re.compile(r"\d+(DP|SF|SCI)|MC|U")
+
+
+@dataclass(frozen=True, slots=True)
+class AGS4Chunk:
+    """Consecutive rows of an AGS4 group stored as typed columns.
+
+    Numeric headings are stored as `array('d')` columns, with missing
+    values set to `nan`; all other headings are stored as lists of
+    strings.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    group: str
+    """Name of the AGS4 group, e.g. `ISPT`."""
+
+    units: dict[str, str]
+    """Unit of each heading."""
+
+    columns: dict[str, array | list[str]]
+    """Values of each heading."""
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, heading: str) -> array | list[str]:
+        return self.columns[heading]
+
+
+def _to_float(value: str, heading: str, line_num: int) -> float:
+    if not value:
+        return nan
+    try:
+        return float(value)
+    except ValueError:
+        msg = f"Line {line_num}: {heading} must be numeric, got {value!r}."
+        raise ValueError(msg) from None
+
+
+def _make_chunk(
+    group: str,
+    headings: list[str],
+    units: list[str],
+    types: list[str],
+    rows: list[tuple[int, list[str]]],
+) -> AGS4Chunk:
+    columns = {}
+    for i, (heading, type_) in enumerate(zip(headings, types)):
+        if _NUMERIC_TYPE.fullmatch(type_):
+            columns[heading] = array(
+                "d", (_to_float(row[i], heading, num) for num, row in rows)
+            )
+        else:
+            columns[heading] = [row[i] for _, row in rows]
+
+    return AGS4Chunk(
+        group=group,
+        units=dict(zip(headings, units or [""] * len(headings))),
+        columns=columns,
+    )
+
+
+def read_ags4(
+    file: IO[str],
+    groups: Sequence[str] = ("ISPT", "LLPL", "GRAD"),
+    *,
+    chunk_size: int = 4096,
+) -> Iterator[AGS4Chunk]:
+    """Read the data of an AGS4 ground investigation file as chunks of
+    typed columns.
+
+    The file is read lazily in a single pass and at most `chunk_size`
+    rows are held in memory at a time, so large deliveries can be
+    processed with bounded memory. Groups not in `groups` are skipped
+    without being parsed.
+
+    The default groups are `ISPT` (standard penetration test), `LLPL`
+    (Atterberg limits) and `GRAD` (particle size distribution).
+
+    !!! info "Added in v0.25.0"
+
+    :param file: Text file the AGS4 data is read from.
+    :param groups: Names of the groups to read.
+    :param chunk_size: Maximum number of rows in each chunk.
+
+    :raises ValueError: Raised when `chunk_size` is not positive, or a
+                        `DATA` row appears before the `HEADING` and
+                        `TYPE` rows of its group, has a different number
+                        of values than the headings, or has a
+                        non-numeric value in a numeric heading.
+    """
+    # Checked here rather than in the generator, so that a bad chunk
+    # size is reported on the call rather than on the first read.
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    return _read_ags4(file, groups, chunk_size)
+
+
+def _read_ags4(
+    file: IO[str], groups: Sequence[str], chunk_size: int
+) -> Iterator[AGS4Chunk]:
+    wanted = set(groups)
+    group = None
+    headings: list[str] = []
+    units: list[str] = []
+    types: list[str] = []
+    rows: list[tuple[int, list[str]]] = []
+
+    reader = csv.reader(file)
+    for row in reader:
+        if not row:
+            continue
+
+        descriptor, values = row[0], row[1:]
+
+        if descriptor == "GROUP":
+            if rows:
+                yield _make_chunk(group, headings, units, types, rows)
+                rows = []
+            group = values[0]
+            headings, units, types = [], [], []
+        elif group not in wanted:
+            continue
+        elif descriptor == "HEADING":
+            headings = values
+        elif descriptor == "UNIT":
+            units = values
+        elif descriptor == "TYPE":
+            types = values
+        elif descriptor == "DATA":
+            if not headings or not types:
+                msg = f"Line {reader.line_num}: DATA row before HEADING and TYPE rows."
+                raise ValueError(msg)
+            if len(values) != len(headings):
+                msg = (
+                    f"Line {reader.line_num}: expected {len(headings)} values, "
+                    f"got {len(values)}."
+                )
+                raise ValueError(msg)
+
+            rows.append((reader.line_num, values))
+            if len(rows) == chunk_size:
+                yield _make_chunk(group, headings, units, types, rows)
+                rows = []
+
+    if rows:
+        yield _make_chunk(group, headings, units, types, rows)
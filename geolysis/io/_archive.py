@@ -0,0 +1,262 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import IO, Mapping, Optional, Sequence
+
+from geolysis.borehole import SPTDataset
+
+__all__ = [
+    "ColumnArchive",
+    "write_archive",
+    "open_archive",
+    "write_spt_archive",
+    "open_spt_archive",
+]
+
+_MAGIC = b"GEOLYSIS"
+_VERSION = 1
+_ALIGNMENT = 8
+
+# magic, format version, header length
+_PREAMBLE = struct.Struct("<8sII")
+
+_SPT_COLUMNS = (
+    "depths",
+    "recorded_spt_n_values",
+    "rod_lengths",
+    "borehole_diameters",
+    "hammer_codes",
+    "sampler_codes",
+)
+
+
+def _padding(offset: int) -> int:
+    return -offset % _ALIGNMENT
+
+
+def write_archive(
+    file: IO[bytes],
+    columns: Mapping[str, array],
+    group_ids: Sequence[str] = (),
+    group_offsets: Optional[array] = None,
+    kind: str = "columns",
+) -> None:
+    """Write fixed-width columns to a binary archive.
+
+    The archive is made up of a JSON header describing the columns,
+    followed by the raw bytes of each column aligned to 8 bytes. Rows
+    can optionally be grouped (e.g. by borehole), with the rows of group
+    `k` being `group_offsets[k]:group_offsets[k + 1]`.
+
+    The size of `array` typecodes such as `"l"` and `"L"` differs between
+    platforms, so archives meant to be shared should use fixed-width
+    typecodes (`"B"`, `"I"`, `"Q"`, `"f"`, `"d"`, ...).
+
+    !!! info "Added in v0.25.0"
+
+    :param file: Binary file the archive is written to.
+    :param columns: Columns of the archive. All columns must have the
+                    same length.
+    :param group_ids: Id of each group of rows.
+    :param group_offsets: Row offsets of the groups, with one more entry
+                          than `group_ids`.
+    :param kind: Kind of data held in the archive.
+
+    :raises ValueError: Raised when the columns have different lengths.
+    """
+    n_rows = len(next(iter(columns.values()), ()))
+    if any(len(column) != n_rows for column in columns.values()):
+        raise ValueError("All columns must have the same length.")
+
+    if group_offsets is None:
+        group_offsets = array("Q", [0, n_rows])
+        group_ids = group_ids or ("",)
+
+    columns = {**columns, "_group_offsets": group_offsets}
+
+    # Offsets are relative to the start of the data section.
+    header_columns, offset = [], 0
+    for name, column in columns.items():
+        header_columns.append(
+            {
+                "name": name,
+                "typecode": column.typecode,
+                "itemsize": column.itemsize,
+                "offset": offset,
+                "length": len(column),
+            }
+        )
+        offset += column.itemsize * len(column)
+        offset += _padding(offset)
+
+    header = json.dumps(
+        {
+            "kind": kind,
+            "byteorder": sys.byteorder,
+            "rows": n_rows,
+            "group_ids": list(group_ids),
+            "columns": header_columns,
+        }
+    ).encode()
+    header += b" " * _padding(_PREAMBLE.size + len(header))
+
+    file.write(_PREAMBLE.pack(_MAGIC, _VERSION, len(header)))
+    file.write(header)
+    for column in columns.values():
+        data = column.tobytes()
+        file.write(data)
+        file.write(b"\0" * _padding(len(data)))
+
+
+class ColumnArchive:
+    """Binary column archive opened with `mmap`.
+
+    Columns are exposed as `memoryview` objects over the mapped file, so
+    opening an archive does not read the columns into memory; only the
+    pages of the rows actually accessed are loaded.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Path of the archive.
+
+        :raises ValueError: Raised when the file is not a geolysis
+                            archive or was written on a machine with a
+                            different byte order or item sizes.
+        """
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        buffer = memoryview(self._mmap)
+        magic, version, header_len = _PREAMBLE.unpack_from(
+            bytes(buffer[: _PREAMBLE.size]).ljust(_PREAMBLE.size, b"\0")
+        )
+        if magic != _MAGIC or version != _VERSION:
+            buffer.release()
+            self._mmap.close()
+            raise ValueError(f"{path} is not a geolysis archive.")
+
+        header_end = _PREAMBLE.size + header_len
+        header = json.loads(bytes(buffer[_PREAMBLE.size : header_end]))
+        if header["byteorder"] != sys.byteorder:
+            buffer.release()
+            self._mmap.close()
+            raise ValueError(f"{path} was written with a different byte order.")
+
+        self.kind: str = header["kind"]
+        self.group_ids: tuple[str, ...] = tuple(header["group_ids"])
+
+        for col in header["columns"]:
+            itemsize = array(col["typecode"]).itemsize
+            if itemsize != col["itemsize"]:
+                buffer.release()
+                self._mmap.close()
+                msg = (
+                    f"{path}: column {col['name']} was written with "
+                    f"{col['itemsize']}-byte items, but typecode "
+                    f"{col['typecode']!r} is {itemsize} bytes here."
+                )
+                raise ValueError(msg)
+
+        self._columns = {}
+        for col in header["columns"]:
+            start = header_end + col["offset"]
+            view = buffer[start : start + col["itemsize"] * col["length"]]
+            self._columns[col["name"]] = view.cast(col["typecode"])
+
+        self.group_offsets = self._columns.pop("_group_offsets")
+
+    def __enter__(self) -> "ColumnArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __getitem__(self, name: str) -> memoryview:
+        return self._columns[name]
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """Names of the columns in the archive."""
+        return tuple(self._columns)
+
+    def close(self) -> None:
+        """Release the column views and unmap the file.
+
+        The views returned by the archive are released and must not be
+        used afterwards. Slices or casts of them made before closing
+        share the mapping and stay valid: the file is then only unmapped
+        once the last of them is released or garbage collected.
+        """
+        for view in self._columns.values():
+            view.release()
+        self.group_offsets.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # The remaining views hold a reference to the mapping, which
+            # is unmapped when they are gone.
+            pass
+
+
+def open_archive(path: str) -> ColumnArchive:
+    """Open a binary column archive written by
+    [write_archive][geolysis.io.write_archive].
+
+    !!! info "Added in v0.25.0"
+
+    :param path: Path of the archive.
+    """
+    return ColumnArchive(path)
+
+
+def write_spt_archive(file: IO[bytes], dataset: SPTDataset) -> None:
+    """Write an [SPTDataset][geolysis.borehole.SPTDataset] to a binary
+    archive.
+
+    !!! info "Added in v0.25.0"
+
+    :param file: Binary file the archive is written to.
+    :param dataset: Dataset to write.
+    """
+    columns = {name: getattr(dataset, f"_{name}") for name in _SPT_COLUMNS}
+    write_archive(
+        file,
+        columns,
+        group_ids=dataset.borehole_ids,
+        group_offsets=dataset._offsets,
+        kind="spt",
+    )
+
+
+def open_spt_archive(path: str) -> SPTDataset:
+    """Open an archive written by
+    [write_spt_archive][geolysis.io.write_spt_archive] as an
+    [SPTDataset][geolysis.borehole.SPTDataset].
+
+    The columns of the dataset are views over the mapped file, so any
+    borehole can be accessed without loading the rest of the file. The
+    file stays mapped as long as the dataset is referenced.
+
+    !!! info "Added in v0.25.0"
+
+    :param path: Path of the archive.
+
+    :raises ValueError: Raised when the archive does not hold SPT data.
+    """
+    archive = ColumnArchive(path)
+    if archive.kind != "spt":
+        archive.close()
+        raise ValueError(f"{path} does not hold SPT data.")
+
+    # The dataset keeps the mapping alive for as long as it is in use.
+    return SPTDataset._from_columns(
+        archive.group_ids,
+        archive.group_offsets,
+        **{name: archive[name] for name in _SPT_COLUMNS},
+        owner=archive,
+    )
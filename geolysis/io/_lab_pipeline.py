@@ -0,0 +1,432 @@
+import argparse
+import csv
+import io
+import itertools
+import os
+import sys
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from hashlib import blake2b
+from typing import IO, Callable, Iterator, Optional, Self, Sequence
+
+from func_validator import ValidationError
+
+from geolysis.parallel import _imap
+from geolysis.soil_classifier import (
+    AASHTO_RESULTS,
+    USCS_RESULTS,
+    classify_aashto,
+    classify_uscs,
+)
+from geolysis.utils import nan
+
+from ._archive import open_archive, write_archive
+
+__all__ = [
+    "LabColumns",
+    "ClassificationStats",
+    "ClassificationIndex",
+    "classify_lab_csv",
+]
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "y", "t"})
+
+
+@dataclass(frozen=True, slots=True)
+class LabColumns:
+    """Names of the columns holding the laboratory results of soil
+    samples.
+
+    Only `liquid_limit`, `plastic_limit`, `fines` and `sand` are
+    required. When a particle size column is missing, or a cell is
+    empty, the particle size is treated as missing. When the `organic`
+    column is missing, samples are treated as inorganic.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    liquid_limit: str = "liquid_limit"
+    plastic_limit: str = "plastic_limit"
+    fines: str = "fines"
+    sand: str = "sand"
+    d_10: str = "d_10"
+    d_30: str = "d_30"
+    d_60: str = "d_60"
+    organic: str = "organic"
+    uscs_symbol: str = "uscs"
+    """Name of the output column holding the USCS symbol."""
+    aashto_symbol: str = "aashto"
+    """Name of the output column holding the AASHTO symbol."""
+
+
+@dataclass(frozen=True, slots=True)
+class ClassificationStats:
+    """Throughput statistics of a streaming classification.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    rows: int
+    chunks: int
+    elapsed: float
+    """Wall-clock time taken (s)."""
+    reused: int = 0
+    """Number of rows whose classification was reused from a
+    [ClassificationIndex][geolysis.io.ClassificationIndex]."""
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0.0 else 0.0
+
+
+_INDEX_KIND = "classification_index"
+
+
+class ClassificationIndex:
+    """Classifications of soil samples keyed by a hash of their inputs,
+    for incremental reclassification of laboratory results with
+    [classify_lab_csv][geolysis.io.classify_lab_csv].
+
+    The hashes are salted with the version of `geolysis`, so that
+    samples are classified again after an update of the classifiers.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    def __init__(self):
+        from geolysis import __version__
+
+        self._salt = f"geolysis {__version__}".encode()
+        self._results: dict[int, tuple[int, int]] = {}
+        self._used: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    @classmethod
+    def load(cls, path: str) -> Self:
+        """Load an index saved with `save`, or return an empty index when
+        `path` does not exist.
+
+        :raises ValueError: Raised when `path` is not a classification
+                            index.
+        """
+        index = cls()
+        if not os.path.exists(path):
+            return index
+
+        with open_archive(path) as archive:
+            if archive.kind != _INDEX_KIND:
+                raise ValueError(f"{path} is not a classification index.")
+            index._results = dict(
+                zip(
+                    archive["hashes"],
+                    zip(archive["uscs_codes"], archive["aashto_codes"]),
+                )
+            )
+        return index
+
+    def save(self, path: str, *, prune: bool = False) -> None:
+        """Save the index to `path`, replacing it atomically.
+
+        :param path: Path of the index file.
+        :param prune: Only save the classifications looked up or added
+                      since the index was loaded, e.g. to drop the
+                      samples deleted from a database that is
+                      reclassified as a whole.
+        """
+        keys = [k for k in self._results if not prune or k in self._used]
+        uscs_codes, aashto_codes = array("B"), array("B")
+        for key in keys:
+            uscs_code, aashto_code = self._results[key]
+            uscs_codes.append(uscs_code)
+            aashto_codes.append(aashto_code)
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as file:
+            write_archive(
+                file,
+                {
+                    "hashes": array("Q", keys),
+                    "uscs_codes": uscs_codes,
+                    "aashto_codes": aashto_codes,
+                },
+                kind=_INDEX_KIND,
+            )
+        os.replace(tmp_path, path)
+
+    def _key(self, row: list, indices: Sequence[Optional[int]]) -> int:
+        cells = (row[i].strip() if i is not None else "" for i in indices)
+        digest = blake2b(self._salt, digest_size=8)
+        digest.update("\x1f".join(cells).encode())
+        return int.from_bytes(digest.digest(), "little")
+
+    def _get(self, key: int) -> Optional[tuple[int, int]]:
+        codes = self._results.get(key)
+        if codes is not None:
+            self._used.add(key)
+        return codes
+
+    def _add(self, key: int, codes: tuple[int, int]) -> None:
+        self._results[key] = codes
+        self._used.add(key)
+
+
+def _float_column(rows: list, idx: Optional[int]) -> list:
+    if idx is None:
+        return [nan] * len(rows)
+    return [float(value) if value else nan for value in (r[idx] for r in rows)]
+
+
+def _classify_rows(rows: list, indices: tuple) -> list[tuple[int, int]]:
+    """Return the USCS and AASHTO result codes of each row."""
+    ll, pl, fines, sand, d_10, d_30, d_60, organic = indices
+    liquid_lmts = [float(r[ll]) for r in rows]
+    plastic_lmts = [float(r[pl]) for r in rows]
+    fines_col = [float(r[fines]) for r in rows]
+    uscs_res = classify_uscs(
+        liquid_lmts,
+        plastic_lmts,
+        fines_col,
+        [float(r[sand]) for r in rows],
+        d_10=_float_column(rows, d_10),
+        d_30=_float_column(rows, d_30),
+        d_60=_float_column(rows, d_60),
+        organic=(
+            False
+            if organic is None
+            else [r[organic].strip().casefold() in _TRUE_VALUES for r in rows]
+        ),
+    )
+    aashto_res = classify_aashto(liquid_lmts, plastic_lmts, fines_col)
+    return list(zip(uscs_res.codes, aashto_res.codes))
+
+
+def _classify_chunk(task) -> tuple[int, str, list[tuple[int, int]]]:
+    """Classify a chunk of CSV rows and return the number of rows, the
+    chunk as CSV text with the symbols appended and the result codes of
+    the rows that were classified.
+
+    Rows with known result codes are not classified again.
+    """
+    first_row, rows, indices, known = task
+    if known is None:
+        known = itertools.repeat(None)
+        unknown_rows = rows
+    else:
+        unknown_rows = [row for row, codes in zip(rows, known) if codes is None]
+
+    try:
+        new_codes = _classify_rows(unknown_rows, indices) if unknown_rows else []
+    except (ValidationError, ValueError) as e:
+        msg = f"Chunk starting at row {first_row}: {e}"
+        raise type(e)(msg) from e
+
+    codes_iter = iter(new_codes)
+    for row, codes in zip(rows, known):
+        uscs_code, aashto_code = codes if codes is not None else next(codes_iter)
+        row.append(USCS_RESULTS[uscs_code].symbol)
+        row.append(AASHTO_RESULTS[aashto_code].symbol)
+
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return len(rows), buffer.getvalue(), new_codes
+
+
+def classify_lab_csv(
+    src: IO[str],
+    dst: IO[str],
+    *,
+    columns: LabColumns = LabColumns(),
+    chunk_size: int = 4096,
+    max_workers: Optional[int] = None,
+    index: Optional[ClassificationIndex] = None,
+    progress: Optional[Callable[[ClassificationStats], None]] = None,
+) -> ClassificationStats:
+    """Classify the soil samples of a CSV file of laboratory results with
+    the USCS and AASHTO classification systems.
+
+    The file is read lazily in chunks of `chunk_size` rows, which are
+    classified in a pool of processes with
+    [classify_uscs][geolysis.soil_classifier.classify_uscs] and
+    [classify_aashto][geolysis.soil_classifier.classify_aashto]. The
+    classified rows are written to `dst` in their input order as soon
+    as their chunk and the chunks before it are done, with the USCS and
+    AASHTO symbols appended as extra columns. Only a few chunks per
+    worker are held in memory at any time.
+
+    With an `index`, only the samples whose inputs are not in the index,
+    i.e. new or changed samples, are classified. The other samples reuse
+    their classification from the index, and the new classifications
+    are added to it.
+
+    The classification can also be run from the command line:
+
+    ```shell
+    python -m geolysis.io classify-lab results.csv classified.csv \\
+        --index results.idx
+    ```
+
+    !!! info "Added in v0.25.0"
+
+    :param src: Text file the laboratory results are read from.
+    :param dst: Text file the classified results are written to.
+    :param columns: Names of the input and output columns.
+    :param chunk_size: Number of rows sent to a process at a time.
+    :param max_workers: Number of processes. Defaults to the number of
+                        CPUs. With a single worker, the file is
+                        classified in the current process.
+    :param index: Classifications of previous runs to reuse.
+    :param progress: Called with the statistics so far after each chunk
+                     is written.
+
+    :raises ValueError: Raised when a required column is missing, a row
+                        does not have one cell per column or
+                        `chunk_size` is not positive.
+    :raises ValidationError: Raised when a sample is invalid.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    start = time.perf_counter()
+    reader = csv.reader(src)
+    header = next(reader, None) or []
+    positions = {name: i for i, name in enumerate(header)}
+
+    required = (
+        columns.liquid_limit,
+        columns.plastic_limit,
+        columns.fines,
+        columns.sand,
+    )
+    if missing := [name for name in required if name not in positions]:
+        raise ValueError(f"Missing columns: {', '.join(missing)}.")
+
+    indices = (
+        *(positions[name] for name in required),
+        *(
+            positions.get(name)
+            for name in (columns.d_10, columns.d_30, columns.d_60, columns.organic)
+        ),
+    )
+
+    writer = csv.writer(dst)
+    writer.writerow([*header, columns.uscs_symbol, columns.aashto_symbol])
+
+    # Hashes of the rows classified by each pending task, in task order.
+    pending_keys: deque[list[int]] = deque()
+
+    def tasks() -> Iterator[tuple]:
+        first_row = 1
+        while rows := list(itertools.islice(reader, chunk_size)):
+            # Symbols are appended to each row, so a row of the wrong
+            # length would also put them under the wrong columns.
+            for row_num, row in enumerate(rows, start=first_row):
+                if len(row) != len(header):
+                    msg = (
+                        f"Row {row_num}: expected {len(header)} cells, "
+                        f"got {len(row)}."
+                    )
+                    raise ValueError(msg)
+            known = None
+            if index is not None:
+                keys = [index._key(row, indices) for row in rows]
+                known = [index._get(key) for key in keys]
+                pending_keys.append(
+                    [key for key, codes in zip(keys, known) if codes is None]
+                )
+            yield first_row, rows, indices, known
+            first_row += len(rows)
+
+    def stats() -> ClassificationStats:
+        return ClassificationStats(
+            rows=rows,
+            chunks=chunks,
+            elapsed=time.perf_counter() - start,
+            reused=reused,
+        )
+
+    rows = chunks = reused = 0
+    for num_rows, text, new_codes in _imap(_classify_chunk, tasks(), max_workers):
+        dst.write(text)
+        if index is not None:
+            # Rows are counted as reused once written, as tasks are
+            # queued ahead of the rows being written.
+            keys = pending_keys.popleft()
+            for key, codes in zip(keys, new_codes):
+                index._add(key, codes)
+            reused += num_rows - len(keys)
+        rows += num_rows
+        chunks += 1
+        if progress is not None:
+            progress(stats())
+
+    return stats()
+
+
+def _main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m geolysis.io",
+        description="Streaming tools for large geotechnical data files.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    classify = commands.add_parser(
+        "classify-lab",
+        help="Classify a CSV file of laboratory results with USCS and AASHTO.",
+    )
+    classify.add_argument("src", help="CSV file of laboratory results.")
+    classify.add_argument("dst", help="CSV file the classified results are written to.")
+    classify.add_argument("--chunk-size", type=int, default=4096)
+    classify.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of processes, defaults to the number of CPUs.",
+    )
+    classify.add_argument(
+        "--index",
+        default=None,
+        help="Index file of previous classifications. Only new or changed "
+        "samples are classified, and the index is updated.",
+    )
+    classify.add_argument(
+        "--quiet", action="store_true", help="Do not report progress."
+    )
+
+    args = parser.parse_args(argv)
+    index = None if args.index is None else ClassificationIndex.load(args.index)
+
+    def report(stats: ClassificationStats):
+        print(
+            f"\r{stats.rows} rows, {stats.rows_per_second:,.0f} rows/s",
+            end="",
+            file=sys.stderr,
+        )
+
+    with (
+        open(args.src, newline="") as src,
+        open(args.dst, "w", newline="") as dst,
+    ):
+        stats = classify_lab_csv(
+            src,
+            dst,
+            chunk_size=args.chunk_size,
+            max_workers=args.workers,
+            index=index,
+            progress=None if args.quiet else report,
+        )
+
+    if index is not None:
+        # The whole file is reclassified, so samples not in it are gone.
+        index.save(args.index, prune=True)
+
+    if not args.quiet:
+        print(
+            f"\r{stats.rows} rows classified in {stats.elapsed:.2f}s "
+            f"({stats.rows_per_second:,.0f} rows/s, {stats.reused} reused)",
+            file=sys.stderr,
+        )
+    return 0
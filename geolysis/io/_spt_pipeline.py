@@ -0,0 +1,241 @@
+import csv
+import itertools
+import time
+from dataclasses import dataclass
+from typing import IO, Iterable, Iterator, Mapping, Optional
+
+from geolysis.foundation import Foundation
+from geolysis.soil_profile import SoilProfile
+from geolysis.spt import (
+    DilatancyCorrectionMethod,
+    HammerType,
+    OPCMethod,
+    SamplerType,
+    correct_spt_n_values,
+)
+
+__all__ = ["SPTColumns", "StreamStats", "correct_spt_records", "correct_spt_csv"]
+
+
+@dataclass(frozen=True, slots=True)
+class SPTColumns:
+    """Names of the columns holding the SPT inputs of a borehole log.
+
+    Only `recorded_spt_n_value` and either `eop` or `depth` (when a soil
+    profile is given) are required. When any of the other columns is
+    missing from a record, the default of
+    [correct_spt_n_value][geolysis.spt.correct_spt_n_value] is used and
+    all records are treated as belonging to the same borehole.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    borehole: str = "borehole"
+    depth: str = "depth"
+    recorded_spt_n_value: str = "spt_n"
+    eop: str = "eop"
+    rod_length: str = "rod_length"
+    borehole_diameter: str = "borehole_diameter"
+    hammer_type: str = "hammer_type"
+    sampler_type: str = "sampler_type"
+    std_spt_n_value: str = "std_spt_n"
+    """Name of the output column holding the standardized N-value."""
+    corrected_spt_n_value: str = "corrected_spt_n"
+    """Name of the output column holding the corrected N-value."""
+
+
+@dataclass(frozen=True, slots=True)
+class StreamStats:
+    """Throughput statistics of a streaming correction.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    rows: int
+    boreholes: int
+    elapsed: float
+    """Wall-clock time taken (s)."""
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0.0 else 0.0
+
+
+def _column(records: list, name: str, default, convert=float):
+    """Return the column `name` of `records`, or `default` when the
+    column is missing. Empty cells are also replaced by `default`.
+    """
+    if name not in records[0]:
+        return default
+    return [
+        convert(value) if value not in ("", None) else default
+        for value in (r[name] for r in records)
+    ]
+
+
+def _correct_chunk(
+    records: list,
+    columns: SPTColumns,
+    soil_profile: Optional[SoilProfile],
+    options: dict,
+) -> list:
+    if soil_profile is not None:
+        eop = soil_profile.eop([float(r[columns.depth]) for r in records])
+    else:
+        eop = [float(r[columns.eop]) for r in records]
+
+    result = correct_spt_n_values(
+        [int(float(r[columns.recorded_spt_n_value])) for r in records],
+        eop=eop,
+        rod_length=_column(records, columns.rod_length, 3.0),
+        borehole_diameter=_column(records, columns.borehole_diameter, 65.0),
+        hammer_type=_column(
+            records, columns.hammer_type, HammerType.DONUT_1, str.casefold
+        ),
+        sampler_type=_column(
+            records, columns.sampler_type, SamplerType.STANDARD, str.casefold
+        ),
+        **options,
+    )
+
+    std_col, corr_col = columns.std_spt_n_value, columns.corrected_spt_n_value
+    for record, std_n, corr_n in zip(
+        records, result.std_spt_n_values, result.corrected_spt_n_values
+    ):
+        record[std_col] = std_n
+        record[corr_col] = corr_n
+
+    return records
+
+
+def correct_spt_records(
+    records: Iterable[Mapping[str, str]],
+    *,
+    chunk_size: int = 4096,
+    columns: SPTColumns = SPTColumns(),
+    soil_profile: Optional[SoilProfile] = None,
+    energy_percentage: float = 0.6,
+    opc_method: OPCMethod | str = "gibbs",
+    dilatancy_corr_method: Optional[DilatancyCorrectionMethod] = None,
+    foundation_size: Optional[Foundation] = None,
+) -> Iterator[dict]:
+    """Lazily correct a stream of SPT records.
+
+    Records are grouped by borehole (records of a borehole are expected
+    to be contiguous, as in a borehole log export) and corrected in
+    chunks of at most `chunk_size` records with
+    [correct_spt_n_values][geolysis.spt.correct_spt_n_values], so memory
+    use is bounded by the chunk size rather than the number of records.
+
+    Each yielded record is a copy of the input record with the
+    standardized and corrected N-values added.
+
+    !!! info "Added in v0.25.0"
+
+    :param records: Iterable of records, e.g. a `csv.DictReader`.
+    :param chunk_size: Maximum number of records corrected at once.
+    :param columns: Names of the input and output columns.
+    :param soil_profile: Soil profile used to compute the effective
+                         overburden pressure from the depth of each
+                         record, instead of reading it from the `eop`
+                         column.
+    :param energy_percentage: Energy percentage reaching the tip of
+                              the sampler.
+    :param opc_method: Overburden pressure correction method.
+    :param dilatancy_corr_method: Dilatancy correction method.
+    :param foundation_size: Foundation size.
+
+    :raises ValueError: Raised when `chunk_size` is not positive.
+    """
+    # Checked before any record is read, as this returns a generator.
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    options = dict(
+        energy_percentage=energy_percentage,
+        opc_method=opc_method,
+        dilatancy_corr_method=dilatancy_corr_method,
+        foundation_size=foundation_size,
+    )
+    return _correct_records(records, chunk_size, columns, soil_profile, options)
+
+
+def _correct_records(
+    records: Iterable[Mapping[str, str]],
+    chunk_size: int,
+    columns: SPTColumns,
+    soil_profile: Optional[SoilProfile],
+    options: dict,
+) -> Iterator[dict]:
+    borehole_col = columns.borehole
+    for _, borehole_records in itertools.groupby(
+        records, key=lambda r: r.get(borehole_col)
+    ):
+        while chunk := [
+            dict(r) for r in itertools.islice(borehole_records, chunk_size)
+        ]:
+            yield from _correct_chunk(chunk, columns, soil_profile, options)
+
+
+def correct_spt_csv(
+    src: IO[str],
+    dst: IO[str],
+    *,
+    chunk_size: int = 4096,
+    columns: SPTColumns = SPTColumns(),
+    soil_profile: Optional[SoilProfile] = None,
+    energy_percentage: float = 0.6,
+    opc_method: OPCMethod | str = "gibbs",
+    dilatancy_corr_method: Optional[DilatancyCorrectionMethod] = None,
+    foundation_size: Optional[Foundation] = None,
+) -> StreamStats:
+    """Correct the SPT N-values of a CSV borehole log.
+
+    The CSV file is read lazily and corrected records are written to
+    `dst` as soon as their chunk is corrected, with the standardized and
+    corrected N-values appended as extra columns.
+
+    See [correct_spt_records][geolysis.io.correct_spt_records] for the
+    description of the parameters.
+
+    !!! info "Added in v0.25.0"
+
+    :param src: Text file the CSV borehole log is read from.
+    :param dst: Text file the corrected CSV borehole log is written to.
+
+    :raises ValueError: Raised when `chunk_size` is not positive.
+    """
+    start = time.perf_counter()
+    reader = csv.DictReader(src)
+    # Raises on an invalid chunk_size before the header is written.
+    corrected = correct_spt_records(
+        reader,
+        chunk_size=chunk_size,
+        columns=columns,
+        soil_profile=soil_profile,
+        energy_percentage=energy_percentage,
+        opc_method=opc_method,
+        dilatancy_corr_method=dilatancy_corr_method,
+        foundation_size=foundation_size,
+    )
+
+    fieldnames = list(reader.fieldnames or [])
+    fieldnames += [columns.std_spt_n_value, columns.corrected_spt_n_value]
+    writer = csv.DictWriter(dst, fieldnames=fieldnames)
+    writer.writeheader()
+
+    # Records of a borehole are contiguous, so a new borehole starts
+    # wherever the borehole column changes.
+    borehole_col = columns.borehole
+    rows = boreholes = 0
+    for _, records in itertools.groupby(
+        corrected, key=lambda r: r.get(borehole_col)
+    ):
+        for record in records:
+            writer.writerow(record)
+            rows += 1
+        boreholes += 1
+
+    return StreamStats(
+        rows=rows, boreholes=boreholes, elapsed=time.perf_counter() - start
+    )
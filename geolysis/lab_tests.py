@@ -0,0 +1,370 @@
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Final, Optional, Sequence
+
+from func_validator import ValidationError
+
+from .soil_classifier import PSD
+from .utils import broadcast, isnan, log10, nan
+
+__all__ = [
+    "SieveAnalysisResult",
+    "reduce_sieve_analyses",
+    "LiquidLimitResult",
+    "fit_liquid_limits",
+]
+
+# Opening (mm) of the No. 200 and No. 4 sieves, which separate fines,
+# sand and gravel.
+_NO_200_SIEVE: Final = 0.075
+_NO_4_SIEVE: Final = 4.75
+
+# The liquid limit is the moisture content at 25 blows of the cup.
+_LOG_LL_BLOWS: Final = log10(25.0)
+
+
+@dataclass(frozen=True, slots=True)
+class SieveAnalysisResult:
+    """Particle size distribution of a batch of soil samples reduced from
+    their sieve analyses.
+
+    `fines`, `sands`, `d_10`, `d_30` and `d_60` can be passed directly to
+    [classify_uscs][geolysis.soil_classifier.classify_uscs].
+
+    !!! info "Added in v0.25.0"
+    """
+
+    sieve_sizes: tuple[array, ...]
+    """Sieve openings of each sample in ascending order (mm)."""
+
+    percent_passing: tuple[array, ...]
+    """Percentage passing each sieve of `sieve_sizes` (%)."""
+
+    fines: array
+    """Percentage of fines of each sample (%), i.e. passing the No. 200
+    sieve (0.075mm)."""
+
+    sands: array
+    """Percentage of sand of each sample (%), i.e. passing the No. 4
+    sieve (4.75mm) and retained on the No. 200 sieve."""
+
+    d_10: array
+    """Diameter at which 10% of each sample by weight is finer (mm),
+    `nan` when not bracketed by the sieves."""
+
+    d_30: array
+    """Diameter at which 30% of each sample by weight is finer (mm),
+    `nan` when not bracketed by the sieves."""
+
+    d_60: array
+    """Diameter at which 60% of each sample by weight is finer (mm),
+    `nan` when not bracketed by the sieves."""
+
+    def __len__(self) -> int:
+        return len(self.fines)
+
+    def psd(self, i: int) -> PSD:
+        """Return the particle size distribution of sample `i`, with
+        missing particle sizes given as `None`.
+        """
+        d_10, d_30, d_60 = (
+            None if isnan(d[i]) else d[i]
+            for d in (self.d_10, self.d_30, self.d_60)
+        )
+        return PSD(
+            fines=self.fines[i],
+            sand=self.sands[i],
+            d_10=d_10,
+            d_30=d_30,
+            d_60=d_60,
+        )
+
+
+def _percent_passing_at(
+    size: float, sizes: array, log_sizes: array, passing: array
+) -> float:
+    # Log-linear interpolation of the percentage passing a sieve opening.
+    k = bisect_left(sizes, size)
+    if k == len(sizes):
+        # Everything passes sieves coarser than one retaining nothing.
+        return 100.0 if passing[-1] >= 100.0 else nan
+    if sizes[k] == size:
+        return passing[k]
+    if k == 0:
+        return nan
+    frac = (log10(size) - log_sizes[k - 1]) / (log_sizes[k] - log_sizes[k - 1])
+    return passing[k - 1] + frac * (passing[k] - passing[k - 1])
+
+
+def _diameter_at(
+    percent: float, sizes: array, log_sizes: array, passing: array
+) -> float:
+    # Log-linear interpolation of the sieve opening passed by `percent`
+    # of the sample. `passing` is non-decreasing as `sizes` ascend.
+    k = bisect_left(passing, percent)
+    if k == len(passing):
+        return nan
+    if passing[k] == percent:
+        return sizes[k]
+    if k == 0:
+        return nan
+    frac = (percent - passing[k - 1]) / (passing[k] - passing[k - 1])
+    return 10.0 ** (log_sizes[k - 1] + frac * (log_sizes[k] - log_sizes[k - 1]))
+
+
+def reduce_sieve_analyses(
+    sieve_sizes: Sequence[float] | Sequence[Sequence[float]],
+    retained_masses: Sequence[Sequence[float]],
+    pan_masses: float | Sequence[float] = 0.0,
+) -> SieveAnalysisResult:
+    r"""Reduce the sieve analyses of a batch of soil samples to their
+    fines and sand fractions and characteristic particle sizes.
+
+    The percentage passing each sieve is:
+
+    $$
+    P_j = 100 \dfrac{M - \sum_{k \le j} m_k}{M}
+    $$
+
+    where $m_k$ are the masses retained on the sieves from the coarsest
+    to sieve $j$ and $M$ is the total mass of the sample, including the
+    mass collected in the pan.
+
+    The percentage passing the No. 200 (0.075mm) and No. 4 (4.75mm)
+    sieves, and the diameters $D_{10}$, $D_{30}$ and $D_{60}$, are
+    interpolated linearly against the logarithm of the sieve openings.
+    Values outside the range of the sieves used are `nan`.
+
+    Samples can be ragged, i.e. have a different number of sieves, or
+    padded to the same number of sieves with `nan`, which is skipped.
+
+    !!! info "Added in v0.25.0"
+
+    :param sieve_sizes: Sieve openings (mm), either a single set shared
+                        by every sample or one set per sample, in any
+                        order.
+    :param retained_masses: Mass retained on each sieve of each sample.
+    :param pan_masses: Mass passing the finest sieve of each sample.
+
+    :raises ValidationError: Raised when a sample has a non-positive
+                             sieve opening, a negative mass or no mass.
+    :raises ValueError: Raised when a sample has no sieves or when its
+                        sieves and masses have different lengths.
+    """
+    size = len(retained_masses)
+    if size and sieve_sizes and not isinstance(sieve_sizes[0], Sequence):
+        sieve_sizes = (sieve_sizes,) * size
+    elif len(sieve_sizes) != size:
+        msg = "sieve_sizes must be shared or given for each sample."
+        raise ValueError(msg)
+    pan_masses = broadcast(pan_masses, size)
+
+    all_sizes, all_passing = [], []
+    fines, sands = array("d"), array("d")
+    d_10s, d_30s, d_60s = array("d"), array("d"), array("d")
+
+    for i in range(size):
+        sample_sizes, masses = sieve_sizes[i], retained_masses[i]
+        if len(sample_sizes) != len(masses):
+            msg = (
+                f"Sample {i}: sieve_sizes and retained_masses have different "
+                "lengths."
+            )
+            raise ValueError(msg)
+
+        # Coarsest sieve first, padding skipped.
+        sieves = sorted(
+            (
+                (sieve, mass)
+                for sieve, mass in zip(sample_sizes, masses)
+                if not (isnan(sieve) or isnan(mass))
+            ),
+            reverse=True,
+        )
+        if not sieves:
+            raise ValueError(f"Sample {i} has no sieves.")
+
+        pan_mass = pan_masses[i]
+        if not sieves[-1][0] > 0.0:
+            msg = f"Sample {i}: sieve openings must be positive"
+            raise ValidationError(msg)
+        if not (pan_mass >= 0.0 and all(mass >= 0.0 for _, mass in sieves)):
+            msg = f"Sample {i}: masses must be non-negative"
+            raise ValidationError(msg)
+
+        total_mass = sum(mass for _, mass in sieves) + pan_mass
+        if not total_mass > 0.0:
+            msg = f"Sample {i}: total mass must be positive"
+            raise ValidationError(msg)
+
+        passing = array("d")
+        passed_mass = total_mass
+        for _, mass in sieves:
+            passed_mass -= mass
+            passing.append(max(100.0 * passed_mass / total_mass, 0.0))
+
+        # Ascending order for the interpolations.
+        sizes = array("d", (sieve for sieve, _ in reversed(sieves)))
+        passing.reverse()
+        log_sizes = array("d", map(log10, sizes))
+
+        fines_i = _percent_passing_at(_NO_200_SIEVE, sizes, log_sizes, passing)
+        passing_no_4 = _percent_passing_at(_NO_4_SIEVE, sizes, log_sizes, passing)
+        fines.append(fines_i)
+        sands.append(passing_no_4 - fines_i)
+        d_10s.append(_diameter_at(10.0, sizes, log_sizes, passing))
+        d_30s.append(_diameter_at(30.0, sizes, log_sizes, passing))
+        d_60s.append(_diameter_at(60.0, sizes, log_sizes, passing))
+
+        all_sizes.append(sizes)
+        all_passing.append(passing)
+
+    return SieveAnalysisResult(
+        sieve_sizes=tuple(all_sizes),
+        percent_passing=tuple(all_passing),
+        fines=fines,
+        sands=sands,
+        d_10=d_10s,
+        d_30=d_30s,
+        d_60=d_60s,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class LiquidLimitResult:
+    """Flow curves of a batch of Casagrande liquid limit tests.
+
+    `liquid_limits` and `plasticity_indices` can be passed directly to
+    [classify_uscs][geolysis.soil_classifier.classify_uscs] and
+    [classify_aashto][geolysis.soil_classifier.classify_aashto], with
+    the plastic limits.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    liquid_limits: array
+    """Liquid limit of each sample (%), i.e. the moisture content at 25
+    blows on its flow curve."""
+
+    flow_indices: array
+    """Flow index of each sample, i.e. the decrease in moisture content
+    (%) per log cycle of blows."""
+
+    r_squared: array
+    """Coefficient of determination of the flow curve of each sample,
+    `nan` when all its moisture contents are equal."""
+
+    plasticity_indices: Optional[array] = None
+    """Plasticity index of each sample (%), when the plastic limits are
+    given."""
+
+
+def fit_liquid_limits(
+    blow_counts: Sequence[Sequence[float]],
+    moisture_contents: Sequence[Sequence[float]],
+    plastic_limits: Optional[Sequence[float]] = None,
+) -> LiquidLimitResult:
+    r"""Fit the flow curves of a batch of multi-point Casagrande liquid
+    limit tests.
+
+    The flow curve of each sample is the least squares line through its
+    points:
+
+    $$
+    w = w_{25} - I_f \log_{10} \dfrac{N}{25}
+    $$
+
+    where $w$ is the moisture content at $N$ blows, $I_f$ the flow index
+    and $w_{25}$ the liquid limit. The fit is computed in closed form
+    from the sums of each sample.
+
+    Samples can be ragged, i.e. have a different number of points, or
+    padded to the same number of points with `nan`, which is skipped.
+
+    !!! info "Added in v0.25.0"
+
+    :param blow_counts: Number of blows of each point of each sample.
+    :param moisture_contents: Moisture content of each point of each
+                              sample (%).
+    :param plastic_limits: Plastic limit of each sample (%), to compute
+                           their plasticity index.
+
+    :raises ValidationError: Raised when a sample has a non-positive
+                             blow count, a negative moisture content,
+                             fewer than two different blow counts or a
+                             plastic limit greater than its liquid
+                             limit.
+    :raises ValueError: Raised when the blow counts and moisture contents
+                        of a sample have different lengths.
+    """
+    size = len(blow_counts)
+    if len(moisture_contents) != size:
+        msg = "blow_counts and moisture_contents must have the same length."
+        raise ValueError(msg)
+    if plastic_limits is not None and len(plastic_limits) != size:
+        msg = "plastic_limits must have one value per sample."
+        raise ValueError(msg)
+
+    liquid_limits, flow_indices, r_squared = array("d"), array("d"), array("d")
+
+    for i in range(size):
+        blows, moistures = blow_counts[i], moisture_contents[i]
+        if len(blows) != len(moistures):
+            msg = (
+                f"Sample {i}: blow_counts and moisture_contents have "
+                "different lengths."
+            )
+            raise ValueError(msg)
+
+        n = sum_x = sum_y = sum_xx = sum_xy = sum_yy = 0.0
+        for blow, moisture in zip(blows, moistures):
+            if isnan(blow) or isnan(moisture):
+                continue
+            if not (blow > 0.0 and moisture >= 0.0):
+                msg = (
+                    f"Sample {i}: blow counts must be positive and moisture "
+                    "contents non-negative"
+                )
+                raise ValidationError(msg)
+            # Centred on 25 blows, so the intercept is the liquid limit.
+            x = log10(blow) - _LOG_LL_BLOWS
+            n += 1.0
+            sum_x += x
+            sum_y += moisture
+            sum_xx += x * x
+            sum_xy += x * moisture
+            sum_yy += moisture * moisture
+
+        s_xx = sum_xx - sum_x * sum_x / n if n else 0.0
+        if not s_xx > 0.0:
+            msg = f"Sample {i}: at least two different blow counts are required"
+            raise ValidationError(msg)
+        s_xy = sum_xy - sum_x * sum_y / n
+        s_yy = sum_yy - sum_y * sum_y / n
+
+        slope = s_xy / s_xx
+        liquid_limits.append(round(sum_y / n - slope * sum_x / n, 2))
+        flow_indices.append(round(-slope, 2))
+        r_squared.append(s_xy * s_xy / (s_xx * s_yy) if s_yy > 0.0 else nan)
+
+    plasticity_indices = None
+    if plastic_limits is not None:
+        plasticity_indices = array("d")
+        for i, (liquid_lmt, plastic_lmt) in enumerate(
+            zip(liquid_limits, plastic_limits)
+        ):
+            if not 0.0 <= plastic_lmt <= liquid_lmt:
+                msg = (
+                    f"Sample {i}: plastic_limit {plastic_lmt} must be "
+                    f"non-negative and <= liquid_limit {liquid_lmt}"
+                )
+                raise ValidationError(msg)
+            plasticity_indices.append(round(liquid_lmt - plastic_lmt, 2))
+
+    return LiquidLimitResult(
+        liquid_limits=liquid_limits,
+        flow_indices=flow_indices,
+        r_squared=r_squared,
+        plasticity_indices=plasticity_indices,
+    )
@@ -0,0 +1,195 @@
+from array import array
+from dataclasses import dataclass
+from typing import Annotated, Sequence
+
+from func_validator import (
+    MustBePositive,
+    MustHaveValuesGreaterThan,
+    validate_params,
+)
+
+from .exceptions import ValidationError
+from .soil_profile import SoilProfile
+from .spt import correct_spt_n_values
+from .utils import broadcast, exp, inf
+
+__all__ = ["LiquefactionResult", "screen_liquefaction"]
+
+
+@dataclass(frozen=True, slots=True)
+class LiquefactionResult:
+    """Result of the liquefaction screening of a column of SPT readings.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    clean_sand_spt_n_values: array
+    r"""Clean sand equivalent corrected SPT N-value of each reading,
+    $(N_1)_{60cs}$."""
+
+    csr: array
+    """Cyclic stress ratio induced by the earthquake at each reading."""
+
+    crr: array
+    r"""Cyclic resistance ratio of each reading, scaled to the earthquake
+    magnitude. `inf` where $(N_1)_{60cs} \ge 30$ or above the
+    groundwater level."""
+
+    factor_of_safety: array
+    """Factor of safety against liquefaction of each reading."""
+
+
+def _stress_reduction_coef(depth: float) -> float:
+    # Liao & Whitman (1986), extended below 23 m as in Youd et al.
+    # (2001).
+    if depth <= 9.15:
+        return 1.0 - 0.00765 * depth
+    if depth <= 23.0:
+        return 1.174 - 0.0267 * depth
+    if depth <= 30.0:
+        return 0.744 - 0.008 * depth
+    return 0.5
+
+
+def _fines_correction(fines_content: float) -> tuple[float, float]:
+    if fines_content <= 5.0:
+        return 0.0, 1.0
+    if fines_content >= 35.0:
+        return 5.0, 1.2
+    alpha = exp(1.76 - 190.0 / fines_content**2)
+    beta = 0.99 + fines_content**1.5 / 1000.0
+    return alpha, beta
+
+
+@validate_params
+def screen_liquefaction(
+    recorded_spt_n_values: Sequence[int],
+    depths: Annotated[Sequence[float], MustHaveValuesGreaterThan(0.0)],
+    soil_profile: SoilProfile,
+    peak_ground_acceleration: Annotated[float, MustBePositive()],
+    magnitude: Annotated[float, MustBePositive()] = 7.5,
+    fines_contents: float | Sequence[float] = 0.0,
+    **kwargs,
+) -> LiquefactionResult:
+    r"""Screen SPT readings for liquefaction triggering with the
+    simplified procedure of Seed & Idriss (1971) as updated by Youd et
+    al. (2001).
+
+    The cyclic stress ratio induced by the earthquake is:
+
+    $$
+    CSR = 0.65 \dfrac{a_{max}}{g} \dfrac{\sigma_v}{\sigma'_v} r_d
+    $$
+
+    where the total and effective vertical stresses are obtained from
+    `soil_profile` and $r_d$ is the stress reduction coefficient of
+    Liao & Whitman (1986).
+
+    The recorded N-values are standardized with
+    [EnergyCorrection][geolysis.spt.EnergyCorrection] and corrected
+    for overburden pressure with
+    [LiaoWhitmanOPC][geolysis.spt.LiaoWhitmanOPC], then adjusted to
+    their clean sand equivalent for the fines content:
+
+    $$
+    (N_1)_{60cs} = \alpha + \beta (N_1)_{60}
+    $$
+
+    The cyclic resistance ratio for a magnitude 7.5 earthquake is:
+
+    $$
+    CRR_{7.5} = \dfrac{1}{34 - (N_1)_{60cs}} + \dfrac{(N_1)_{60cs}}{135}
+                + \dfrac{50}{[10 (N_1)_{60cs} + 45]^2} - \dfrac{1}{200}
+    $$
+
+    and is scaled to the earthquake magnitude by
+    $MSF = 10^{2.24} / M_w^{2.56}$. Readings with
+    $(N_1)_{60cs} \ge 30$ are considered too dense to liquefy, and
+    readings above the groundwater level of `soil_profile` are not
+    saturated and cannot liquefy; both have an infinite cyclic
+    resistance ratio and factor of safety.
+
+    $$
+    FS = \dfrac{CRR_{7.5} \cdot MSF}{CSR}
+    $$
+
+    !!! info "Added in v0.25.0"
+
+    :param recorded_spt_n_values: Recorded SPT N-values from field.
+    :param depths: Depth of each reading (m).
+    :param soil_profile: Soil profile the stresses are computed from.
+    :param peak_ground_acceleration: Peak horizontal ground acceleration
+                                     as a fraction of gravity,
+                                     $a_{max}/g$.
+    :param magnitude: Moment magnitude of the earthquake, $M_w$.
+    :param fines_contents: Fines content of each reading (%).
+    :param kwargs: Energy correction arguments of
+                   [correct_spt_n_values][geolysis.spt.correct_spt_n_values],
+                   e.g. `energy_percentage` or `rod_length`.
+
+    :raises ValidationError: Raised when a fines content is not between
+                             0 and 100.
+    :raises ValueError: Raised when `depths` or `fines_contents` do not
+                        have the same length as `recorded_spt_n_values`.
+    """
+    size = len(recorded_spt_n_values)
+    if len(depths) != size:
+        msg = "recorded_spt_n_values and depths must have the same length."
+        raise ValueError(msg)
+
+    fines_contents = broadcast(fines_contents, size)
+    total_stresses = soil_profile.total_stress(depths)
+    pore_pressures = soil_profile.pore_pressure(depths)
+    eops = array("d", map(float.__sub__, total_stresses, pore_pressures))
+
+    n1_60s = correct_spt_n_values(
+        recorded_spt_n_values, eop=eops, opc_method="liao", **kwargs
+    ).corrected_spt_n_values
+
+    msf = 10.0**2.24 / magnitude**2.56
+    ground_water_level = soil_profile.ground_water_level
+    fines_corrections = {}
+
+    n1_60_css = array("d", bytes(8 * size))
+    csrs = array("d", bytes(8 * size))
+    crrs = array("d", bytes(8 * size))
+    fos = array("d", bytes(8 * size))
+
+    for i in range(size):
+        fines = fines_contents[i]
+        if fines not in fines_corrections:
+            if not 0.0 <= fines <= 100.0:
+                msg = (
+                    f"Fines content {fines} at index {i} must be between "
+                    f"0 and 100."
+                )
+                raise ValidationError(msg)
+            fines_corrections[fines] = _fines_correction(fines)
+        alpha, beta = fines_corrections[fines]
+
+        n = alpha + beta * n1_60s[i]
+        csr = (
+            0.65
+            * peak_ground_acceleration
+            * (total_stresses[i] / eops[i])
+            * _stress_reduction_coef(depths[i])
+        )
+
+        if n < 30.0 and depths[i] >= ground_water_level:
+            crr = (
+                1.0 / (34.0 - n) + n / 135.0 + 50.0 / (10.0 * n + 45.0) ** 2 - 0.005
+            ) * msf
+        else:
+            crr = inf
+
+        n1_60_css[i] = round(n, 1)
+        csrs[i] = csr
+        crrs[i] = crr
+        fos[i] = round(crr / csr, 2)
+
+    return LiquefactionResult(
+        clean_sand_spt_n_values=n1_60_css,
+        csr=csrs,
+        crr=crrs,
+        factor_of_safety=fos,
+    )
@@ -0,0 +1,254 @@
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Annotated,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from func_validator import MustBeMemberOf, MustBePositive, validate_params
+
+from .borehole import SPTDataset
+from .exceptions import ValidationError
+from .soil_profile import SoilProfile
+from .spt import SPT, SPTDesignMethod
+from .utils import nan
+
+__all__ = ["BoreholeCorrectionResult", "correct_boreholes"]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Fewer rows per task than this and pickling dominates the work sent to
+# each process.
+_MIN_CHUNK_SIZE = 4096
+
+
+def _run(
+    func: Callable[[T], R],
+    tasks: Iterable[T],
+    max_workers: Optional[int],
+) -> Iterable[R]:
+    """Apply `func` to each task, in a process pool unless a single
+    worker is requested, and return the results in task order.
+    """
+    if max_workers == 1:
+        return map(func, tasks)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, tasks))
+
+
+def _imap(
+    func: Callable[[T], R],
+    tasks: Iterable[T],
+    max_workers: Optional[int],
+) -> Iterator[R]:
+    """Lazy version of `_run` for streams of tasks.
+
+    Tasks are only read from `tasks` as results are consumed, with at
+    most two tasks per worker in flight, so memory use is bounded
+    however many tasks there are.
+    """
+    if max_workers == 1:
+        yield from map(func, tasks)
+        return
+
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(func, task))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _take(column, lo: int, hi: int) -> array:
+    """Copy rows `lo:hi` of an array or memoryview column into an array,
+    which pickles as raw bytes.
+    """
+    view = memoryview(column)
+    taken = array(view.format)
+    taken.frombytes(view[lo:hi].cast("B"))
+    return taken
+
+
+@dataclass(frozen=True, slots=True)
+class BoreholeCorrectionResult:
+    """Corrected SPT N-values and N-design of a borehole.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    borehole_id: str
+    """Id of the borehole."""
+
+    std_spt_n_values: array
+    """SPT N-values standardized for field procedures, ordered by
+    depth."""
+
+    corrected_spt_n_values: array
+    """Corrected SPT N-values, ordered by depth."""
+
+    n_design: float
+    """SPT N-design of the corrected N-values, `nan` for boreholes with a
+    single reading or that could not be corrected."""
+
+    error: Optional[str] = None
+    """Why the borehole could not be corrected or its N-design computed,
+    `None` on success."""
+
+
+def _correct_chunk(task) -> list[BoreholeCorrectionResult]:
+    columns, eop, method, options = task
+    dataset = SPTDataset._from_columns(*columns)
+
+    # The whole chunk is corrected at once and then split by borehole.
+    # When a reading is invalid, the boreholes are corrected one at a
+    # time instead, so that only the boreholes at fault fail.
+    try:
+        res = dataset.correct(eop=eop, **options)
+    except (ValidationError, ValueError):
+        res = None
+
+    results = []
+    for borehole_id in dataset.borehole_ids:
+        rows = dataset.rows(borehole_id)
+        std = corrected = array("d")
+        n_design, error = nan, None
+        try:
+            if res is None:
+                bh_eop = eop if isinstance(eop, SoilProfile) else eop[rows]
+                bh_res = dataset.correct(rows, eop=bh_eop, **options)
+                std = bh_res.std_spt_n_values
+                corrected = bh_res.corrected_spt_n_values
+            else:
+                std = res.std_spt_n_values[rows]
+                corrected = res.corrected_spt_n_values[rows]
+            if len(corrected) > 1:
+                n_design = SPT(corrected, method).n_design()
+        except (ValidationError, ValueError) as e:
+            error = str(e)
+
+        results.append(
+            BoreholeCorrectionResult(
+                borehole_id=borehole_id,
+                std_spt_n_values=std,
+                corrected_spt_n_values=corrected,
+                n_design=n_design,
+                error=error,
+            )
+        )
+    return results
+
+
+def _partition(dataset: SPTDataset, chunk_size: int) -> Iterable[tuple[int, int]]:
+    """Split the boreholes into runs of consecutive boreholes holding at
+    least `chunk_size` readings each, except the last.
+    """
+    offsets = dataset._offsets
+    start = 0
+    for k in range(1, len(offsets)):
+        if offsets[k] - offsets[start] >= chunk_size or k == len(offsets) - 1:
+            yield start, k
+            start = k
+
+
+@validate_params
+def correct_boreholes(
+    dataset: SPTDataset,
+    *,
+    eop: Sequence[float] | SoilProfile,
+    method: Annotated[
+        SPTDesignMethod | str, MustBeMemberOf(SPTDesignMethod)
+    ] = "wgt",
+    max_workers: Annotated[Optional[int], MustBePositive()] = None,
+    chunk_size: Annotated[Optional[int], MustBePositive()] = None,
+    **kwargs,
+) -> list[BoreholeCorrectionResult]:
+    """Correct the SPT N-values and compute the N-design of every
+    borehole of a dataset in parallel.
+
+    Boreholes are independent, so the dataset is split into chunks of
+    whole boreholes which are corrected in separate processes with
+    [SPTDataset.correct][geolysis.borehole.SPTDataset.correct] and
+    [SPT.n_design][geolysis.spt.SPT.n_design]. Each chunk is sent to a
+    process as a few typed columns, and chunks are large enough to
+    amortise the cost of pickling them.
+
+    Errors are reported per borehole: a borehole whose readings cannot
+    be corrected, or whose corrected N-values are rejected by `SPT`
+    (e.g. a recorded N-value of 0), gets a result with `n_design` set
+    to `nan` and the reason in `error`, and the other boreholes are
+    unaffected.
+
+    !!! info "Added in v0.25.0"
+
+    :param dataset: Dataset to correct.
+    :param eop: Effective overburden pressure of each reading of the
+                dataset ($kPa$), or the soil profile it is computed
+                from.
+    :param method: SPT design method.
+    :param max_workers: Number of processes. Defaults to the number of
+                        CPUs. With a single worker, the dataset is
+                        corrected in the current process.
+    :param chunk_size: Minimum number of readings sent to a process at
+                       a time. Defaults to spreading the readings over
+                       four chunks per worker.
+    :param kwargs: Other arguments of
+                   [correct_spt_n_values][geolysis.spt.correct_spt_n_values],
+                   as single values used for every reading.
+
+    :return: The result of each borehole, in the order of
+             `dataset.borehole_ids`.
+
+    :raises ValueError: Raised when `eop` does not have one value per
+                        reading.
+    """
+    if not isinstance(eop, SoilProfile) and len(eop) != len(dataset):
+        raise ValueError("eop must have one value per reading of the dataset.")
+
+    if chunk_size is None:
+        workers = max_workers or os.cpu_count() or 1
+        chunk_size = max(len(dataset) // (4 * workers), _MIN_CHUNK_SIZE)
+
+    method = SPTDesignMethod(method)
+    offsets = dataset._offsets
+    columns = (
+        dataset._depths,
+        dataset._recorded_spt_n_values,
+        dataset._rod_lengths,
+        dataset._borehole_diameters,
+        dataset._hammer_codes,
+        dataset._sampler_codes,
+    )
+
+    tasks = []
+    for first, last in _partition(dataset, chunk_size):
+        lo, hi = offsets[first], offsets[last]
+        chunk_offsets = array("Q", (offsets[k] - lo for k in range(first, last + 1)))
+        chunk_columns = (
+            dataset.borehole_ids[first:last],
+            chunk_offsets,
+            *(_take(column, lo, hi) for column in columns),
+        )
+        if isinstance(eop, SoilProfile):
+            chunk_eop = eop
+        else:
+            chunk_eop = array("d", eop[lo:hi])
+        tasks.append((chunk_columns, chunk_eop, method, kwargs))
+
+    return [
+        result
+        for chunk_results in _run(_correct_chunk, tasks, max_workers)
+        for result in chunk_results
+    ]
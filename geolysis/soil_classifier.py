@@ -1,16 +1,29 @@
 import enum
-from dataclasses import dataclass
-from typing import Annotated, Optional, Sequence
+from array import array
+from collections import Counter
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Final,
+    Iterable,
+    Iterator,
+    Optional,
+    Self,
+    Sequence,
+    overload,
+)
 
 from func_validator import (
     DependsOn,
     MustBeLessThanOrEqual,
     MustBeNonNegative,
     MustBePositive,
+    ValidationError,
     validate_params,
 )
 
-from .utils import isclose, round_
+from .utils import broadcast, isclose, nan, round_
 
 __all__ = [
     "AtterbergLimits",
@@ -19,6 +32,21 @@ __all__ = [
     "USCS",
     "create_aashto_classifier",
     "create_uscs_classifier",
+    "SoilClassifications",
+    "USCS_RESULTS",
+    "classify_uscs",
+    "AASHTO_SYMBOLS",
+    "AASHTO_RESULTS",
+    "AASHTOClassifications",
+    "classify_aashto",
+    "AtterbergIndices",
+    "atterberg_indices",
+    "PlasticityChartRaster",
+    "plasticity_chart_raster",
+    "ClassifierCacheInfo",
+    "enable_classifier_cache",
+    "disable_classifier_cache",
+    "classifier_cache_info",
 ]
 
 
@@ -572,7 +600,17 @@ class AASHTO:
         return x_1 * (0.2 + 0.005 * x_2) + 0.01 * x_3 * x_4
 
     def classify(self) -> AASHTOResult:
-        """Return the AASHTO classification of the soil."""
+        """Return the AASHTO classification of the soil.
+
+        See
+        [enable_classifier_cache][geolysis.soil_classifier.enable_classifier_cache]
+        to reuse the results of identical samples.
+        """
+        if _classifier_cache is not None:
+            return _classifier_cache.classify_aashto(self)
+        return self._classify_result()
+
+    def _classify_result(self) -> AASHTOResult:
         soil_clf = self._classify()
 
         symbol_no_grp_idx, description = soil_clf.symbol, soil_clf.description
@@ -688,8 +726,18 @@ class USCS:
         self.psd = psd
         self.organic = organic
 
-    def classify(self):
-        """Return the USCS classification of the soil."""
+    def classify(self) -> USCSResult:
+        """Return the USCS classification of the soil.
+
+        See
+        [enable_classifier_cache][geolysis.soil_classifier.enable_classifier_cache]
+        to reuse the results of identical samples.
+        """
+        if _classifier_cache is not None:
+            return _classifier_cache.classify_uscs(self)
+        return self._classify_result()
+
+    def _classify_result(self) -> USCSResult:
         soil_clf = self._classify()
 
         # Ensure soil_clf is of type USCSSymbol
@@ -864,3 +912,840 @@ def create_uscs_classifier(
     atterberg_lmts = AtterbergLimits(liquid_limit, plastic_limit)
     psd = PSD(fines=fines, sand=sand, d_10=d_10, d_30=d_30, d_60=d_60)
     return USCS(atterberg_limits=atterberg_lmts, psd=psd, organic=organic)
+
+
+class _SelectedCodes(Sequence):
+    """Codes of a selection of samples, read through the rows of the
+    samples from the codes of the whole batch without copying them.
+    """
+
+    __slots__ = ("codes", "rows")
+
+    def __init__(self, codes: array | memoryview, rows: array | memoryview):
+        self.codes = codes
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[int]:
+        codes = self.codes
+        return (codes[row] for row in self.rows)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return _SelectedCodes(self.codes, memoryview(self.rows)[item])
+        return self.codes[self.rows[item]]
+
+
+@dataclass(frozen=True, slots=True)
+class SoilClassifications:
+    """Classification of a batch of soil samples, stored as one small
+    integer code per sample into a table of results shared by every
+    sample.
+
+    Indexing with an integer returns the result of a sample, which is
+    the shared instance of the table rather than a new one. Slicing and
+    filtering return views of the same codes without copying them.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    codes: array | memoryview | Sequence[int]
+    """Code of the result of each sample in `table`."""
+
+    table: Sequence[USCSResult | AASHTOResult]
+    """Results indexed by code, e.g.
+    [USCS_RESULTS][geolysis.soil_classifier.USCS_RESULTS]."""
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[USCSResult | AASHTOResult]:
+        table = self.table
+        return (table[code] for code in self.codes)
+
+    @overload
+    def __getitem__(self, i: int) -> USCSResult | AASHTOResult: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> Self: ...
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            codes = self.codes
+            if not isinstance(codes, _SelectedCodes):
+                codes = memoryview(codes)
+            return replace(self, codes=codes[i])
+        return self.table[self.codes[i]]
+
+    def _codes_of(self, symbols: Iterable[str]) -> set[int]:
+        symbols = set(symbols)
+        return {
+            code
+            for code, res in enumerate(self.table)
+            if res.symbol in symbols
+            or getattr(res, "symbol_no_group_idx", None) in symbols
+        }
+
+    def rows(self, *symbols: str) -> array:
+        """Return the indices of the samples classified as one of
+        `symbols`.
+
+        AASHTO samples can be selected either with or without their
+        group index, e.g. `A-7-5(12)` or `A-7-5`.
+        """
+        codes = self._codes_of(symbols)
+        return array("L", (i for i, code in enumerate(self.codes) if code in codes))
+
+    def filter(self, *symbols: str) -> Self:
+        """Return the samples classified as one of `symbols`, sharing
+        the codes and results table of this batch.
+
+        See [rows][geolysis.soil_classifier.SoilClassifications.rows]
+        for the selection of AASHTO samples.
+        """
+        rows, codes = self.rows(*symbols), self.codes
+        if isinstance(codes, _SelectedCodes):
+            # Select from the codes of the whole batch.
+            rows, codes = array("L", (codes.rows[row] for row in rows)), codes.codes
+        return replace(self, codes=_SelectedCodes(codes, rows))
+
+    def counts(self, key: str = "symbol") -> dict[str, int]:
+        """Return the number of samples of each classification, in
+        order of first occurrence.
+
+        :param key: Attribute of the results to group the samples by,
+                    e.g. `symbol_no_group_idx` to count AASHTO samples
+                    regardless of their group index.
+        """
+        counts = {}
+        for code, count in Counter(self.codes).items():
+            group = getattr(self.table[code], key)
+            counts[group] = counts.get(group, 0) + count
+        return counts
+
+
+def _uscs_results() -> tuple[USCSResult, ...]:
+    results = [USCSResult(clf.symbol, clf.description) for clf in USCSSymbol]
+
+    # Ambiguous results of coarse soils without particle sizes.
+    for coarse in ("G", "S"):
+        for suffix in ("", f"_{coarse}M", f"_{coarse}C"):
+            first_clf = USCSSymbol[f"{coarse}W{suffix}"]
+            second_clf = USCSSymbol[f"{coarse}P{suffix}"]
+            results.append(
+                USCSResult(
+                    symbol=f"{first_clf.symbol},{second_clf.symbol}",
+                    description=f"{first_clf.description},{second_clf.description}",
+                )
+            )
+
+    return tuple(results)
+
+
+USCS_RESULTS: Final = _uscs_results()
+"""All the results [USCS.classify][geolysis.soil_classifier.USCS.classify]
+can return, indexed by the codes returned by
+[classify_uscs][geolysis.soil_classifier.classify_uscs].
+
+!!! info "Added in v0.25.0"
+"""
+
+_USCS_CODES: Final = {res.symbol: code for code, res in enumerate(USCS_RESULTS)}
+
+
+def _coarse_uscs_codes(coarse: str) -> dict[str, int]:
+    """Codes of the coarse soil results keyed by the symbol without the
+    coarse material type, e.g. `W-C` for `GW-GC`.
+    """
+    codes = {}
+    for symbol, code in _USCS_CODES.items():
+        if symbol.startswith(coarse) and len(symbol) > 1:
+            codes[symbol.replace(coarse, "")] = code
+    return codes
+
+
+_COARSE_USCS_CODES: Final = {c: _coarse_uscs_codes(c) for c in ("G", "S")}
+
+
+def _has_particle_sizes(d_10, d_30, d_60) -> bool:
+    # Missing sizes are either None or nan, which never equals itself.
+    return all(d and d == d for d in (d_10, d_30, d_60))
+
+
+def classify_uscs(
+    liquid_limits: Sequence[float],
+    plastic_limits: Sequence[float],
+    fines: Sequence[float],
+    sands: Sequence[float],
+    d_10: Optional[float | Sequence[Optional[float]]] = None,
+    d_30: Optional[float | Sequence[Optional[float]]] = None,
+    d_60: Optional[float | Sequence[Optional[float]]] = None,
+    organic: bool | Sequence[bool] = False,
+) -> SoilClassifications:
+    """Batch version of
+    [create_uscs_classifier][geolysis.soil_classifier.create_uscs_classifier].
+
+    Classifies columns of laboratory results in one pass without
+    creating classifier objects per sample. Each sample is given the
+    code of its result in
+    [USCS_RESULTS][geolysis.soil_classifier.USCS_RESULTS], which is
+    identical to the result of `USCS.classify`, including the ambiguous
+    two-symbol results of coarse soils without particle sizes.
+
+    `d_10`, `d_30`, `d_60` and `organic` can either be a single value
+    used for every sample or a column of the same length as
+    `liquid_limits`. Missing particle sizes are given as `None` or
+    `nan`.
+
+    !!! info "Added in v0.25.0"
+
+    :param liquid_limits: Liquid limit of each sample (%).
+    :param plastic_limits: Plastic limit of each sample (%).
+    :param fines: Percentage of fines of each sample (%).
+    :param sands: Percentage of sand of each sample (%).
+    :param d_10: Diameter at which 10% of each sample by weight is
+                 finer.
+    :param d_30: Diameter at which 30% of each sample by weight is
+                 finer.
+    :param d_60: Diameter at which 60% of each sample by weight is
+                 finer.
+    :param organic: Indicates whether each sample is organic or not.
+
+    :raises ValidationError: Raised when a sample has a negative limit,
+                             a plastic limit greater than its liquid
+                             limit, negative fines or sand, or a
+                             non-positive particle size.
+    :raises ValueError: Raised when the columns have different lengths.
+    """
+    size = len(liquid_limits)
+    if not size == len(plastic_limits) == len(fines) == len(sands):
+        raise ValueError("All columns must have the same length.")
+
+    d_10, d_30, d_60 = (broadcast(d, size) for d in (d_10, d_30, d_60))
+    organic = broadcast(organic, size)
+
+    codes = _USCS_CODES
+    cl, ml_cl, ml, ol = codes["CL"], codes["ML-CL"], codes["ML"], codes["OL"]
+    ch, mh, oh = codes["CH"], codes["MH"], codes["OH"]
+
+    soil_codes = array("B", bytes(size))
+    for i in range(size):
+        liquid_lmt, plastic_lmt = liquid_limits[i], plastic_limits[i]
+        if not 0.0 <= plastic_lmt <= liquid_lmt:
+            msg = (
+                f"Sample {i}: plastic_limit {plastic_lmt} must be non-negative "
+                f"and <= liquid_limit {liquid_lmt}"
+            )
+            raise ValidationError(msg)
+
+        fines_i, sand = fines[i], sands[i]
+        if not (fines_i >= 0.0 and sand >= 0.0):
+            msg = f"Sample {i}: fines {fines_i} and sand {sand} must be non-negative"
+            raise ValidationError(msg)
+
+        plasticity_idx = round(liquid_lmt - plastic_lmt, 2)
+        above_a_line = plasticity_idx > 0.73 * (liquid_lmt - 20.0)
+        in_hatched_zone = 4 <= plasticity_idx <= 7 and 10 < liquid_lmt < 30
+
+        # Fine grained
+        if fines_i > 50.0:
+            if liquid_lmt < 50.0:
+                if above_a_line and plasticity_idx > 7.0:
+                    soil_codes[i] = cl
+                elif in_hatched_zone:
+                    soil_codes[i] = ml_cl
+                else:
+                    soil_codes[i] = ol if organic[i] else ml
+            else:
+                if above_a_line:
+                    soil_codes[i] = ch
+                else:
+                    soil_codes[i] = oh if organic[i] else mh
+            continue
+
+        # Coarse grained
+        coarse = "G" if 100.0 - (fines_i + sand) > sand else "S"
+        coarse_codes = _COARSE_USCS_CODES[coarse]
+
+        if fines_i > 12.0:
+            if above_a_line:
+                soil_codes[i] = coarse_codes["C"]
+            elif in_hatched_zone:
+                soil_codes[i] = coarse_codes["M-C"]
+            else:
+                soil_codes[i] = coarse_codes["M"]
+            continue
+
+        dual = fines_i >= 5.0
+        fine = "C" if above_a_line else "M"
+        d_10_i, d_30_i, d_60_i = d_10[i], d_30[i], d_60[i]
+
+        if _has_particle_sizes(d_10_i, d_30_i, d_60_i):
+            if not (d_10_i > 0.0 and d_30_i > 0.0 and d_60_i > 0.0):
+                msg = f"Sample {i}: particle sizes must be positive"
+                raise ValidationError(msg)
+
+            coeff_of_curvature = d_30_i**2.0 / (d_60_i * d_10_i)
+            coeff_of_uniformity = d_60_i / d_10_i
+            min_coeff_of_uniformity = 4 if coarse == "G" else 6
+            if (
+                1 < coeff_of_curvature < 3
+                and coeff_of_uniformity >= min_coeff_of_uniformity
+            ):
+                grade = "W"
+            else:
+                grade = "P"
+            soil_codes[i] = coarse_codes[f"{grade}-{fine}" if dual else grade]
+        else:
+            soil_codes[i] = coarse_codes[f"W-{fine},P-{fine}" if dual else "W,P"]
+
+    return SoilClassifications(codes=soil_codes, table=USCS_RESULTS)
+
+
+AASHTO_SYMBOLS: Final = tuple(AASHTOSymbol)
+"""All the AASHTO symbols, indexed by the symbol codes of
+[AASHTOClassifications][geolysis.soil_classifier.AASHTOClassifications].
+
+!!! info "Added in v0.25.0"
+"""
+
+_AASHTO_CODES: Final = {clf: code for code, clf in enumerate(AASHTO_SYMBOLS)}
+
+# The group index is at most 20, see `AASHTO.group_index`.
+_NUM_GROUP_INDICES: Final = 21
+
+
+def _aashto_results() -> tuple[AASHTOResult, ...]:
+    results = []
+    for soil_clf in AASHTO_SYMBOLS:
+        for group_idx in range(_NUM_GROUP_INDICES):
+            results.append(
+                AASHTOResult(
+                    symbol=f"{soil_clf.symbol}({group_idx})",
+                    symbol_no_group_idx=soil_clf.symbol,
+                    description=soil_clf.description,
+                    group_index=str(group_idx),
+                )
+            )
+    return tuple(results)
+
+
+AASHTO_RESULTS: Final = _aashto_results()
+"""All the results [AASHTO.classify][geolysis.soil_classifier.AASHTO.classify]
+can return, indexed by the codes of
+[classify_aashto][geolysis.soil_classifier.classify_aashto].
+
+!!! info "Added in v0.25.0"
+"""
+
+
+class AASHTOClassifications(SoilClassifications):
+    """AASHTO classification of a batch of soil samples.
+
+    Each code combines the symbol and the Group Index of a sample.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    __slots__ = ()
+
+    @property
+    def symbol_codes(self) -> array:
+        """Code of the symbol of each sample in
+        [AASHTO_SYMBOLS][geolysis.soil_classifier.AASHTO_SYMBOLS]."""
+        return array("B", (code // _NUM_GROUP_INDICES for code in self.codes))
+
+    @property
+    def group_indices(self) -> array:
+        """Group Index (GI) of each sample."""
+        return array("B", (code % _NUM_GROUP_INDICES for code in self.codes))
+
+
+def classify_aashto(
+    liquid_limits: Sequence[float],
+    plastic_limits: Sequence[float],
+    fines: Sequence[float],
+) -> AASHTOClassifications:
+    """Batch version of
+    [create_aashto_classifier][geolysis.soil_classifier.create_aashto_classifier].
+
+    Computes the clamped Group Index terms and walks the A-1 to A-7
+    decision table over columns of laboratory results in one pass,
+    without creating classifier objects or formatting symbols per
+    sample.
+
+    !!! info "Added in v0.25.0"
+
+    :param liquid_limits: Liquid limit of each sample (%).
+    :param plastic_limits: Plastic limit of each sample (%).
+    :param fines: Percentage of fines of each sample (%).
+
+    :raises ValidationError: Raised when a sample has a negative limit,
+                             a plastic limit greater than its liquid
+                             limit or negative fines.
+    :raises ValueError: Raised when the columns have different lengths.
+    """
+    size = len(liquid_limits)
+    if not size == len(plastic_limits) == len(fines):
+        raise ValueError("All columns must have the same length.")
+
+    # Symbol codes are scaled so that adding the group index gives the
+    # code of the result.
+    codes = {clf: code * _NUM_GROUP_INDICES for clf, code in _AASHTO_CODES.items()}
+    a_1_a, a_1_b, a_3 = (
+        codes[AASHTOSymbol.A_1_a],
+        codes[AASHTOSymbol.A_1_b],
+        codes[AASHTOSymbol.A_3],
+    )
+    a_2_4, a_2_5, a_2_6, a_2_7 = (
+        codes[AASHTOSymbol.A_2_4],
+        codes[AASHTOSymbol.A_2_5],
+        codes[AASHTOSymbol.A_2_6],
+        codes[AASHTOSymbol.A_2_7],
+    )
+    a_4, a_5, a_6 = (
+        codes[AASHTOSymbol.A_4],
+        codes[AASHTOSymbol.A_5],
+        codes[AASHTOSymbol.A_6],
+    )
+    a_7_5, a_7_6 = codes[AASHTOSymbol.A_7_5], codes[AASHTOSymbol.A_7_6]
+
+    soil_codes = array("B", bytes(size))
+    for i in range(size):
+        liquid_lmt, plastic_lmt, fines_i = liquid_limits[i], plastic_limits[i], fines[i]
+        if not 0.0 <= plastic_lmt <= liquid_lmt:
+            msg = (
+                f"Sample {i}: plastic_limit {plastic_lmt} must be non-negative "
+                f"and <= liquid_limit {liquid_lmt}"
+            )
+            raise ValidationError(msg)
+        if not fines_i >= 0.0:
+            msg = f"Sample {i}: fines {fines_i} must be non-negative"
+            raise ValidationError(msg)
+
+        plasticity_idx = round(liquid_lmt - plastic_lmt, 2)
+
+        x_1 = 1.0 if (x_0 := fines_i - 35.0) < 0.0 else min(x_0, 40.0)
+        x_2 = 1.0 if (x_0 := liquid_lmt - 40.0) < 0.0 else min(x_0, 20.0)
+        x_3 = 1.0 if (x_0 := fines_i - 15.0) < 0.0 else min(x_0, 40.0)
+        x_4 = 1.0 if (x_0 := plasticity_idx - 10.0) < 0.0 else min(x_0, 20.0)
+        group_idx = round(x_1 * (0.2 + 0.005 * x_2) + 0.01 * x_3 * x_4)
+
+        # Silts A4-A7
+        if fines_i > 35:
+            if liquid_lmt <= 40:
+                symbol_code = a_4 if plasticity_idx <= 10.0 else a_6
+            elif plasticity_idx <= 10.0:
+                symbol_code = a_5
+            elif plasticity_idx <= (liquid_lmt - 30.0):
+                symbol_code = a_7_5
+            else:
+                symbol_code = a_7_6
+        # Coarse A1-A3
+        elif fines_i <= 10.0 and isclose(plasticity_idx, 0.0, rel_tol=0.01):
+            symbol_code = a_3
+        elif fines_i <= 15 and plasticity_idx <= 6:
+            symbol_code = a_1_a
+        elif fines_i <= 25 and plasticity_idx <= 6:
+            symbol_code = a_1_b
+        elif liquid_lmt <= 40:
+            symbol_code = a_2_4 if plasticity_idx <= 10 else a_2_6
+        else:
+            symbol_code = a_2_5 if plasticity_idx <= 10 else a_2_7
+
+        soil_codes[i] = symbol_code + group_idx
+
+    return AASHTOClassifications(codes=soil_codes, table=AASHTO_RESULTS)
+
+
+@dataclass(frozen=True, slots=True)
+class AtterbergIndices:
+    """Position on the plasticity chart and indices of a batch of soil
+    samples.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    plasticity_indices: array
+    """Plasticity index of each sample (%)."""
+
+    a_line_offsets: array
+    """Height of each sample above the A-line, $PI - 0.73(LL - 20)$,
+    negative below it."""
+
+    u_line_offsets: array
+    """Height of each sample above the U-line, $PI - 0.9(LL - 8)$.
+    Samples above the U-line, the upper bound of natural soils, should
+    be checked for errors."""
+
+    above_a_line: array
+    """Whether each sample is above the A-line, as 0 or 1."""
+
+    in_hatched_zone: array
+    """Whether each sample plots in the hatched zone of the plasticity
+    chart, as 0 or 1."""
+
+    liquidity_indices: Optional[array] = None
+    """Liquidity index of each sample, when the natural moisture contents
+    are given. `nan` for non-plastic samples."""
+
+    consistency_indices: Optional[array] = None
+    """Consistency index of each sample, when the natural moisture
+    contents are given. `nan` for non-plastic samples."""
+
+
+def atterberg_indices(
+    liquid_limits: Sequence[float],
+    plastic_limits: Sequence[float],
+    natural_moisture_contents: Optional[Sequence[float]] = None,
+) -> AtterbergIndices:
+    """Batch version of the
+    [AtterbergLimits][geolysis.soil_classifier.AtterbergLimits] chart
+    methods and indices.
+
+    Computes the plasticity index, the position relative to the A-line
+    and U-line and the hatched zone membership of every sample, and
+    their liquidity and consistency indices when the natural moisture
+    contents are given. Values are identical to those of
+    `AtterbergLimits`.
+
+    !!! info "Added in v0.25.0"
+
+    :param liquid_limits: Liquid limit of each sample (%).
+    :param plastic_limits: Plastic limit of each sample (%).
+    :param natural_moisture_contents: Natural moisture content of each
+                                      sample (%).
+
+    :raises ValidationError: Raised when a sample has a negative limit
+                             or a plastic limit greater than its liquid
+                             limit.
+    :raises ValueError: Raised when the columns have different lengths.
+    """
+    size = len(liquid_limits)
+    if len(plastic_limits) != size or (
+        natural_moisture_contents is not None
+        and len(natural_moisture_contents) != size
+    ):
+        raise ValueError("All columns must have the same length.")
+
+    plasticity_idxs, a_line_offsets, u_line_offsets = (
+        array("d"),
+        array("d"),
+        array("d"),
+    )
+    above_a_line = array("B", bytes(size))
+    in_hatched_zone = array("B", bytes(size))
+
+    for i in range(size):
+        liquid_lmt, plastic_lmt = liquid_limits[i], plastic_limits[i]
+        if not 0.0 <= plastic_lmt <= liquid_lmt:
+            msg = (
+                f"Sample {i}: plastic_limit {plastic_lmt} must be non-negative "
+                f"and <= liquid_limit {liquid_lmt}"
+            )
+            raise ValidationError(msg)
+
+        plasticity_idx = round(liquid_lmt - plastic_lmt, 2)
+        a_line = 0.73 * (liquid_lmt - 20.0)
+        plasticity_idxs.append(plasticity_idx)
+        a_line_offsets.append(plasticity_idx - a_line)
+        u_line_offsets.append(plasticity_idx - 0.9 * (liquid_lmt - 8.0))
+        above_a_line[i] = plasticity_idx > a_line
+        in_hatched_zone[i] = 4 <= plasticity_idx <= 7 and 10 < liquid_lmt < 30
+
+    liquidity_idxs = consistency_idxs = None
+    if natural_moisture_contents is not None:
+        liquidity_idxs, consistency_idxs = array("d"), array("d")
+        for i, nmc in enumerate(natural_moisture_contents):
+            plasticity_idx = plasticity_idxs[i]
+            if plasticity_idx == 0.0:
+                liquidity_idxs.append(nan)
+                consistency_idxs.append(nan)
+                continue
+            liquidity_idx = (nmc - plastic_limits[i]) / plasticity_idx * 100.0
+            consistency_idx = (liquid_limits[i] - nmc) / plasticity_idx * 100.0
+            liquidity_idxs.append(round(liquidity_idx, 2))
+            consistency_idxs.append(round(consistency_idx, 2))
+
+    return AtterbergIndices(
+        plasticity_indices=plasticity_idxs,
+        a_line_offsets=a_line_offsets,
+        u_line_offsets=u_line_offsets,
+        above_a_line=above_a_line,
+        in_hatched_zone=in_hatched_zone,
+        liquidity_indices=liquidity_idxs,
+        consistency_indices=consistency_idxs,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class PlasticityChartRaster:
+    """USCS fine soil classes over a grid of the plasticity chart.
+
+    Cell `(j, k)` holds the code in
+    [USCS_RESULTS][geolysis.soil_classifier.USCS_RESULTS] of the fine
+    soil with a liquid limit of `k * step` and a plasticity index of
+    `j * step`, so that classifying a point of the chart is a single
+    index into `codes`. Cells with a plasticity index greater than their
+    liquid limit cannot be reached by soils but are classified anyway.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    step: float
+    """Spacing of the grid (%)."""
+
+    num_liquid_limits: int
+    """Number of columns of the grid, along the liquid limit axis."""
+
+    num_plasticity_indices: int
+    """Number of rows of the grid, along the plasticity index axis."""
+
+    codes: array
+    """Codes of the cells, row by row from a plasticity index of 0."""
+
+    def index(self, liquid_limit: float, plasticity_index: float) -> int:
+        """Return the index in `codes` of the cell nearest to a point of
+        the chart.
+
+        :raises ValueError: Raised when the point is outside the grid.
+        """
+        col = round(liquid_limit / self.step)
+        row = round(plasticity_index / self.step)
+        if not (
+            0 <= col < self.num_liquid_limits
+            and 0 <= row < self.num_plasticity_indices
+        ):
+            msg = f"({liquid_limit}, {plasticity_index}) is outside the chart."
+            raise ValueError(msg)
+        return row * self.num_liquid_limits + col
+
+    def classify(self, liquid_limit: float, plasticity_index: float) -> USCSResult:
+        """Return the fine soil class of the cell nearest to a point of
+        the chart.
+        """
+        return USCS_RESULTS[self.codes[self.index(liquid_limit, plasticity_index)]]
+
+    def density(
+        self,
+        liquid_limits: Sequence[float],
+        plasticity_indices: Sequence[float],
+    ) -> array:
+        """Return the number of samples in each cell, in the layout of
+        `codes`. Samples outside the grid are not counted.
+
+        :param liquid_limits: Liquid limit of each sample (%).
+        :param plasticity_indices: Plasticity index of each sample (%).
+        """
+        counts = array("L", bytes(len(self.codes) * array("L").itemsize))
+        step, num_cols = self.step, self.num_liquid_limits
+        num_rows = self.num_plasticity_indices
+        for liquid_lmt, plasticity_idx in zip(liquid_limits, plasticity_indices):
+            col, row = round(liquid_lmt / step), round(plasticity_idx / step)
+            if 0 <= col < num_cols and 0 <= row < num_rows:
+                counts[row * num_cols + col] += 1
+        return counts
+
+
+@lru_cache(maxsize=8)
+def plasticity_chart_raster(
+    max_liquid_limit: float = 100.0,
+    max_plasticity_index: float = 60.0,
+    step: float = 0.5,
+    organic: bool = False,
+) -> PlasticityChartRaster:
+    """Return the USCS fine soil classes over a grid of the plasticity
+    chart, i.e. CL, ML-CL, ML (or OL), CH and MH (or OH), as classified
+    by [USCS][geolysis.soil_classifier.USCS] for soils with more than
+    50% fines.
+
+    Rasters are cached, so repeated calls with the same arguments return
+    the same raster.
+
+    !!! info "Added in v0.25.0"
+
+    :param max_liquid_limit: Largest liquid limit of the grid (%).
+    :param max_plasticity_index: Largest plasticity index of the grid
+                                 (%).
+    :param step: Spacing of the grid (%).
+    :param organic: Whether the silts are classified as organic.
+
+    :raises ValueError: Raised when `step` or a maximum is not positive.
+    """
+    if not (step > 0.0 and max_liquid_limit > 0.0 and max_plasticity_index > 0.0):
+        raise ValueError("step and the maximums of the chart must be positive.")
+
+    num_cols = round(max_liquid_limit / step) + 1
+    num_rows = round(max_plasticity_index / step) + 1
+
+    codes = _USCS_CODES
+    cl, ml_cl, ch = codes["CL"], codes["ML-CL"], codes["CH"]
+    low_silt = codes["OL"] if organic else codes["ML"]
+    high_silt = codes["OH"] if organic else codes["MH"]
+
+    raster = array("B", bytes(num_rows * num_cols))
+    for row in range(num_rows):
+        plasticity_idx = row * step
+        for col in range(num_cols):
+            liquid_lmt = col * step
+            above_a_line = plasticity_idx > 0.73 * (liquid_lmt - 20.0)
+            if liquid_lmt < 50.0:
+                if above_a_line and plasticity_idx > 7.0:
+                    code = cl
+                elif 4 <= plasticity_idx <= 7 and 10 < liquid_lmt < 30:
+                    code = ml_cl
+                else:
+                    code = low_silt
+            else:
+                code = ch if above_a_line else high_silt
+            raster[row * num_cols + col] = code
+
+    return PlasticityChartRaster(
+        step=step,
+        num_liquid_limits=num_cols,
+        num_plasticity_indices=num_rows,
+        codes=raster,
+    )
+
+
+_AASHTO_RESULT_CODES: Final = {
+    res.symbol: code for code, res in enumerate(AASHTO_RESULTS)
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ClassifierCacheInfo:
+    """Statistics of the classification cache of a classifier.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    hits: int
+    """Number of classifications returned from the cache."""
+
+    misses: int
+    """Number of classifications computed and added to the cache."""
+
+    maxsize: int
+    """Maximum number of cached classifications."""
+
+    currsize: int
+    """Current number of cached classifications."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the classifications returned from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _ClassifierCache:
+    def __init__(self, maxsize: int, ndigits: int, size_sig_digits: int):
+        self.ndigits = ndigits
+        self.size_sig_digits = size_sig_digits
+        self._uscs = lru_cache(maxsize=maxsize)(self._classify_uscs)
+        self._aashto = lru_cache(maxsize=maxsize)(self._classify_aashto)
+
+    def _round_size(self, size: Optional[float]) -> Optional[float]:
+        if not size:
+            return size
+        return float(f"{size:.{self.size_sig_digits}g}")
+
+    def classify_uscs(self, clf: USCS) -> USCSResult:
+        al, psd = clf.atterberg_limits, clf.psd
+        size_dist = psd.size_dist
+        return self._uscs(
+            round(al.liquid_limit, self.ndigits),
+            round(al.plastic_limit, self.ndigits),
+            round(psd.fines, self.ndigits),
+            round(psd.sand, self.ndigits),
+            self._round_size(size_dist.d_10),
+            self._round_size(size_dist.d_30),
+            self._round_size(size_dist.d_60),
+            bool(clf.organic),
+        )
+
+    def classify_aashto(self, clf: AASHTO) -> AASHTOResult:
+        al = clf.atterberg_limits
+        return self._aashto(
+            round(al.liquid_limit, self.ndigits),
+            round(al.plastic_limit, self.ndigits),
+            round(clf.fines, self.ndigits),
+        )
+
+    @staticmethod
+    def _classify_uscs(*key) -> USCSResult:
+        res = create_uscs_classifier(*key)._classify_result()
+        return USCS_RESULTS[_USCS_CODES[res.symbol]]
+
+    @staticmethod
+    def _classify_aashto(*key) -> AASHTOResult:
+        res = create_aashto_classifier(*key)._classify_result()
+        return AASHTO_RESULTS[_AASHTO_RESULT_CODES[res.symbol]]
+
+    def info(self) -> dict[str, ClassifierCacheInfo]:
+        return {
+            "uscs": ClassifierCacheInfo(*self._uscs.cache_info()),
+            "aashto": ClassifierCacheInfo(*self._aashto.cache_info()),
+        }
+
+
+_classifier_cache: Optional[_ClassifierCache] = None
+
+
+@validate_params
+def enable_classifier_cache(
+    maxsize: Annotated[int, MustBePositive()] = 4096,
+    ndigits: Annotated[int, MustBeNonNegative()] = 1,
+    size_sig_digits: Annotated[int, MustBePositive()] = 3,
+) -> None:
+    """Cache the results of
+    [USCS.classify][geolysis.soil_classifier.USCS.classify] and
+    [AASHTO.classify][geolysis.soil_classifier.AASHTO.classify].
+
+    Samples are classified from their inputs rounded to the precision
+    they are reported to in the laboratory, so that samples with the
+    same rounded inputs are only classified once. Classifications are
+    returned as the shared instances of
+    [USCS_RESULTS][geolysis.soil_classifier.USCS_RESULTS] and
+    [AASHTO_RESULTS][geolysis.soil_classifier.AASHTO_RESULTS] instead
+    of new results.
+
+    The cache is disabled by default because of the rounding. Enabling
+    it again clears it.
+
+    !!! info "Added in v0.25.0"
+
+    :param maxsize: Maximum number of cached classifications per
+                    classifier. The least recently used are discarded
+                    first.
+    :param ndigits: Number of decimal places the Atterberg limits, fines
+                    and sand are rounded to.
+    :param size_sig_digits: Number of significant digits the particle
+                            sizes are rounded to.
+    """
+    global _classifier_cache
+    _classifier_cache = _ClassifierCache(maxsize, ndigits, size_sig_digits)
+
+
+def disable_classifier_cache() -> None:
+    """Disable and clear the classification cache enabled by
+    [enable_classifier_cache][geolysis.soil_classifier.enable_classifier_cache].
+
+    !!! info "Added in v0.25.0"
+    """
+    global _classifier_cache
+    _classifier_cache = None
+
+
+def classifier_cache_info() -> Optional[dict[str, ClassifierCacheInfo]]:
+    """Return the statistics of the classification cache of the `uscs`
+    and `aashto` classifiers, or `None` when the cache is disabled.
+
+    !!! info "Added in v0.25.0"
+    """
+    if _classifier_cache is None:
+        return None
+    return _classifier_cache.info()
@@ -0,0 +1,344 @@
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Annotated, Final, Mapping, Optional, Sequence
+
+from func_validator import (
+    MustBeNonNegative,
+    MustHaveLengthGreaterThan,
+    MustHaveValuesGreaterThan,
+    validate_params,
+)
+
+from .soil_classifier import AASHTOResult, SoilClassifications, USCSResult
+from .utils import inf, isinf, isnan, nan
+
+__all__ = ["SoilProfile", "Stratum", "Strata", "compact_strata"]
+
+#: Unit weight of water ($kN/m^3$).
+UNIT_WGT_OF_WATER: Final = 9.81
+
+
+class SoilProfile:
+    r"""Layered soil profile used to compute in-situ vertical stresses.
+
+    The profile is made up of horizontal layers, each with a moist unit
+    weight above the ground water level and a saturated unit weight
+    below it. Stresses at the layer boundaries and at the ground water
+    level are precomputed, so the stress at any depth is obtained by a
+    binary search followed by a linear interpolation.
+
+    The last layer is assumed to extend indefinitely below its bottom
+    boundary.
+
+    $$
+    \sigma'_v = \sum \gamma_i h_i - \gamma_w (z - z_w)
+    $$
+
+    !!! info "Added in v0.25.0"
+    """
+
+    @validate_params
+    def __init__(
+        self,
+        layer_boundaries: Annotated[
+            Sequence[float],
+            MustHaveLengthGreaterThan(0),
+            MustHaveValuesGreaterThan(0.0),
+        ],
+        moist_unit_wgts: Annotated[Sequence[float], MustHaveValuesGreaterThan(0.0)],
+        saturated_unit_wgts: Annotated[
+            Sequence[float], MustHaveValuesGreaterThan(0.0)
+        ],
+        ground_water_level: Annotated[float, MustBeNonNegative()] = inf,
+    ):
+        """
+        :param layer_boundaries: Depth of the bottom of each layer, in
+                                 ascending order (m).
+        :param moist_unit_wgts: Moist unit weight of each layer
+                                ($kN/m^3$).
+        :param saturated_unit_wgts: Saturated unit weight of each layer
+                                    ($kN/m^3$).
+        :param ground_water_level: Depth of the water below ground level
+                                   (m).
+
+        :raises ValueError: Raised when the layer boundaries are not in
+                            ascending order or the number of unit
+                            weights does not match the number of layers.
+        """
+        n_layers = len(layer_boundaries)
+        if not n_layers == len(moist_unit_wgts) == len(saturated_unit_wgts):
+            msg = "A moist and saturated unit weight is required for each layer."
+            raise ValueError(msg)
+
+        if any(a >= b for a, b in zip(layer_boundaries, layer_boundaries[1:])):
+            raise ValueError("layer_boundaries must be in ascending order.")
+
+        self._layer_boundaries = tuple(layer_boundaries)
+        self._moist_unit_wgts = tuple(moist_unit_wgts)
+        self._saturated_unit_wgts = tuple(saturated_unit_wgts)
+        self._ground_water_level = ground_water_level
+        self._build()
+
+    @property
+    def layer_boundaries(self) -> tuple[float, ...]:
+        """Depth of the bottom of each layer (m)."""
+        return self._layer_boundaries
+
+    @property
+    def moist_unit_wgts(self) -> tuple[float, ...]:
+        """Moist unit weight of each layer ($kN/m^3$)."""
+        return self._moist_unit_wgts
+
+    @property
+    def saturated_unit_wgts(self) -> tuple[float, ...]:
+        """Saturated unit weight of each layer ($kN/m^3$)."""
+        return self._saturated_unit_wgts
+
+    @property
+    def ground_water_level(self) -> float:
+        """Depth of the water below ground level (m)."""
+        return self._ground_water_level
+
+    def _build(self):
+        """Precompute the total stress and pore pressure at the layer
+        boundaries and the ground water level.
+        """
+        gwl = self.ground_water_level
+        depths = [0.0, *self.layer_boundaries]
+        if not isinf(gwl) and gwl not in depths:
+            depths.append(gwl)
+            depths.sort()
+
+        # Unit weight of the soil between consecutive breakpoints.
+        last = len(self.layer_boundaries) - 1
+        unit_wgts = []
+        for top in depths:
+            layer = min(bisect_right(self.layer_boundaries, top), last)
+            if top < gwl:
+                unit_wgts.append(self.moist_unit_wgts[layer])
+            else:
+                unit_wgts.append(self.saturated_unit_wgts[layer])
+
+        total_stresses = [0.0]
+        for i in range(1, len(depths)):
+            thickness = depths[i] - depths[i - 1]
+            total_stresses.append(total_stresses[-1] + unit_wgts[i - 1] * thickness)
+
+        self._depths = array("d", depths)
+        self._unit_wgts = array("d", unit_wgts)
+        self._total_stresses = array("d", total_stresses)
+
+    def _total_stress(self, depth: float) -> float:
+        if depth < 0.0:
+            raise ValueError(f"depth: {depth} must be non-negative.")
+        i = bisect_right(self._depths, depth) - 1
+        return self._total_stresses[i] + self._unit_wgts[i] * (depth - self._depths[i])
+
+    def _pore_pressure(self, depth: float) -> float:
+        return max(depth - self.ground_water_level, 0.0) * UNIT_WGT_OF_WATER
+
+    def total_stress(self, depths: float | Sequence[float]) -> float | array:
+        """Return the total vertical stress ($kPa$) at `depths`.
+
+        :param depths: Depth or depths below ground level (m).
+        """
+        if isinstance(depths, Sequence):
+            return array("d", map(self._total_stress, depths))
+        return self._total_stress(depths)
+
+    def pore_pressure(self, depths: float | Sequence[float]) -> float | array:
+        """Return the hydrostatic pore water pressure ($kPa$) at
+        `depths`.
+
+        :param depths: Depth or depths below ground level (m).
+        """
+        if isinstance(depths, Sequence):
+            return array("d", map(self._pore_pressure, depths))
+        return self._pore_pressure(depths)
+
+    def eop(self, depths: float | Sequence[float]) -> float | array:
+        """Return the effective overburden pressure ($kPa$) at `depths`.
+
+        :param depths: Depth or depths below ground level (m).
+        """
+        if isinstance(depths, Sequence):
+            return array(
+                "d", (self._total_stress(d) - self._pore_pressure(d) for d in depths)
+            )
+        return self._total_stress(depths) - self._pore_pressure(depths)
+
+
+@dataclass(frozen=True, slots=True)
+class Stratum:
+    """A stratum of a borehole log.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    top: float
+    """Depth of the top of the stratum (m)."""
+
+    bottom: float
+    """Depth of the bottom of the stratum (m)."""
+
+    classification: str
+    """Classification shared by the samples of the stratum, e.g. `CL`."""
+
+    num_samples: int
+    """Number of samples in the stratum."""
+
+    properties: dict[str, float]
+    """Mean of each sample property over the stratum."""
+
+
+@dataclass(frozen=True, slots=True)
+class Strata:
+    """Strata of a borehole log, made up of runs of consecutive samples
+    with the same classification.
+
+    Stratum `k` is made up of samples `sample_offsets[k]` to
+    `sample_offsets[k + 1]` of the log.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    tops: array
+    """Depth of the top of each stratum (m)."""
+
+    bottoms: array
+    """Depth of the bottom of each stratum (m)."""
+
+    classifications: tuple[str, ...]
+    """Classification of each stratum."""
+
+    sample_offsets: array
+    """Offset of the first sample of each stratum, followed by the
+    number of samples."""
+
+    properties: dict[str, array]
+    """Mean of each sample property over each stratum, ignoring `nan`."""
+
+    def __len__(self) -> int:
+        return len(self.classifications)
+
+    def __getitem__(self, k: int) -> Stratum:
+        k = range(len(self))[k]
+        offsets = self.sample_offsets
+        return Stratum(
+            top=self.tops[k],
+            bottom=self.bottoms[k],
+            classification=self.classifications[k],
+            num_samples=offsets[k + 1] - offsets[k],
+            properties={name: column[k] for name, column in self.properties.items()},
+        )
+
+    def soil_profile(
+        self,
+        moist_unit_wgt: str,
+        saturated_unit_wgt: str,
+        ground_water_level: float = inf,
+    ) -> SoilProfile:
+        """Return the soil profile made up of the strata.
+
+        :param moist_unit_wgt: Name of the property holding the moist
+                               unit weight of the samples ($kN/m^3$).
+        :param saturated_unit_wgt: Name of the property holding the
+                                   saturated unit weight of the samples
+                                   ($kN/m^3$).
+        :param ground_water_level: Depth of the water below ground level
+                                   (m).
+        """
+        return SoilProfile(
+            layer_boundaries=self.bottoms,
+            moist_unit_wgts=self.properties[moist_unit_wgt],
+            saturated_unit_wgts=self.properties[saturated_unit_wgt],
+            ground_water_level=ground_water_level,
+        )
+
+
+def compact_strata(
+    depths: Sequence[float],
+    classifications: SoilClassifications | Sequence[USCSResult | AASHTOResult],
+    properties: Optional[Mapping[str, Sequence[float]]] = None,
+    key: str = "symbol",
+) -> Strata:
+    """Merge the classified samples of a borehole log into strata.
+
+    Consecutive samples with the same classification are merged into a
+    single stratum, whose properties are the mean of the properties of
+    its samples. Strata boundaries are set midway between the last
+    sample of a stratum and the first sample of the next. The first
+    stratum starts at the ground level and the last one ends at the
+    last sample.
+
+    Classifications given as
+    [SoilClassifications][geolysis.soil_classifier.SoilClassifications],
+    e.g. from [classify_uscs][geolysis.soil_classifier.classify_uscs],
+    are merged on their codes without building a result per sample.
+
+    !!! info "Added in v0.25.0"
+
+    :param depths: Depth of each sample, in ascending order (m).
+    :param classifications: Classification of each sample.
+    :param properties: Properties of each sample to aggregate over the
+                       strata, e.g. moisture contents or unit weights.
+    :param key: Attribute of the results the samples are merged on, e.g.
+                `symbol_no_group_idx` to merge AASHTO samples regardless
+                of their group index.
+
+    :raises ValueError: Raised when the depths are not in ascending order
+                        or the columns have different lengths.
+    """
+    size = len(depths)
+    properties = dict(properties or {})
+    if len(classifications) != size or any(
+        len(column) != size for column in properties.values()
+    ):
+        raise ValueError("All columns must have the same length.")
+    if any(a > b for a, b in zip(depths, depths[1:])):
+        raise ValueError("depths must be in ascending order.")
+
+    # Run-length encode the classification labels.
+    if isinstance(classifications, SoilClassifications):
+        table_labels = [getattr(res, key) for res in classifications.table]
+        labels = map(table_labels.__getitem__, classifications.codes)
+    else:
+        labels = (getattr(res, key) for res in classifications)
+
+    run_labels: list[str] = []
+    sample_offsets = array("L")
+    for i, label in enumerate(labels):
+        if not run_labels or label != run_labels[-1]:
+            run_labels.append(label)
+            sample_offsets.append(i)
+    sample_offsets.append(size)
+
+    num_strata = len(run_labels)
+    tops, bottoms = array("d", bytes(8 * num_strata)), array("d")
+    for k in range(1, num_strata):
+        first = sample_offsets[k]
+        boundary = (depths[first - 1] + depths[first]) / 2.0
+        tops[k] = boundary
+        bottoms.append(boundary)
+    if num_strata:
+        bottoms.append(depths[-1])
+
+    means = {}
+    for name, column in properties.items():
+        means[name] = mean_column = array("d")
+        for k in range(num_strata):
+            values = [
+                v
+                for v in column[sample_offsets[k] : sample_offsets[k + 1]]
+                if not isnan(v)
+            ]
+            mean_column.append(sum(values) / len(values) if values else nan)
+
+    return Strata(
+        tops=tops,
+        bottoms=bottoms,
+        classifications=tuple(run_labels),
+        sample_offsets=sample_offsets,
+        properties=means,
+    )
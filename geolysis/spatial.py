@@ -0,0 +1,247 @@
+import heapq
+from array import array
+from bisect import bisect_left
+from typing import Annotated, Iterator, Sequence
+
+from func_validator import MustBePositive, validate_params
+
+from .borehole import Borehole
+from .spt import SPTDesignMethod
+from .utils import isnan, nan
+
+__all__ = ["BoreholeIndex"]
+
+
+class BoreholeIndex:
+    r"""Spatial index of boreholes used to interpolate corrected SPT
+    N-values at arbitrary plan positions.
+
+    The plan coordinates of the boreholes are stored in a KD-tree, so
+    the `k` nearest boreholes to a point are found in $O(\log n)$ time
+    on average. Values are interpolated from the nearest boreholes by
+    inverse distance weighting:
+
+    $$
+    N(x, y) = \dfrac{\sum w_i N_i}{\sum w_i}, \quad w_i = \dfrac{1}{d_i^p}
+    $$
+
+    !!! info "Added in v0.25.0"
+    """
+
+    def __init__(
+        self,
+        coordinates: Sequence[tuple[float, float]],
+        boreholes: Sequence[Borehole],
+    ):
+        """
+        :param coordinates: Plan coordinates `(x, y)` of each borehole
+                            (m).
+        :param boreholes: Boreholes located at `coordinates`.
+
+        :raises ValueError: Raised when no boreholes are given or
+                            `coordinates` and `boreholes` have different
+                            lengths.
+        """
+        if len(coordinates) != len(boreholes):
+            msg = "coordinates and boreholes must have the same length."
+            raise ValueError(msg)
+        if not boreholes:
+            raise ValueError("At least one borehole is required.")
+
+        self._boreholes = tuple(boreholes)
+        self._xs = array("d", (x for x, _ in coordinates))
+        self._ys = array("d", (y for _, y in coordinates))
+
+        # The tree is stored implicitly: the node of the sub-tree
+        # order[lo:hi] is order[(lo + hi) // 2] and the split axis
+        # alternates between x and y with the level.
+        self._order = array("L", range(len(boreholes)))
+        self._build(0, len(boreholes), 0)
+
+    def __len__(self) -> int:
+        return len(self._boreholes)
+
+    @property
+    def boreholes(self) -> tuple[Borehole, ...]:
+        """Boreholes in the index."""
+        return self._boreholes
+
+    def _build(self, lo: int, hi: int, level: int):
+        if hi - lo <= 1:
+            return
+        coords = self._xs if level % 2 == 0 else self._ys
+        self._order[lo:hi] = array(
+            "L", sorted(self._order[lo:hi], key=coords.__getitem__)
+        )
+        mid = (lo + hi) // 2
+        self._build(lo, mid, level + 1)
+        self._build(mid + 1, hi, level + 1)
+
+    def _search(self, x, y, k, lo, hi, level, heap):
+        if lo >= hi:
+            return
+
+        mid = (lo + hi) // 2
+        i = self._order[mid]
+        dx, dy = x - self._xs[i], y - self._ys[i]
+        dist_sq = dx * dx + dy * dy
+
+        # Max-heap of the k nearest boreholes found so far.
+        if len(heap) < k:
+            heapq.heappush(heap, (-dist_sq, i))
+        elif dist_sq < -heap[0][0]:
+            heapq.heapreplace(heap, (-dist_sq, i))
+
+        diff = dx if level % 2 == 0 else dy
+        if diff < 0.0:
+            near, far = (lo, mid), (mid + 1, hi)
+        else:
+            near, far = (mid + 1, hi), (lo, mid)
+
+        self._search(x, y, k, *near, level + 1, heap)
+        # Only visit the far side if it can hold a nearer borehole.
+        if len(heap) < k or diff * diff < -heap[0][0]:
+            self._search(x, y, k, *far, level + 1, heap)
+
+    @validate_params
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: Annotated[int, MustBePositive()] = 1,
+    ) -> list[tuple[Borehole, float]]:
+        """Return the `k` nearest boreholes to `(x, y)` with their
+        distances, nearest first.
+
+        :param x: x-coordinate of the point (m).
+        :param y: y-coordinate of the point (m).
+        :param k: Number of boreholes to return.
+        """
+        return [(self._boreholes[i], d) for i, d in self._nearest(x, y, k)]
+
+    def _nearest(self, x: float, y: float, k: int) -> list[tuple[int, float]]:
+        heap: list[tuple[float, int]] = []
+        self._search(x, y, k, 0, len(self), 0, heap)
+        return [(i, (-d) ** 0.5) for d, i in sorted(heap, reverse=True)]
+
+    @staticmethod
+    def _idw(neighbours, values, power: float) -> float:
+        """Return the inverse-distance-weighted mean of `values` over
+        `neighbours`, ignoring boreholes whose value is `nan`.
+        """
+        total_wgted = total_wgt = 0.0
+        for i, dist in neighbours:
+            value = values[i]
+            if isnan(value):
+                continue
+            if dist == 0.0:
+                return value
+            wgt = dist**-power
+            total_wgted += wgt * value
+            total_wgt += wgt
+        return total_wgted / total_wgt if total_wgt else nan
+
+    @staticmethod
+    def _n_value_at(borehole: Borehole, depth: float) -> float:
+        """Return the corrected N-value of a borehole at `depth`,
+        linearly interpolated between readings, or `nan` outside the
+        readings.
+        """
+        depths, n_values = borehole.depths, borehole.corrected_spt_n_values
+        i = bisect_left(depths, depth)
+        if i == len(depths) or (i == 0 and depth < depths[0]):
+            return nan
+        if depths[i] == depth:
+            return n_values[i]
+        d0, d1 = depths[i - 1], depths[i]
+        n0, n1 = n_values[i - 1], n_values[i]
+        return n0 + (n1 - n0) * (depth - d0) / (d1 - d0)
+
+    @validate_params
+    def n_value_profile(
+        self,
+        x: float,
+        y: float,
+        depths: Sequence[float],
+        k: Annotated[int, MustBePositive()] = 4,
+        power: Annotated[float, MustBePositive()] = 2.0,
+    ) -> array:
+        """Return the corrected N-values at `depths` below `(x, y)`
+        interpolated from the `k` nearest boreholes.
+
+        Each borehole is interpolated linearly between its readings and
+        the boreholes are then combined by inverse distance weighting.
+        Boreholes without readings around a depth are ignored at that
+        depth, and depths not covered by any of the nearest boreholes
+        are assigned `nan`.
+
+        :param x: x-coordinate of the point (m).
+        :param y: y-coordinate of the point (m).
+        :param depths: Depths below ground level (m).
+        :param k: Number of nearest boreholes to interpolate from.
+        :param power: Power of the inverse distance weights.
+        """
+        neighbours = self._nearest(x, y, k)
+        profile = array("d")
+        for depth in depths:
+            values = {
+                i: self._n_value_at(self._boreholes[i], depth) for i, _ in neighbours
+            }
+            profile.append(self._idw(neighbours, values, power))
+        return profile
+
+    def _n_designs(self, depth, width, method, start, end) -> array:
+        """N-design of each borehole, `nan` where there are not enough
+        readings below the foundation.
+        """
+        return array(
+            "d",
+            (
+                b.rolling_n_design([depth], width, method, start, end)[0]
+                for b in self._boreholes
+            ),
+        )
+
+    @validate_params
+    def n_design_grid(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        depth: float,
+        width: float,
+        method: SPTDesignMethod | str = "wgt",
+        start: float = 0.0,
+        end: float = 2.0,
+        k: Annotated[int, MustBePositive()] = 4,
+        power: Annotated[float, MustBePositive()] = 2.0,
+    ) -> Iterator[array]:
+        """Return the interpolated SPT N-design of a foundation placed at
+        each node of the grid `xs` x `ys`, one grid row at a time.
+
+        The N-design of each borehole is computed once and then
+        interpolated to the grid nodes, so the grid is produced lazily
+        row by row (one row per value of `ys`) and can be streamed into
+        a contour plot or a raster file. Boreholes without enough
+        readings below the foundation are ignored, and nodes without any
+        such borehole among their `k` nearest are assigned `nan`.
+
+        :param xs: x-coordinates of the grid columns (m).
+        :param ys: y-coordinates of the grid rows (m).
+        :param depth: Depth of foundation (m).
+        :param width: Width of foundation footing (m).
+        :param method: SPT design method.
+        :param start: Top of the influence zone below the foundation
+                      level, as a multiple of the width.
+        :param end: Bottom of the influence zone below the foundation
+                    level, as a multiple of the width.
+        :param k: Number of nearest boreholes to interpolate from.
+        :param power: Power of the inverse distance weights.
+        """
+        n_designs = self._n_designs(depth, width, method, start, end)
+        return (
+            array(
+                "d",
+                (self._idw(self._nearest(x, y, k), n_designs, power) for x in xs),
+            )
+            for y in ys
+        )
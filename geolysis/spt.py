@@ -1,6 +1,9 @@
 import enum
+import functools
 from abc import ABC, abstractmethod
-from typing import Annotated, Final, Optional, Sequence
+from array import array
+from dataclasses import dataclass
+from typing import Annotated, Callable, Final, Optional, Sequence
 
 from func_validator import (
     DependsOn,
@@ -11,11 +14,25 @@ from func_validator import (
     MustBePositive,
     MustHaveLengthGreaterThan,
     MustHaveValuesBetween,
+    MustHaveValuesGreaterThanOrEqual,
+    ValidationError,
     validate_params,
 )
 
 from .foundation import Foundation
-from .utils import AbstractStrEnum, isclose, isinf, log10, mean, round_, sqrt
+from .soil_profile import SoilProfile
+from .utils import (
+    AbstractStrEnum,
+    broadcast,
+    inf,
+    isclose,
+    isinf,
+    log10,
+    mean,
+    nan,
+    round_,
+    sqrt,
+)
 
 __all__ = [
     "SPT",
@@ -32,6 +49,9 @@ __all__ = [
     "OPCMethod",
     "create_overburden_pressure_correction",
     "correct_spt_n_value",
+    "correct_spt_n_values",
+    "compare_opc_methods",
+    "SPTCorrectionResult",
 ]
 
 
@@ -394,6 +414,10 @@ class EnergyCorrection:
 class OPC(ABC):
     """Base class for Overburden Pressure Correction (OPC)."""
 
+    #: Range of effective overburden pressure ($kPa$) the correction
+    #: is valid for.
+    _EOP_RANGE: tuple[float, float] = (0.0, inf)
+
     def __init__(self, std_spt_n_value: float, eop: float):
         """
         :param std_spt_n_value: SPT N-value standardized for field
@@ -447,6 +471,8 @@ class GibbsHoltzOPC(OPC):
     `Gibbs & Holtz (1957)`.
     """
 
+    _EOP_RANGE = (0.0, 280.0)
+
     @property
     def eop(self) -> float:
         """Effective overburden pressure ($kPa$)."""
@@ -490,6 +516,8 @@ class PeckOPC(OPC):
     `Peck et al. (1974)`.
     """
 
+    _EOP_RANGE = (24.0, inf)
+
     @property
     def eop(self) -> float:
         """Effective overburden pressure ($kPa$)."""
@@ -559,9 +587,13 @@ class DilatancyCorrection:
     @round_(ndigits=1)
     def corrected_spt_n_value(self) -> float:
         r"""Corrected SPT N-value for presence of water."""
-        if self.corr_spt_n_value <= 15.0:
-            return self.corr_spt_n_value
-        return 15.0 + 0.5 * (self.corr_spt_n_value - 15.0)
+        return self._correct(self.corr_spt_n_value)
+
+    @staticmethod
+    def _correct(corr_spt_n_value: float) -> float:
+        if corr_spt_n_value <= 15.0:
+            return corr_spt_n_value
+        return 15.0 + 0.5 * (corr_spt_n_value - 15.0)
 
 
 class DilatancyCorrection2(DilatancyCorrection):
@@ -626,6 +658,23 @@ _opc_methods: Final = {
 }
 
 
+def _opc_correction(opc_class: type[OPC]) -> Callable[[float], float]:
+    """Return a function computing the `correction` of `opc_class` for
+    an effective overburden pressure.
+
+    A single instance is reused for every pressure, and the pressure is
+    set without going through the validating `eop` setter; callers check
+    it against `_EOP_RANGE` instead.
+    """
+    opc = opc_class.__new__(opc_class)
+
+    def correction(eop: float) -> float:
+        opc._eop = eop
+        return opc.correction()
+
+    return correction
+
+
 @validate_params
 def correct_spt_n_value(
     recorded_spt_n_value: int,
@@ -688,6 +737,170 @@ def correct_spt_n_value(
     return corr_spt_n_value
 
 
+@functools.lru_cache(maxsize=1024)
+def _energy_correction(
+    energy_percentage: float,
+    borehole_diameter: float,
+    rod_length: float,
+    hammer_type: HammerType,
+    sampler_type: SamplerType,
+) -> float:
+    # Energy correction factors only depend on the field procedure, so
+    # they are computed (and validated) once per distinct procedure.
+    return EnergyCorrection(
+        0,
+        energy_percentage=energy_percentage,
+        borehole_diameter=borehole_diameter,
+        rod_length=rod_length,
+        hammer_type=hammer_type,
+        sampler_type=sampler_type,
+    ).correction()
+
+
+@dataclass(frozen=True, slots=True)
+class SPTCorrectionResult:
+    """Standardized and corrected SPT N-values of a batch correction.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    std_spt_n_values: array
+    """SPT N-values standardized for field procedures."""
+
+    corrected_spt_n_values: array
+    """SPT N-values corrected for overburden pressure and dilatancy."""
+
+
+@validate_params
+def correct_spt_n_values(
+    recorded_spt_n_values: Annotated[
+        Sequence[int], MustHaveValuesBetween(min_value=0, max_value=100)
+    ],
+    *,
+    eop: Sequence[float] | SoilProfile,
+    depth: Annotated[
+        Optional[Sequence[float]], MustHaveValuesGreaterThanOrEqual(0.0)
+    ] = None,
+    energy_percentage: float | Sequence[float] = 0.6,
+    borehole_diameter: float | Sequence[float] = 65.0,
+    rod_length: float | Sequence[float] = 3.0,
+    hammer_type: HammerType | Sequence[HammerType] = HammerType.DONUT_1,
+    sampler_type: SamplerType | Sequence[SamplerType] = SamplerType.STANDARD,
+    opc_method: Annotated[OPCMethod | str, MustBeMemberOf(OPCMethod)] = "gibbs",
+    dilatancy_corr_method: Annotated[
+        Optional[DilatancyCorrectionMethod], MustBeMemberOf(DilatancyCorrectionMethod)
+    ] = None,
+    foundation_size: Annotated[
+        Foundation,
+        DependsOn(dilatancy_corr_method=DilatancyCorrectionMethod.WATER_AWARE),
+    ] = None,
+) -> SPTCorrectionResult:
+    """Batch version of
+    [correct_spt_n_value][geolysis.spt.correct_spt_n_value].
+
+    Corrects a column of recorded SPT N-values in one pass without
+    creating correction objects per reading. The results, including
+    rounding and the cap on the overburden pressure correction, are
+    identical to calling `correct_spt_n_value` for each reading.
+
+    `energy_percentage`, `borehole_diameter`, `rod_length`,
+    `hammer_type` and `sampler_type` can either be a single value used
+    for every reading or a column of the same length as
+    `recorded_spt_n_values`.
+
+    !!! info "Added in v0.25.0"
+
+    :param recorded_spt_n_values: Recorded SPT N-values from field.
+    :param eop: Effective overburden pressure at each reading ($kPa$),
+                or the soil profile the effective overburden pressure
+                is computed from.
+    :param depth: Depth of each reading (m). Required when `eop` is a
+                  [SoilProfile][geolysis.soil_profile.SoilProfile].
+    :param energy_percentage: Energy percentage reaching the tip of
+                              the sampler.
+    :param borehole_diameter: Borehole diameter (mm).
+    :param rod_length: Length of SPT rod (m).
+    :param hammer_type: Hammer type.
+    :param sampler_type: Sampler type.
+    :param opc_method: Overburden pressure correction method.
+    :param dilatancy_corr_method: Dilatancy correction method.
+    :param foundation_size: Foundation size.
+
+    :raises ValidationError: Raised when a reading is outside the range
+                             accepted by the scalar correction classes.
+    """
+    size = len(recorded_spt_n_values)
+
+    if isinstance(eop, SoilProfile):
+        if depth is None:
+            raise ValueError("depth is required when eop is a SoilProfile.")
+        eop = eop.eop(broadcast(depth, size))
+
+    eop = broadcast(eop, size)
+    energy_percentage = broadcast(energy_percentage, size)
+    borehole_diameter = broadcast(borehole_diameter, size)
+    rod_length = broadcast(rod_length, size)
+    hammer_type = broadcast(hammer_type, size)
+    sampler_type = broadcast(sampler_type, size)
+
+    opc_class = _opc_methods[OPCMethod(opc_method)]
+    opc_correction = _opc_correction(opc_class)
+    min_eop, max_eop = opc_class._EOP_RANGE
+
+    dil_corr = None
+    if dilatancy_corr_method == DilatancyCorrectionMethod.WATER_AWARE:
+        # The water-aware correction depends only on the foundation.
+        dil_corr = min(
+            DilatancyCorrection2(0.0, foundation_size=foundation_size).correction(),
+            2.0,
+        )
+
+    std_spt_n_values = array("d", bytes(8 * size))
+    corrected_spt_n_values = array("d", bytes(8 * size))
+
+    for i in range(size):
+        energy_corr = _energy_correction(
+            energy_percentage[i],
+            borehole_diameter[i],
+            rod_length[i],
+            hammer_type[i],
+            sampler_type[i],
+        )
+        std_n = round(energy_corr * int(recorded_spt_n_values[i]), 1)
+
+        if not 0.0 <= std_n <= 100.0:
+            msg = f"Standardized SPT N-value {std_n} at index {i} must be <= 100.0"
+            raise ValidationError(msg)
+
+        eop_i = eop[i]
+        if not min_eop <= eop_i <= max_eop:
+            msg = (
+                f"eop: {eop_i} at index {i} must be between {min_eop} and "
+                f"{max_eop} for {opc_class.__name__}"
+            )
+            raise ValidationError(msg)
+
+        corr_n = round(min(opc_correction(eop_i), 2.0) * std_n, 1)
+
+        if dilatancy_corr_method is not None:
+            if not 0.0 <= corr_n <= 100.0:
+                msg = f"Corrected SPT N-value {corr_n} at index {i} must be <= 100.0"
+                raise ValidationError(msg)
+
+            if dil_corr is None:
+                corr_n = round(DilatancyCorrection._correct(corr_n), 1)
+            else:
+                corr_n = dil_corr * corr_n
+
+        std_spt_n_values[i] = std_n
+        corrected_spt_n_values[i] = corr_n
+
+    return SPTCorrectionResult(
+        std_spt_n_values=std_spt_n_values,
+        corrected_spt_n_values=corrected_spt_n_values,
+    )
+
+
 @validate_params
 def create_overburden_pressure_correction(
     std_spt_n_value: float,
@@ -706,3 +919,47 @@ def create_overburden_pressure_correction(
     opc_class = _opc_methods[opc_method]
     opc_corr = opc_class(std_spt_n_value=std_spt_n_value, eop=eop)
     return opc_corr
+
+
+def compare_opc_methods(
+    std_spt_n_values: Sequence[float],
+    eop: float | Sequence[float],
+) -> dict[OPCMethod, array]:
+    """Apply every overburden pressure correction method to a column of
+    standardized SPT N-values.
+
+    Returns a table mapping each [OPCMethod][geolysis.spt.OPCMethod] to
+    the corrected N-value of each reading. Where a reading is outside
+    the range a method accepts (e.g. `eop` above 280 $kPa$ for
+    `Gibbs & Holtz (1957)` or below 24 $kPa$ for `Peck et al. (1974)`),
+    the cell is masked with `nan` instead of raising. Unmasked cells are
+    identical to the result of
+    [create_overburden_pressure_correction][geolysis.spt.create_overburden_pressure_correction].
+
+    !!! info "Added in v0.25.0"
+
+    :param std_spt_n_values: SPT N-values standardized for field
+                             procedures.
+    :param eop: Effective overburden pressure at each reading ($kPa$).
+    """
+    size = len(std_spt_n_values)
+    eop = broadcast(eop, size)
+    table = {}
+
+    for opc_method, opc_class in _opc_methods.items():
+        opc_correction = _opc_correction(opc_class)
+        min_eop, max_eop = opc_class._EOP_RANGE
+        corrected_spt_n_values = array("d", [nan]) * size
+
+        for i, (std_n, eop_i) in enumerate(zip(std_spt_n_values, eop)):
+            if not (0.0 <= std_n <= 100.0 and min_eop <= eop_i <= max_eop):
+                continue
+            try:
+                corr = min(opc_correction(eop_i), 2.0)
+            except ZeroDivisionError:
+                continue
+            corrected_spt_n_values[i] = round(corr * std_n, 1)
+
+        table[opc_method] = corrected_spt_n_values
+
+    return table
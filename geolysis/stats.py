@@ -0,0 +1,470 @@
+import copy
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Annotated, Final, Iterable, Optional, Sequence
+
+from func_validator import (
+    MustBeBetween,
+    MustHaveLengthGreaterThan,
+    MustHaveValuesGreaterThan,
+    validate_params,
+)
+
+from .spt import SPTDesignMethod
+from .utils import inf, nan, sqrt
+
+__all__ = [
+    "P2Quantile",
+    "RunningStatistics",
+    "CharacteristicValues",
+    "LayerStatistics",
+]
+
+# One-sided 95% quantiles of the Student-t distribution for 1 to 30
+# degrees of freedom.
+_T_95: Final = (
+    6.314, 2.920, 2.353, 2.132, 2.015, 1.943, 1.895, 1.860, 1.833, 1.812,
+    1.796, 1.782, 1.771, 1.761, 1.753, 1.746, 1.740, 1.734, 1.729, 1.725,
+    1.721, 1.717, 1.714, 1.711, 1.708, 1.706, 1.703, 1.701, 1.699, 1.697,
+)  # fmt: skip
+
+_Z_95: Final = 1.6448536269514722
+
+
+def _t_95(dof: int) -> float:
+    """Return the one-sided 95% quantile of the Student-t distribution."""
+    if dof <= len(_T_95):
+        return _T_95[dof - 1]
+    # Cornish-Fisher expansion, accurate to 3 decimals beyond 30 dof.
+    z = _Z_95
+    return (
+        z
+        + (z**3 + z) / (4.0 * dof)
+        + (5.0 * z**5 + 16.0 * z**3 + 3.0 * z) / (96.0 * dof**2)
+    )
+
+
+def _exact_quantile(values: Sequence[float], p: float) -> float:
+    values = sorted(values)
+    pos = p * (len(values) - 1)
+    lo = int(pos)
+    if lo + 1 == len(values):
+        return values[lo]
+    return values[lo] + (values[lo + 1] - values[lo]) * (pos - lo)
+
+
+class P2Quantile:
+    r"""Streaming estimate of a quantile with the $P^2$ algorithm of
+    Jain & Chlamtac (1985).
+
+    Only five markers are kept whatever the number of observations. The
+    quantile is exact for up to five observations.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    @validate_params
+    def __init__(
+        self,
+        p: Annotated[float, MustBeBetween(min_value=0.0, max_value=1.0)],
+    ):
+        """
+        :param p: Probability of the quantile, e.g. `0.05` for the 5%
+                  fractile.
+        """
+        self.p = p
+        self._heights: list[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 2.0 * p, 4.0 * p, 2.0 + 2.0 * p, 4.0]
+        self._increments = (0.0, p / 2.0, p, (1.0 + p) / 2.0, 1.0)
+        self.count = 0
+
+    def add(self, value: float):
+        """Add an observation.
+
+        :param value: Observed value.
+        """
+        self.count += 1
+        q = self._heights
+
+        if self.count <= 5:
+            q.append(value)
+            if self.count == 5:
+                q.sort()
+            return
+
+        if value < q[0]:
+            q[0] = value
+            k = 0
+        elif value >= q[4]:
+            q[4] = value
+            k = 3
+        else:
+            k = min(bisect_right(q, value) - 1, 3)
+
+        n = self._positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        self._adjust()
+
+    def _adjust(self):
+        q, n = self._heights, self._positions
+        for i in (1, 2, 3):
+            d = self._desired[i] - n[i]
+            if (d >= 1.0 and n[i + 1] - n[i] > 1) or (
+                d <= -1.0 and n[i - 1] - n[i] < -1
+            ):
+                d = 1 if d > 0 else -1
+                # Piecewise parabolic prediction of the marker height,
+                # falling back to a linear one if it is not monotone.
+                qp = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not q[i - 1] < qp < q[i + 1]:
+                    qp = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = qp
+                n[i] += d
+
+    def extend(self, values: Iterable[float]):
+        """Add observations.
+
+        :param values: Observed values.
+        """
+        for value in values:
+            self.add(value)
+
+    @property
+    def value(self) -> float:
+        """Estimated quantile, `nan` when there are no observations."""
+        if self.count == 0:
+            return nan
+        if self.count <= 5:
+            return _exact_quantile(self._heights, self.p)
+        return self._heights[2]
+
+    def _cdf(self, x: float) -> float:
+        """Piecewise linear CDF through the markers."""
+        q, n = self._heights, self._positions
+        if x < q[0]:
+            return 0.0
+        if x >= q[4]:
+            return 1.0
+        i = bisect_left(q, x, 0, 4)
+        i = max(i, 1)
+        span = q[i] - q[i - 1]
+        frac = (x - q[i - 1]) / span if span else 1.0
+        pos = n[i - 1] + (n[i] - n[i - 1]) * frac
+        return pos / (self.count - 1)
+
+    def merge(self, other: "P2Quantile") -> "P2Quantile":
+        """Return the estimator of the union of both streams.
+
+        Observations are kept exactly while no more than five have been
+        added. Otherwise, the markers are placed on the mixture of the
+        piecewise linear distributions defined by the markers of each
+        estimator, so the merged quantile is an approximation.
+
+        :param other: Estimator of the same quantile over another
+                      stream.
+
+        :raises ValueError: Raised when the estimators are for different
+                            quantiles.
+        """
+        if self.p != other.p:
+            raise ValueError("Cannot merge estimators of different quantiles.")
+
+        if other.count <= 5:
+            merged = copy.deepcopy(self)
+            merged.extend(other._heights)
+            return merged
+        if self.count <= 5:
+            return other.merge(self)
+
+        merged = P2Quantile(self.p)
+        count = self.count + other.count
+        merged.count = count
+
+        # Invert the mixture CDF at the desired marker positions.
+        xs = sorted(self._heights + other._heights)
+        fs = [
+            (self.count * self._cdf(x) + other.count * other._cdf(x)) / count
+            for x in xs
+        ]
+        last = count - 1
+        fractions = (0.0, self.p / 2, self.p, (1 + self.p) / 2, 1.0)
+        desired = [f * last for f in fractions]
+        heights = []
+        for f in fractions:
+            j = min(max(bisect_left(fs, f), 1), len(xs) - 1)
+            df = fs[j] - fs[j - 1]
+            t = (f - fs[j - 1]) / df if df else 0.0
+            heights.append(xs[j - 1] + t * (xs[j] - xs[j - 1]))
+
+        positions = [0]
+        for i in (1, 2, 3):
+            pos = max(round(desired[i]), positions[-1] + 1)
+            positions.append(min(pos, last - 4 + i))
+        positions.append(last)
+
+        merged._heights = heights
+        merged._positions = positions
+        merged._desired = desired
+        return merged
+
+
+@dataclass(frozen=True, slots=True)
+class CharacteristicValues:
+    """Characteristic values of the corrected SPT N-values of a layer.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    count: int
+    """Number of readings."""
+
+    mean: float
+    """Mean N-value."""
+
+    std: float
+    """Sample standard deviation of the N-values."""
+
+    fractile_5: float
+    """Estimated 5% fractile of the N-values."""
+
+    lower_bound: float
+    r"""One-sided 95% Student-t lower bound of the mean N-value,
+    $\bar{N} - t_{0.95, n-1} \cdot s / \sqrt{n}$."""
+
+
+class RunningStatistics:
+    r"""Accumulates statistics of corrected SPT N-values in a single
+    pass.
+
+    The mean and variance are updated with Welford's algorithm and the
+    5% fractile with a [P2Quantile][geolysis.stats.P2Quantile] estimator,
+    so memory use does not grow with the number of readings. Partial
+    statistics computed on separate streams (e.g. by parallel workers)
+    can be combined with [merge][geolysis.stats.RunningStatistics.merge].
+
+    !!! info "Added in v0.25.0"
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = nan
+        self.min = inf
+        self.max = -inf
+        self._m2 = 0.0
+        self._fractile_5 = P2Quantile(0.05)
+        # Running sums of the weighted N-design; `None` once merged, as
+        # the weights depend on the order of the readings.
+        self._wgt_sums: Optional[tuple[float, float]] = (0.0, 0.0)
+
+    def __repr__(self) -> str:
+        return f"RunningStatistics(count={self.count}, mean={self.mean})"
+
+    def add(self, value: float):
+        """Add a corrected SPT N-value.
+
+        :param value: Corrected SPT N-value.
+        """
+        self.count += 1
+        if self.count == 1:
+            self.mean = 0.0
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        self._fractile_5.add(value)
+
+        if self._wgt_sums is not None:
+            wgt = 1.0 / self.count**2
+            total_wgted, total_wgt = self._wgt_sums
+            self._wgt_sums = (total_wgted + wgt * value, total_wgt + wgt)
+
+    def extend(self, values: Iterable[float]):
+        """Add corrected SPT N-values.
+
+        :param values: Corrected SPT N-values.
+        """
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "RunningStatistics") -> "RunningStatistics":
+        """Return the statistics of the union of both streams.
+
+        The count, mean, variance, minimum and maximum are combined
+        exactly (Chan et al., 1979); the 5% fractile is approximate.
+
+        :param other: Statistics of another stream.
+        """
+        merged = RunningStatistics()
+        count = self.count + other.count
+        if count == 0:
+            return merged
+
+        if self.count == 0 or other.count == 0:
+            merged.mean = self.mean if self.count else other.mean
+            merged._m2 = self._m2 + other._m2
+        else:
+            delta = other.mean - self.mean
+            merged.mean = self.mean + delta * other.count / count
+            merged._m2 = (
+                self._m2 + other._m2 + delta**2 * self.count * other.count / count
+            )
+
+        merged.count = count
+        merged.min = min(self.min, other.min)
+        merged.max = max(self.max, other.max)
+        merged._fractile_5 = self._fractile_5.merge(other._fractile_5)
+        merged._wgt_sums = None
+        return merged
+
+    @property
+    def variance(self) -> float:
+        """Sample variance, `nan` for fewer than two readings."""
+        if self.count < 2:
+            return nan
+        return self._m2 / (self.count - 1)
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation, `nan` for fewer than two readings."""
+        return sqrt(self.variance) if self.count >= 2 else nan
+
+    @property
+    def fractile_5(self) -> float:
+        """Estimated 5% fractile of the readings."""
+        return self._fractile_5.value
+
+    def n_design(self, method: SPTDesignMethod | str = "wgt") -> float:
+        """Return the SPT N-design of the readings, as in
+        [SPT.n_design][geolysis.spt.SPT.n_design].
+
+        :param method: SPT design method.
+
+        :raises ValueError: Raised when there are no readings, or the
+                            weighted method is used on merged
+                            statistics, since the weights depend on the
+                            order of the readings.
+        """
+        if self.count == 0:
+            raise ValueError("No SPT N-values have been added.")
+
+        method = SPTDesignMethod(method)
+        if method == SPTDesignMethod.MINIMUM:
+            n_design = self.min
+        elif method == SPTDesignMethod.AVERAGE:
+            n_design = self.mean
+        else:
+            if self._wgt_sums is None:
+                msg = "The weighted N-design is not available on merged statistics."
+                raise ValueError(msg)
+            total_wgted, total_wgt = self._wgt_sums
+            n_design = total_wgted / total_wgt
+
+        return round(n_design, ndigits=1)
+
+    def characteristic_values(self) -> CharacteristicValues:
+        """Return the characteristic values of the readings."""
+        if self.count >= 2:
+            lower_bound = self.mean - _t_95(self.count - 1) * self.std / sqrt(
+                self.count
+            )
+        else:
+            lower_bound = nan
+
+        return CharacteristicValues(
+            count=self.count,
+            mean=self.mean,
+            std=self.std,
+            fractile_5=self.fractile_5,
+            lower_bound=lower_bound,
+        )
+
+
+class LayerStatistics:
+    """Running statistics of corrected SPT N-values grouped by layer.
+
+    Readings are assigned to layers by depth. As in
+    [SoilProfile][geolysis.soil_profile.SoilProfile], each layer is
+    defined by the depth of its bottom, a reading on a boundary belongs
+    to the layer below it and the last layer extends indefinitely.
+
+    !!! info "Added in v0.25.0"
+    """
+
+    @validate_params
+    def __init__(
+        self,
+        layer_boundaries: Annotated[
+            Sequence[float],
+            MustHaveLengthGreaterThan(0),
+            MustHaveValuesGreaterThan(0.0),
+        ],
+    ):
+        """
+        :param layer_boundaries: Depth of the bottom of each layer, in
+                                 ascending order (m).
+
+        :raises ValueError: Raised when the layer boundaries are not in
+                            ascending order.
+        """
+        if any(a >= b for a, b in zip(layer_boundaries, layer_boundaries[1:])):
+            raise ValueError("layer_boundaries must be in ascending order.")
+
+        self.layer_boundaries = tuple(layer_boundaries)
+        self._layers = [RunningStatistics() for _ in layer_boundaries]
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def __getitem__(self, layer: int) -> RunningStatistics:
+        return self._layers[layer]
+
+    def _layer(self, depth: float) -> int:
+        return min(bisect_right(self.layer_boundaries, depth), len(self._layers) - 1)
+
+    def add(self, depth: float, value: float):
+        """Add a corrected SPT N-value.
+
+        :param depth: Depth of the reading (m).
+        :param value: Corrected SPT N-value.
+        """
+        self._layers[self._layer(depth)].add(value)
+
+    def extend(self, depths: Iterable[float], values: Iterable[float]):
+        """Add corrected SPT N-values.
+
+        :param depths: Depth of each reading (m).
+        :param values: Corrected SPT N-value of each reading.
+        """
+        for depth, value in zip(depths, values, strict=True):
+            self.add(depth, value)
+
+    def merge(self, other: "LayerStatistics") -> "LayerStatistics":
+        """Return the statistics of the union of both streams.
+
+        :param other: Statistics of another stream over the same layers.
+
+        :raises ValueError: Raised when the layers are different.
+        """
+        if self.layer_boundaries != other.layer_boundaries:
+            raise ValueError("Cannot merge statistics of different layers.")
+
+        merged = LayerStatistics(self.layer_boundaries)
+        merged._layers = [a.merge(b) for a, b in zip(self._layers, other._layers)]
+        return merged
+
+    def characteristic_values(self) -> list[CharacteristicValues]:
+        """Return the characteristic values of each layer."""
+        return [layer.characteristic_values() for layer in self._layers]
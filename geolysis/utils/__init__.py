@@ -1,11 +1,11 @@
 import enum
 import functools
-from typing import Callable
+from typing import Any, Callable, Sequence
 
 from . import math as m
 from .math import *
 
-__all__ = ["AbstractStrEnum", "round_"] + m.__all__
+__all__ = ["AbstractStrEnum", "round_", "broadcast"] + m.__all__
 
 
 class StrEnumMeta(enum.EnumMeta):
@@ -48,3 +48,21 @@ def round_(ndigits: int) -> Callable:
         return wrapper
 
     return dec
+
+
+def broadcast(value: Any, size: int) -> Sequence:
+    """Return `value` as a column of length `size`.
+
+    Scalars (including strings) are repeated `size` times, sequences
+    are returned unchanged.
+
+    ValueError is raised when a sequence does not have length `size`.
+    """
+    if isinstance(value, str) or not isinstance(value, Sequence):
+        return (value,) * size
+
+    if len(value) != size:
+        msg = f"Expected a column of length {size}, got {len(value)}."
+        raise ValueError(msg)
+
+    return value
@@ -0,0 +1,65 @@
+"""Time `correct_boreholes` on a synthetic dataset with an increasing
+number of worker processes.
+
+Usage: python scripts/benchmarks/parallel_correction.py [n_readings]
+"""
+
+import os
+import random
+import sys
+import time
+
+from geolysis.borehole import SPTDataset
+from geolysis.parallel import correct_boreholes
+from geolysis.soil_profile import SoilProfile
+from geolysis.spt import HammerType
+
+READINGS_PER_BOREHOLE = 20
+
+
+def synthetic_dataset(n_readings: int) -> SPTDataset:
+    rng = random.Random(0)
+    hammer_types = list(HammerType)
+    depths = [1.5 * (i % READINGS_PER_BOREHOLE + 1) for i in range(n_readings)]
+    return SPTDataset(
+        borehole_ids=[f"BH{i // READINGS_PER_BOREHOLE}" for i in range(n_readings)],
+        depths=depths,
+        recorded_spt_n_values=[rng.randint(5, 40) for _ in range(n_readings)],
+        rod_lengths=[depth + 1.0 for depth in depths],
+        hammer_types=[rng.choice(hammer_types) for _ in range(n_readings)],
+    )
+
+
+def main(n_readings: int):
+    dataset = synthetic_dataset(n_readings)
+    soil_profile = SoilProfile(
+        layer_boundaries=[5.0, 20.0, 80.0],
+        moist_unit_wgts=[17.0, 18.0, 19.0],
+        saturated_unit_wgts=[19.0, 20.0, 21.0],
+        ground_water_level=3.0,
+    )
+
+    workers = [1]
+    while workers[-1] * 2 <= (os.cpu_count() or 1):
+        workers.append(workers[-1] * 2)
+    if workers[-1] != os.cpu_count():
+        workers.append(os.cpu_count())
+
+    print(f"{len(dataset)} readings in {len(dataset.borehole_ids)} boreholes")
+    baseline = None
+    for max_workers in workers:
+        start = time.perf_counter()
+        correct_boreholes(
+            dataset, eop=soil_profile, max_workers=max_workers, opc_method="liao"
+        )
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(
+            f"{max_workers:>3} workers: {elapsed:7.2f} s "
+            f"({len(dataset) / elapsed:,.0f} readings/s, "
+            f"speed-up {baseline / elapsed:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
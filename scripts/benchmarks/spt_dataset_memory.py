@@ -0,0 +1,71 @@
+"""Compare the memory used to hold SPT readings as a list of
+`EnergyCorrection` objects and as an `SPTDataset`.
+
+Usage: python scripts/benchmarks/spt_dataset_memory.py [n_readings]
+"""
+
+import random
+import sys
+import tracemalloc
+
+from geolysis.borehole import SPTDataset
+from geolysis.spt import EnergyCorrection, HammerType
+
+READINGS_PER_BOREHOLE = 40
+
+
+def synthetic_readings(n_readings: int):
+    rng = random.Random(0)
+    hammer_types = list(HammerType)
+    for i in range(n_readings):
+        depth = 1.5 * (i % READINGS_PER_BOREHOLE + 1)
+        yield (
+            f"BH{i // READINGS_PER_BOREHOLE}",
+            depth,
+            rng.randint(1, 60),
+            depth + 1.0,
+            rng.choice(hammer_types),
+        )
+
+
+def measure(build) -> tuple[object, int]:
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def main(n_readings: int):
+    readings = list(synthetic_readings(n_readings))
+    borehole_ids, depths, n_values, rod_lengths, hammer_types = map(
+        list, zip(*readings)
+    )
+
+    def build_objects():
+        return [
+            EnergyCorrection(n, rod_length=rod_len, hammer_type=hammer_type)
+            for n, rod_len, hammer_type in zip(n_values, rod_lengths, hammer_types)
+        ]
+
+    def build_dataset():
+        return SPTDataset(
+            borehole_ids,
+            depths,
+            n_values,
+            rod_lengths=rod_lengths,
+            hammer_types=hammer_types,
+        )
+
+    _, objects_size = measure(build_objects)
+    dataset, dataset_size = measure(build_dataset)
+
+    print(f"readings:           {n_readings:>12,}")
+    print(f"EnergyCorrection:   {objects_size / 1e6:>12.2f} MB")
+    print(f"SPTDataset:         {dataset_size / 1e6:>12.2f} MB")
+    print(f"SPTDataset columns: {dataset.nbytes / 1e6:>12.2f} MB")
+    print(f"ratio:              {objects_size / dataset_size:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
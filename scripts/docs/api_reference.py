@@ -5,15 +5,42 @@ API_REFERENCE = {
     "geolysis.bearing_capacity.ubc": {
         "short_summary": "Ultimate bearing capacity classes.",
     },
+    "geolysis.io": {
+        "short_summary": "Readers, writers and streaming pipelines.",
+    },
+    "geolysis.borehole": {
+        "short_summary": "Borehole classes.",
+    },
+    "geolysis.correlations": {
+        "short_summary": "SPT correlation functions.",
+    },
     "geolysis.foundation": {
         "short_summary": "Foundation classes.",
     },
+    "geolysis.lab_tests": {
+        "short_summary": "Laboratory test reduction functions.",
+    },
+    "geolysis.liquefaction": {
+        "short_summary": "Liquefaction screening functions.",
+    },
+    "geolysis.parallel": {
+        "short_summary": "Parallel processing functions.",
+    },
     "geolysis.soil_classifier": {
         "short_summary": "Soil classifier classes.",
     },
+    "geolysis.soil_profile": {
+        "short_summary": "Soil profile classes.",
+    },
+    "geolysis.spatial": {
+        "short_summary": "Spatial interpolation classes.",
+    },
     "geolysis.spt": {
         "short_summary": "SPT classes.",
     },
+    "geolysis.stats": {
+        "short_summary": "Streaming statistics classes.",
+    },
     # "geolysis.exceptions": {
     #     "short_summary": "Exception classes.",
     # },
@@ -0,0 +1,125 @@
+import pytest
+
+from geolysis.bearing_capacity.abc import (
+    create_abc_4_cohesionless_soils,
+    size_footing,
+    size_footings,
+)
+from geolysis.borehole import Borehole
+
+SPT_DEPTHS = [1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 5.0, 6.0, 7.0, 8.0]
+SPT_N_VALUES = [8, 10, 12, 9, 14, 16, 18, 20, 22, 25, 27]
+
+
+class TestSizeFooting:
+
+    @pytest.mark.parametrize("abc_method", ["meyerhof", "terzaghi", "bowles"])
+    def test_size_footing(self, abc_method):
+        res = size_footing(
+            500.0,
+            1.5,
+            SPT_DEPTHS,
+            SPT_N_VALUES,
+            tol_settlement=25.0,
+            abc_method=abc_method,
+        )
+        # Sized footing must carry the applied load.
+        assert res.allowable_applied_load >= 500.0
+
+        abc = create_abc_4_cohesionless_soils(
+            corrected_spt_n_value=res.n_design,
+            tol_settlement=25.0,
+            depth=1.5,
+            width=res.width,
+            abc_method=abc_method,
+        )
+        assert abc.allowable_applied_load() == pytest.approx(
+            res.allowable_applied_load
+        )
+
+    def test_size_footing_converges(self):
+        res = size_footing(
+            500.0, 1.5, SPT_DEPTHS, SPT_N_VALUES, tol_settlement=25.0
+        )
+        assert res.converged
+        assert res.width == pytest.approx(1.61, abs=0.01)
+        assert res.n_design == pytest.approx(13.2)
+
+    @pytest.mark.parametrize(
+        ["abc_method", "applied_load", "spt_depths", "n_values"],
+        [
+            (
+                "terzaghi",
+                400.0,
+                [1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.5, 6.0, 8.0],
+                [12, 17, 5, 21, 25, 6, 40, 8, 31, 15],
+            ),
+            (
+                "bowles",
+                1500.0,
+                [2.0, 2.5, 4.0, 4.5, 5.5, 7.5, 9.0, 11.0, 11.5, 14.0],
+                [34, 6, 27, 16, 6, 22, 22, 16, 30, 3],
+            ),
+        ],
+    )
+    def test_minimum_width(self, abc_method, applied_load, spt_depths, n_values):
+        # The N-design is not monotone in the width for these boreholes,
+        # and the fixed-point iteration settles on a wider footing.
+        res = size_footing(
+            applied_load, 1.0, spt_depths, n_values, 25.0, abc_method=abc_method
+        )
+
+        # Brute force: the first width on a fine grid that carries the
+        # load with the N-design of its own influence zone.
+        borehole = Borehole(spt_depths, n_values)
+        start = 0.5 if abc_method == "bowles" else 0.0
+        width = 0.3
+        while True:
+            n_design = borehole.n_design(1.0, width, method="avg", start=start)
+            abc = create_abc_4_cohesionless_soils(
+                corrected_spt_n_value=n_design,
+                tol_settlement=25.0,
+                depth=1.0,
+                width=width,
+                abc_method=abc_method,
+            )
+            if abc.allowable_applied_load() >= applied_load:
+                break
+            width += 0.002
+
+        assert res.width == pytest.approx(width, abs=3e-3)
+        assert res.allowable_applied_load >= applied_load
+
+    def test_size_footings(self):
+        loads, depths = [200.0, 800.0, 1500.0], [1.0, 1.5, 2.0]
+        results = size_footings(
+            loads, depths, SPT_DEPTHS, SPT_N_VALUES, tol_settlement=25.0
+        )
+        assert len(results) == 3
+        assert [r.width for r in results] == sorted(r.width for r in results)
+        for load, res in zip(loads, results):
+            assert res.allowable_applied_load >= load
+
+    def test_errors(self):
+        # Footing cannot be sized within max_width
+        with pytest.raises(ValueError):
+            size_footing(
+                1e6,
+                1.5,
+                SPT_DEPTHS,
+                SPT_N_VALUES,
+                tol_settlement=25.0,
+                max_width=3.0,
+            )
+
+        # Not enough readings below the footing
+        with pytest.raises(ValueError):
+            size_footing(
+                500.0, 7.5, SPT_DEPTHS, SPT_N_VALUES, tol_settlement=25.0
+            )
+
+        # Mismatched schedule
+        with pytest.raises(ValueError):
+            size_footings(
+                [200.0, 300.0], [1.0], SPT_DEPTHS, SPT_N_VALUES, 25.0
+            )
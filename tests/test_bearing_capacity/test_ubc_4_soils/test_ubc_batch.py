@@ -0,0 +1,69 @@
+import pytest
+
+from geolysis.bearing_capacity.ubc import (
+    create_ubc_4_all_soils,
+    ultimate_bearing_capacities,
+    ultimate_bearing_capacities_from_spt,
+)
+from geolysis.correlations import correlate_spt_n_values
+from geolysis.exceptions import ValidationError
+
+
+@pytest.mark.parametrize(
+    ["ubc_method", "shape"],
+    [("vesic", "square"), ("vesic", "strip"), ("terzaghi", "circle")],
+)
+def test_ultimate_bearing_capacities(ubc_method, shape):
+    friction_angles = [20.0, 25.0, 30.0, 35.0]
+    cohesions = [20.0, 10.0, 0.0, 0.0]
+    depths = [1.0, 1.5, 1.5, 2.0]
+
+    res = ultimate_bearing_capacities(
+        friction_angles,
+        cohesions=cohesions,
+        moist_unit_wgts=18.0,
+        depth=depths,
+        width=2.0,
+        ground_water_level=1.2,
+        shape=shape,
+        ubc_method=ubc_method,
+    )
+
+    for i in range(len(friction_angles)):
+        ubc = create_ubc_4_all_soils(
+            friction_angle=friction_angles[i],
+            cohesion=cohesions[i],
+            moist_unit_wgt=18.0,
+            depth=depths[i],
+            width=2.0,
+            ground_water_level=1.2,
+            shape=shape,
+            ubc_method=ubc_method,
+        )
+        assert res.ultimate_bearing_capacities[i] == ubc.ultimate_bearing_capacity()
+        assert (
+            res.allowable_bearing_capacities[i] == ubc.allowable_bearing_capacity()
+        )
+        assert res.allowable_applied_loads[i] == ubc.allowable_applied_load()
+
+
+def test_ultimate_bearing_capacities_from_spt():
+    n_values = [5.0, 15.0, 25.0]
+    res = ultimate_bearing_capacities_from_spt(n_values, depth=1.5, width=2.0)
+    soils = correlate_spt_n_values(n_values)
+
+    expected = ultimate_bearing_capacities(
+        soils.friction_angles,
+        cohesions=0.0,
+        moist_unit_wgts=soils.moist_unit_wgts,
+        depth=1.5,
+        width=2.0,
+    )
+    assert res == expected
+
+
+def test_errors():
+    with pytest.raises(ValidationError):
+        ultimate_bearing_capacities([30.0, -1.0], 0.0, 18.0, 1.5, 2.0)
+    with pytest.raises(ValueError):
+        ultimate_bearing_capacities([30.0, 32.0], [0.0], 18.0, 1.5, 2.0)
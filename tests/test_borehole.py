@@ -0,0 +1,160 @@
+import math
+
+import pytest
+
+from geolysis.borehole import Borehole, SPTDataset
+from geolysis.exceptions import ValidationError
+from geolysis.spt import SPT, HammerType, SamplerType, correct_spt_n_values
+
+
+@pytest.fixture
+def borehole():
+    # Readings are deliberately not sorted by depth.
+    return Borehole(
+        depths=[3.0, 1.5, 4.5, 6.0, 7.5, 9.0],
+        corrected_spt_n_values=[15.0, 7.0, 18.0, 22.0, 25.0, 30.0],
+        borehole_id="BH1",
+    )
+
+
+class TestBorehole:
+
+    def test_sorted_by_depth(self, borehole):
+        assert list(borehole.depths) == [1.5, 3.0, 4.5, 6.0, 7.5, 9.0]
+        assert list(borehole.corrected_spt_n_values) == [
+            7.0, 15.0, 18.0, 22.0, 25.0, 30.0,
+        ]
+        assert len(borehole) == 6
+
+    def test_n_values_between(self, borehole):
+        assert list(borehole.n_values_between(3.0, 6.0)) == [15.0, 18.0, 22.0]
+        assert list(borehole.n_values_between(10.0, 12.0)) == []
+
+    @pytest.mark.parametrize(
+        ["depth", "width", "start", "expected"],
+        [
+            (1.5, 1.5, 0.0, [7.0, 15.0, 18.0]),
+            (1.5, 1.5, 0.5, [15.0, 18.0]),
+            # Fewer than two readings in the zone
+            (1.0, 0.2, 0.0, [7.0, 15.0]),
+        ],
+    )
+    def test_influence_zone(self, borehole, depth, width, start, expected):
+        zone = borehole.influence_zone(depth, width, start=start)
+        assert list(zone) == expected
+
+    @pytest.mark.parametrize("method", ["min", "avg", "wgt"])
+    def test_n_design(self, borehole, method):
+        zone = borehole.influence_zone(1.5, 1.5)
+        expected = SPT(list(zone), method=method).n_design()
+        assert borehole.n_design(1.5, 1.5, method=method) == expected
+
+    def test_errors(self, borehole):
+        # Not enough readings below the foundation
+        with pytest.raises(ValueError):
+            borehole.influence_zone(8.0, 1.0)
+
+        # Mismatched columns
+        with pytest.raises(ValueError):
+            Borehole([1.5, 3.0], [7.0])
+
+        # N-value greater than 100
+        with pytest.raises(ValidationError):
+            Borehole([1.5, 3.0], [7.0, 120.0])
+
+        # N-value of 0, which SPT rejects as well
+        with pytest.raises(ValidationError):
+            Borehole([1.5, 3.0], [0.0, 7.0])
+
+
+class TestRollingNDesign:
+
+    @pytest.mark.parametrize("method", ["min", "avg", "wgt"])
+    @pytest.mark.parametrize("start", [0.0, 0.5])
+    def test_matches_n_design(self, borehole, method, start):
+        depths = [0.5 + 0.25 * i for i in range(24)]
+        rolling = borehole.rolling_n_design(depths, 1.5, method=method, start=start)
+
+        assert len(rolling) == len(depths)
+        for depth, n_design in zip(depths, rolling):
+            try:
+                expected = borehole.n_design(depth, 1.5, method=method, start=start)
+            except ValueError:
+                assert math.isnan(n_design)
+            else:
+                assert n_design == expected
+
+    def test_errors(self, borehole):
+        with pytest.raises(ValueError):
+            borehole.rolling_n_design([1.5], 1.5, method="max")
+
+
+class TestSPTDataset:
+
+    @pytest.fixture
+    def dataset(self):
+        return SPTDataset(
+            borehole_ids=["BH1", "BH2", "BH1", "BH2", "BH1"],
+            depths=[3.0, 1.5, 1.5, 3.0, 4.5],
+            recorded_spt_n_values=[10, 12, 8, 20, 25],
+            rod_lengths=[4.0, 2.5, 2.5, 4.0, 5.5],
+            hammer_types=["automatic", "donut_1", "safety", "drop", "automatic"],
+        )
+
+    def test_columns(self, dataset):
+        assert len(dataset) == 5
+        assert dataset.borehole_ids == ("BH1", "BH2")
+        assert list(dataset.depths) == [1.5, 3.0, 4.5, 1.5, 3.0]
+        assert list(dataset.recorded_spt_n_values) == [8, 10, 25, 12, 20]
+        assert dataset.hammer_types[0] is HammerType.SAFETY
+        assert list(dataset.sampler_types) == [SamplerType.STANDARD] * 5
+
+    def test_rows(self, dataset):
+        assert dataset.rows("BH1") == slice(0, 3)
+        assert dataset.rows("BH2") == slice(3, 5)
+        assert dataset.rows("BH1", top=2.0, bottom=4.5) == slice(1, 3)
+
+        with pytest.raises(KeyError):
+            dataset.rows("BH3")
+
+    def test_correct(self, dataset):
+        rows = dataset.rows("BH1")
+        res = dataset.correct(rows, eop=[27.0, 54.0, 81.0])
+        expected = correct_spt_n_values(
+            [8, 10, 25],
+            eop=[27.0, 54.0, 81.0],
+            rod_length=[2.5, 4.0, 5.5],
+            hammer_type=["safety", "automatic", "automatic"],
+        )
+        assert res == expected
+
+        borehole = dataset.borehole("BH1", res.corrected_spt_n_values)
+        assert list(borehole.depths) == [1.5, 3.0, 4.5]
+        assert borehole.borehole_id == "BH1"
+
+    @pytest.mark.parametrize(
+        "rod_lengths",
+        [[4.1, 4.0000001], [3.9999999, 6.0000001], [10.0000001, 9.9999999]],
+    )
+    def test_correct_near_rod_length_boundaries(self, rod_lengths):
+        dataset = SPTDataset(
+            ["BH1", "BH1"], [1.0, 2.0], [10, 12], rod_lengths=rod_lengths
+        )
+        res = dataset.correct(eop=[50.0, 50.0])
+        expected = correct_spt_n_values(
+            [10, 12], eop=[50.0, 50.0], rod_length=rod_lengths
+        )
+        assert list(dataset.rod_lengths) == rod_lengths
+        assert res == expected
+
+    @pytest.mark.parametrize("n_value", [256, 101, -1, 12.7])
+    def test_invalid_recorded_n_value(self, n_value):
+        with pytest.raises(ValidationError):
+            SPTDataset(["BH1", "BH1"], [1.5, 3.0], [10, n_value])
+
+    def test_errors(self):
+        with pytest.raises(ValidationError):
+            SPTDataset(["BH1"], [1.5], [10], hammer_types=["manual"])
+
+        with pytest.raises(ValueError):
+            SPTDataset(["BH1", "BH1"], [1.5, 3.0], [10])
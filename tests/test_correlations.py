@@ -0,0 +1,44 @@
+import pytest
+
+from geolysis.correlations import (
+    correlate_spt_n_values,
+    friction_angles,
+    moist_unit_wgts,
+    relative_densities,
+)
+from geolysis.exceptions import ValidationError
+
+
+@pytest.mark.parametrize(
+    ["method", "expected"],
+    [
+        ("peck_hanson_thornburn", [27.1, 28.6, 31.5, 34.3]),
+        ("hatanaka_uchida", [20.0, 30.0, 37.3, 42.4]),
+    ],
+)
+def test_friction_angles(method, expected):
+    assert list(friction_angles([0.0, 5.0, 15.0, 25.0], method)) == expected
+
+
+def test_relative_densities():
+    assert list(relative_densities([15.0, 60.0, 80.0])) == [50.0, 100.0, 100.0]
+
+
+def test_moist_unit_wgts():
+    assert list(moist_unit_wgts([0.0, 7.0, 13.5, 60.0, 80.0])) == [
+        13.5, 16.0, 17.2, 21.5, 21.5,
+    ]
+
+
+def test_correlate_spt_n_values():
+    soils = correlate_spt_n_values([5.0, 25.0], "hatanaka_uchida")
+    assert list(soils.friction_angles) == [30.0, 42.4]
+    assert list(soils.relative_densities) == [28.9, 64.5]
+    assert list(soils.moist_unit_wgts) == [15.0, 18.8]
+
+
+def test_errors():
+    with pytest.raises(ValidationError):
+        friction_angles([10.0, -1.0])
+    with pytest.raises(ValidationError):
+        friction_angles([10.0], method="unknown")
@@ -0,0 +1,71 @@
+import io
+import math
+
+import pytest
+
+from geolysis.io import read_ags4
+
+AGS4_FILE = """\
+"GROUP","PROJ"
+"HEADING","PROJ_ID","PROJ_NAME"
+"UNIT","",""
+"TYPE","ID","X"
+"DATA","P001","Site investigation"
+
+"GROUP","ISPT"
+"HEADING","LOCA_ID","ISPT_TOP","ISPT_NVAL","ISPT_ERAT"
+"UNIT","","m","","%"
+"TYPE","ID","2DP","0DP","0DP"
+"DATA","BH1","1.50","12","60"
+"DATA","BH1","3.00","18","60"
+"DATA","BH2","1.50","8",""
+
+"GROUP","LLPL"
+"HEADING","LOCA_ID","SPEC_DPTH","LLPL_LL","LLPL_PL","LLPL_PI"
+"UNIT","","m","%","%","%"
+"TYPE","ID","2DP","0DP","0DP","0DP"
+"DATA","BH1","2.00","35","18","17"
+"""
+
+
+def test_read_ags4():
+    chunks = list(read_ags4(io.StringIO(AGS4_FILE)))
+
+    assert [c.group for c in chunks] == ["ISPT", "LLPL"]
+
+    ispt, llpl = chunks
+    assert len(ispt) == 3
+    assert ispt["LOCA_ID"] == ["BH1", "BH1", "BH2"]
+    assert ispt["ISPT_TOP"].tolist() == [1.5, 3.0, 1.5]
+    assert ispt["ISPT_NVAL"].tolist() == [12.0, 18.0, 8.0]
+    assert math.isnan(ispt["ISPT_ERAT"][2])
+    assert ispt.units["ISPT_TOP"] == "m"
+
+    assert llpl["LLPL_LL"].tolist() == [35.0]
+
+
+def test_read_ags4_chunks():
+    chunks = list(read_ags4(io.StringIO(AGS4_FILE), ["ISPT"], chunk_size=2))
+
+    assert [len(c) for c in chunks] == [2, 1]
+    assert chunks[1]["LOCA_ID"] == ["BH2"]
+
+    # The chunk size is checked on the call, before the file is read.
+    with pytest.raises(ValueError):
+        read_ags4(io.StringIO(AGS4_FILE), chunk_size=0)
+
+
+@pytest.mark.parametrize(
+    "data_row",
+    [
+        '"DATA","BH1","1.50","12"',  # Missing value
+        '"DATA","BH1","1.50","12","high"',  # Non-numeric value
+    ],
+)
+def test_read_ags4_errors(data_row):
+    ags4 = AGS4_FILE.replace('"DATA","BH2","1.50","8",""', data_row)
+    with pytest.raises(ValueError):
+        list(read_ags4(io.StringIO(ags4)))
+
+    with pytest.raises(ValueError):
+        list(read_ags4(io.StringIO('"GROUP","ISPT"\n"DATA","BH1"\n')))
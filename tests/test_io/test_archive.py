@@ -0,0 +1,133 @@
+import gc
+from array import array
+
+import pytest
+
+from geolysis.borehole import SPTDataset
+from geolysis.io import (
+    ColumnArchive,
+    open_archive,
+    open_spt_archive,
+    write_archive,
+    write_spt_archive,
+)
+from geolysis.spt import HammerType
+
+
+@pytest.fixture
+def dataset():
+    return SPTDataset(
+        borehole_ids=["BH1", "BH2", "BH1", "BH2", "BH1"],
+        depths=[3.0, 1.5, 1.5, 3.0, 4.5],
+        recorded_spt_n_values=[10, 12, 8, 20, 25],
+        rod_lengths=[4.0, 2.5, 2.5, 4.0, 5.5],
+        hammer_types=["automatic", "donut_1", "safety", "drop", "automatic"],
+    )
+
+
+@pytest.fixture
+def archive_path(tmp_path, dataset):
+    path = tmp_path / "spt.bin"
+    with open(path, "wb") as file:
+        write_spt_archive(file, dataset)
+    return path
+
+
+def test_spt_archive_round_trip(archive_path, dataset):
+    archived = open_spt_archive(archive_path)
+
+    assert archived.borehole_ids == dataset.borehole_ids
+    assert list(archived.depths) == list(dataset.depths)
+    assert list(archived.recorded_spt_n_values) == [8, 10, 25, 12, 20]
+    assert list(archived.rod_lengths) == list(dataset.rod_lengths)
+    assert list(archived.hammer_types) == list(dataset.hammer_types)
+    assert archived.hammer_types[3] is HammerType.DONUT_1
+    assert archived.nbytes == dataset.nbytes
+    # Offsets are fixed-width so that archives are portable.
+    assert archived._offsets.format == "Q"
+
+
+def test_spt_archive_owner(archive_path, dataset):
+    archived = open_spt_archive(archive_path)
+    assert isinstance(archived._owner, ColumnArchive)
+    assert dataset._owner is None
+
+    # The columns stay readable without another reference to the archive.
+    gc.collect()
+    assert list(archived.depths) == list(dataset.depths)
+
+
+def test_spt_archive_random_access(archive_path, dataset):
+    archived = open_spt_archive(archive_path)
+
+    assert archived.rows("BH2") == dataset.rows("BH2")
+    assert archived.rows("BH1", top=2.0) == slice(1, 3)
+
+    eop = [27.0, 54.0]
+    rows = archived.rows("BH2")
+    res = archived.correct(rows, eop=eop)
+    assert list(res.corrected_spt_n_values) == list(
+        dataset.correct(rows, eop=eop).corrected_spt_n_values
+    )
+
+
+def test_column_archive(tmp_path):
+    path = tmp_path / "lab.bin"
+    columns = {
+        "liquid_limit": array("d", [35.0, 42.5, 60.0]),
+        "plastic_limit": array("d", [18.0, 21.0, 28.5]),
+        "fines": array("f", [55.0, 62.0, 80.0]),
+    }
+    with open(path, "wb") as file:
+        write_archive(file, columns, kind="lab")
+
+    with open_archive(path) as archive:
+        assert archive.kind == "lab"
+        assert archive.columns == ("liquid_limit", "plastic_limit", "fines")
+        assert archive["liquid_limit"].tolist() == [35.0, 42.5, 60.0]
+        assert archive["fines"].tolist() == [55.0, 62.0, 80.0]
+        assert list(archive.group_offsets) == [0, 3]
+
+
+def test_close_with_exported_views(tmp_path):
+    path = tmp_path / "lab.bin"
+    with open(path, "wb") as file:
+        write_archive(file, {"a": array("d", [1.0, 2.0, 3.0])}, kind="lab")
+
+    with open_archive(path) as archive:
+        column = archive["a"]
+        tail = column[1:]
+        raw = column.cast("B")
+
+    # The views handed out are released, their slices and casts are not.
+    with pytest.raises(ValueError):
+        column.tolist()
+    assert tail.tolist() == [2.0, 3.0]
+    assert len(raw) == 24
+
+
+def test_archive_errors(tmp_path):
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"not an archive at all")
+    with pytest.raises(ValueError):
+        open_archive(path)
+
+    with open(tmp_path / "lab.bin", "wb") as file:
+        with pytest.raises(ValueError):
+            write_archive(file, {"a": array("d", [1.0]), "b": array("d", [])})
+        write_archive(file, {"a": array("d", [1.0])}, kind="lab")
+
+    with pytest.raises(ValueError):
+        open_spt_archive(tmp_path / "lab.bin")
+
+
+def test_archive_itemsize_mismatch(tmp_path):
+    path = tmp_path / "lab.bin"
+    with open(path, "wb") as file:
+        write_archive(file, {"a": array("d", [1.0, 2.0])}, kind="lab")
+
+    # E.g. an "L" column written on Linux and read on Windows.
+    data = path.read_bytes()
+    path.write_bytes(data.replace(b'"itemsize": 8', b'"itemsize": 4', 1))
+    with pytest.raises(ValueError):
+        open_archive(path)
@@ -0,0 +1,192 @@
+import csv
+import io
+import random
+from array import array
+
+import pytest
+
+from geolysis.exceptions import ValidationError
+from geolysis.io import (
+    ClassificationIndex,
+    LabColumns,
+    classify_lab_csv,
+    write_archive,
+)
+from geolysis.io._lab_pipeline import _main
+from geolysis.soil_classifier import (
+    create_aashto_classifier,
+    create_uscs_classifier,
+)
+
+HEADER = "sample,liquid_limit,plastic_limit,fines,sand,d_10,d_30,d_60,organic\n"
+
+
+@pytest.fixture
+def samples():
+    rng = random.Random(5)
+    samples = []
+    for i in range(50):
+        liquid_lmt = round(rng.uniform(10, 80), 1)
+        plastic_lmt = round(rng.uniform(0, liquid_lmt), 1)
+        fines = round(rng.uniform(0, 100), 1)
+        sand = round(rng.uniform(0, 100 - fines), 1)
+        sizes = ("0.07", "0.3", "0.8") if i % 2 else ("", "", "")
+        organic = "yes" if i % 7 == 0 else "no"
+        samples.append(
+            (f"S{i}", liquid_lmt, plastic_lmt, fines, sand, *sizes, organic)
+        )
+    return samples
+
+
+@pytest.fixture
+def lab_csv(samples):
+    return HEADER + "".join(",".join(map(str, s)) + "\n" for s in samples)
+
+
+def expected_symbols(sample):
+    _, ll, pl, fines, sand, d_10, d_30, d_60, organic = sample
+    sizes = [float(d) if d else None for d in (d_10, d_30, d_60)]
+    uscs_clf = create_uscs_classifier(
+        ll, pl, fines, sand, *sizes, organic=organic == "yes"
+    )
+    aashto_clf = create_aashto_classifier(ll, pl, fines)
+    return uscs_clf.classify().symbol, aashto_clf.classify().symbol
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_classify_lab_csv(samples, lab_csv, max_workers):
+    dst = io.StringIO()
+    progress = []
+    stats = classify_lab_csv(
+        io.StringIO(lab_csv),
+        dst,
+        chunk_size=8,
+        max_workers=max_workers,
+        progress=progress.append,
+    )
+
+    assert (stats.rows, stats.chunks) == (50, 7)
+    assert [s.rows for s in progress] == [8, 16, 24, 32, 40, 48, 50]
+
+    rows = list(csv.DictReader(io.StringIO(dst.getvalue())))
+    assert [r["sample"] for r in rows] == [s[0] for s in samples]
+    for row, sample in zip(rows, samples):
+        assert (row["uscs"], row["aashto"]) == expected_symbols(sample)
+
+
+def test_custom_columns():
+    src = io.StringIO("LL,PL,F,S\n27.5,13.8,54.23,45.69\n")
+    dst = io.StringIO()
+    columns = LabColumns(
+        liquid_limit="LL", plastic_limit="PL", fines="F", sand="S", uscs_symbol="U"
+    )
+    classify_lab_csv(src, dst, columns=columns, max_workers=1)
+    assert dst.getvalue().splitlines() == [
+        "LL,PL,F,S,U,aashto",
+        "27.5,13.8,54.23,45.69,CL,A-6(5)",
+    ]
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="Missing columns: sand"):
+        classify_lab_csv(
+            io.StringIO("liquid_limit,plastic_limit,fines\n"),
+            io.StringIO(),
+            max_workers=1,
+        )
+
+    src = io.StringIO(HEADER + "S1,30,20,50,20,,,,no\nS2,30,40,50,20,,,,no\n")
+    with pytest.raises(ValidationError, match="row 1: Sample 1"):
+        classify_lab_csv(src, io.StringIO(), max_workers=1)
+
+    # The second sample is missing its trailing cells.
+    short = HEADER + "S1,30,20,50,20,,,,no\nS2,30,20,50,20\n"
+    for index in (None, ClassificationIndex()):
+        with pytest.raises(ValueError, match="Row 2: expected 9 cells, got 5"):
+            classify_lab_csv(
+                io.StringIO(short), io.StringIO(), max_workers=1, index=index
+            )
+
+
+def test_cli(tmp_path, lab_csv, capsys):
+    src, dst = tmp_path / "lab.csv", tmp_path / "classified.csv"
+    src.write_text(lab_csv)
+
+    assert _main(["classify-lab", str(src), str(dst), "--workers", "1"]) == 0
+
+    assert len(dst.read_text().splitlines()) == 51
+    assert "50 rows classified" in capsys.readouterr().err
+
+    args = ["classify-lab", str(src), str(dst), "--workers", "1"]
+    index = str(tmp_path / "lab.idx")
+    _main([*args, "--index", index])
+    _main([*args, "--index", index])
+    assert "50 reused" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_incremental_classification(tmp_path, samples, lab_csv, max_workers):
+    path = str(tmp_path / "lab.idx")
+    index = ClassificationIndex.load(path)
+    assert len(index) == 0
+
+    first = io.StringIO()
+    stats = classify_lab_csv(
+        io.StringIO(lab_csv),
+        first,
+        chunk_size=8,
+        max_workers=max_workers,
+        index=index,
+    )
+    assert stats.reused == 0
+    index.save(path)
+
+    # Change one sample and add another.
+    lines = lab_csv.splitlines(keepends=True)
+    lines[3] = "S2,45.0,16.0,60.0,30.0,,,,no\n"
+    lines.append("S50,30.8,20.7,10.29,81.89,0.07,0.3,0.8,no\n")
+
+    index = ClassificationIndex.load(path)
+    assert len(index) == len(set(lab_csv.splitlines()[1:]))
+    second = io.StringIO()
+    progress = []
+    stats = classify_lab_csv(
+        io.StringIO("".join(lines)),
+        second,
+        chunk_size=8,
+        max_workers=max_workers,
+        index=index,
+        progress=progress.append,
+    )
+    assert (stats.rows, stats.reused) == (51, 49)
+    # Reused rows are only counted once written.
+    assert [s.reused for s in progress] == [7, 15, 23, 31, 39, 47, 49]
+
+    rows = list(csv.DictReader(io.StringIO(second.getvalue())))
+    assert (rows[2]["uscs"], rows[2]["aashto"]) == ("CL", "A-7-6(13)")
+    assert rows[-1]["uscs"] == "SW-SC"
+    for row, sample in zip(rows[3:50], samples[3:]):
+        assert (row["uscs"], row["aashto"]) == expected_symbols(sample)
+
+
+def test_index_prune(tmp_path, lab_csv):
+    path = str(tmp_path / "lab.idx")
+    index = ClassificationIndex()
+    classify_lab_csv(io.StringIO(lab_csv), io.StringIO(), max_workers=1, index=index)
+    index.save(path)
+
+    index = ClassificationIndex.load(path)
+    head = "".join(lab_csv.splitlines(keepends=True)[:3])
+    classify_lab_csv(io.StringIO(head), io.StringIO(), max_workers=1, index=index)
+    index.save(path, prune=True)
+
+    assert len(ClassificationIndex.load(path)) == 2
+
+
+def test_index_errors(tmp_path):
+    path = tmp_path / "other.bin"
+    with open(path, "wb") as file:
+        write_archive(file, {"x": array("d", [1.0])})
+
+    with pytest.raises(ValueError):
+        ClassificationIndex.load(str(path))
@@ -0,0 +1,77 @@
+import io
+
+import pytest
+
+from geolysis.io import SPTColumns, correct_spt_csv, correct_spt_records
+from geolysis.soil_profile import SoilProfile
+from geolysis.spt import correct_spt_n_value
+
+CSV_LOG = """\
+borehole,depth,spt_n,eop,rod_length,hammer_type
+BH1,1.5,12,27.0,2.5,automatic
+BH1,3.0,18,54.0,4.0,automatic
+BH1,4.5,25,81.0,5.5,
+BH2,1.5,8,27.0,2.5,donut_1
+BH2,3.0,14,54.0,4.0,donut_1
+"""
+
+
+def test_correct_spt_records():
+    records = [
+        {"spt_n": "12", "eop": "27.0"},
+        {"spt_n": "18", "eop": "54.0"},
+        {"spt_n": "25", "eop": "81.0"},
+    ]
+    corrected = list(correct_spt_records(records, chunk_size=2))
+
+    assert len(corrected) == 3
+    for rec, out in zip(records, corrected):
+        assert out["spt_n"] == rec["spt_n"]
+        assert out["corrected_spt_n"] == correct_spt_n_value(
+            int(rec["spt_n"]), eop=float(rec["eop"])
+        )
+
+
+def test_correct_spt_records_custom_columns():
+    records = [{"N": "12", "sigma_v": "27.0"}, {"N": "18", "sigma_v": "54.0"}]
+    columns = SPTColumns(
+        recorded_spt_n_value="N", eop="sigma_v", corrected_spt_n_value="N1"
+    )
+    corrected = list(correct_spt_records(records, columns=columns))
+    assert corrected[1]["N1"] == correct_spt_n_value(18, eop=54.0)
+
+
+def test_correct_spt_csv():
+    dst = io.StringIO()
+    stats = correct_spt_csv(io.StringIO(CSV_LOG), dst, chunk_size=2)
+
+    assert stats.rows == 5
+    assert stats.boreholes == 2
+    assert stats.rows_per_second > 0.0
+
+    lines = dst.getvalue().splitlines()
+    assert lines[0].endswith("std_spt_n,corrected_spt_n")
+    assert len(lines) == 6
+
+    # Missing hammer type falls back to the default hammer.
+    *_, std_n, corr_n = lines[3].split(",")
+    assert float(corr_n) == correct_spt_n_value(25, eop=81.0, rod_length=5.5)
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_errors(chunk_size):
+    # The chunk size is checked on the call, before any record is read.
+    with pytest.raises(ValueError):
+        correct_spt_records([{"spt_n": "12", "eop": "27.0"}], chunk_size=chunk_size)
+
+    dst = io.StringIO()
+    with pytest.raises(ValueError):
+        correct_spt_csv(io.StringIO(CSV_LOG), dst, chunk_size=chunk_size)
+    assert dst.getvalue() == ""
+
+
+def test_correct_spt_records_with_soil_profile():
+    soil_profile = SoilProfile([10.0], moist_unit_wgts=[18.0], saturated_unit_wgts=[20.0])
+    records = [{"depth": "1.5", "spt_n": "12"}, {"depth": "3.0", "spt_n": "18"}]
+    corrected = list(correct_spt_records(records, soil_profile=soil_profile))
+    assert corrected[1]["corrected_spt_n"] == correct_spt_n_value(18, eop=54.0)
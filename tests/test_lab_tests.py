@@ -0,0 +1,132 @@
+import pytest
+
+from geolysis.exceptions import ValidationError
+from geolysis.lab_tests import fit_liquid_limits, reduce_sieve_analyses
+from geolysis.soil_classifier import (
+    classify_aashto,
+    classify_uscs,
+    create_uscs_classifier,
+)
+from geolysis.utils import isnan, log10, nan
+
+SIEVE_SIZES = [4.75, 2.0, 0.85, 0.425, 0.25, 0.15, 0.075]
+
+
+class TestReduceSieveAnalyses:
+    @pytest.fixture
+    def res(self):
+        return reduce_sieve_analyses(
+            SIEVE_SIZES,
+            [[0, 40, 60, 90, 80, 70, 40], [10, 20, 30, 40, 50, 60, 70]],
+            pan_masses=[20, 120],
+        )
+
+    def test_percent_passing(self, res):
+        assert list(res.sieve_sizes[0]) == sorted(SIEVE_SIZES)
+        assert list(res.percent_passing[0]) == pytest.approx(
+            [5.0, 15.0, 32.5, 52.5, 75.0, 90.0, 100.0]
+        )
+
+    def test_fractions(self, res):
+        assert list(res.fines) == pytest.approx([5.0, 30.0])
+        assert list(res.sands) == pytest.approx([95.0, 67.5])
+
+    def test_particle_sizes(self, res):
+        # Halfway between 0.075mm and 0.15mm on a log scale.
+        assert res.d_10[0] == pytest.approx((0.075 * 0.15) ** 0.5)
+        assert res.d_30[0] == pytest.approx(0.2324, abs=1e-4)
+        assert res.d_60[0] == pytest.approx(0.5355, abs=1e-4)
+        assert isnan(res.d_10[1])
+        assert res.d_30[1] == pytest.approx(0.075)
+
+    def test_classification(self, res):
+        uscs_res = classify_uscs(
+            [30.0, 30.0],
+            [22.0, 22.0],
+            res.fines,
+            res.sands,
+            res.d_10,
+            res.d_30,
+            res.d_60,
+        )
+        assert res.psd(1).size_dist.d_10 is None
+        for i, clf in enumerate(uscs_res):
+            psd = res.psd(i)
+            uscs_clf = create_uscs_classifier(
+                30.0, 22.0, psd.fines, psd.sand, *psd.size_dist
+            )
+            assert clf == uscs_clf.classify()
+
+    def test_ragged_and_padded(self):
+        res = reduce_sieve_analyses(
+            [[2.0, 0.425, 0.075], [2.0, 0.425, 0.075, nan]],
+            [[0, 50, 30], [0, 50, 30, nan]],
+            pan_masses=20,
+        )
+        assert list(res.fines) == [20.0, 20.0]
+        # No mass retained on the coarsest sieve, so all of it passes the
+        # No. 4 sieve.
+        assert list(res.sands) == [80.0, 80.0]
+
+    def test_errors(self):
+        with pytest.raises(ValidationError):
+            reduce_sieve_analyses([2.0, 0.075], [[10, -1]])
+
+        with pytest.raises(ValidationError):
+            reduce_sieve_analyses([2.0, 0.075], [[0, 0]])
+
+        with pytest.raises(ValueError):
+            reduce_sieve_analyses([2.0, 0.075], [[10, 10, 10]])
+
+
+class TestFitLiquidLimits:
+    @pytest.fixture
+    def res(self):
+        return fit_liquid_limits(
+            [[15, 22, 31, 40], [10, 25, 40, nan], [20, 30]],
+            [[42.5, 40.1, 38.2, 36.9], [50.0, 45.0, 42.0, nan], [30.0, 30.0]],
+            plastic_limits=[20.0, 25.0, 18.0],
+        )
+
+    def test_flow_curve(self, res):
+        # Least squares line of the first sample.
+        xs = [log10(n) for n in (15, 22, 31, 40)]
+        ys = [42.5, 40.1, 38.2, 36.9]
+        x_mean, y_mean = sum(xs) / 4, sum(ys) / 4
+        slope = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / sum(
+            (x - x_mean) ** 2 for x in xs
+        )
+        liquid_lmt = y_mean + slope * (log10(25) - x_mean)
+
+        assert res.liquid_limits[0] == pytest.approx(liquid_lmt, abs=0.005)
+        assert res.flow_indices[0] == pytest.approx(-slope, abs=0.005)
+        assert res.r_squared[0] == pytest.approx(0.998, abs=1e-3)
+
+    def test_flat_flow_curve(self, res):
+        assert res.liquid_limits[2] == 30.0
+        assert res.flow_indices[2] == 0.0
+        assert isnan(res.r_squared[2])
+
+    def test_classification(self, res):
+        assert list(res.plasticity_indices) == [19.49, 19.81, 12.0]
+        uscs_res = classify_uscs(
+            res.liquid_limits, [20.0, 25.0, 18.0], [60.0] * 3, [30.0] * 3
+        )
+        assert [clf.symbol for clf in uscs_res] == ["CL", "CL", "CL"]
+        aashto_res = classify_aashto(
+            res.liquid_limits, [20.0, 25.0, 18.0], [60.0] * 3
+        )
+        assert aashto_res[0].symbol_no_group_idx == "A-6"
+
+    def test_errors(self):
+        with pytest.raises(ValidationError):
+            fit_liquid_limits([[25, 25]], [[40.0, 41.0]])
+
+        with pytest.raises(ValidationError):
+            fit_liquid_limits([[0, 25]], [[40.0, 41.0]])
+
+        with pytest.raises(ValidationError):
+            fit_liquid_limits([[20, 30]], [[40.0, 38.0]], plastic_limits=[45.0])
+
+        with pytest.raises(ValueError):
+            fit_liquid_limits([[20, 30]], [[40.0]])
@@ -0,0 +1,84 @@
+import math
+
+import pytest
+
+from geolysis.borehole import SPTDataset
+from geolysis.exceptions import ValidationError
+from geolysis.liquefaction import screen_liquefaction
+from geolysis.soil_profile import SoilProfile
+
+
+@pytest.fixture
+def soil_profile():
+    return SoilProfile(
+        layer_boundaries=[3.0, 20.0],
+        moist_unit_wgts=[17.0, 18.0],
+        saturated_unit_wgts=[19.0, 20.0],
+        ground_water_level=1.5,
+    )
+
+
+def test_screen_liquefaction(soil_profile):
+    res = screen_liquefaction(
+        [6, 10, 15, 25, 45],
+        [2.0, 4.0, 6.0, 8.0, 10.0],
+        soil_profile,
+        peak_ground_acceleration=0.3,
+        fines_contents=[0.0, 10.0, 40.0, 0.0, 0.0],
+    )
+
+    assert list(res.clean_sand_spt_n_values) == [8.2, 11.8, 21.1, 19.8, 32.1]
+    assert res.csr[0] == pytest.approx(0.223, abs=1e-3)
+    assert res.crr[0] == pytest.approx(0.098, abs=1e-3)
+    assert list(res.factor_of_safety[:4]) == [0.44, 0.46, 0.75, 0.68]
+
+    # Too dense to liquefy.
+    assert math.isinf(res.crr[4])
+    assert math.isinf(res.factor_of_safety[4])
+
+
+def test_above_ground_water_level(soil_profile):
+    res = screen_liquefaction(
+        [6, 6], [1.0, 2.0], soil_profile, peak_ground_acceleration=0.3
+    )
+
+    # The reading at 1.0 m is above the groundwater level at 1.5 m.
+    assert math.isinf(res.crr[0])
+    assert math.isinf(res.factor_of_safety[0])
+    assert res.factor_of_safety[1] < 1.0
+
+
+def test_magnitude_scaling(soil_profile):
+    kwargs = dict(soil_profile=soil_profile, peak_ground_acceleration=0.3)
+    m_75 = screen_liquefaction([10], [4.0], magnitude=7.5, **kwargs)
+    m_65 = screen_liquefaction([10], [4.0], magnitude=6.5, **kwargs)
+
+    msf = 10.0**2.24 / 6.5**2.56
+    assert m_65.crr[0] / m_75.crr[0] == pytest.approx(msf / (10.0**2.24 / 7.5**2.56))
+    assert m_65.csr[0] == m_75.csr[0]
+
+
+def test_screen_dataset(soil_profile):
+    dataset = SPTDataset(
+        borehole_ids=["BH1", "BH1", "BH2"],
+        depths=[2.0, 4.0, 2.0],
+        recorded_spt_n_values=[6, 10, 6],
+        rod_lengths=[3.0, 5.0, 3.0],
+    )
+    res = screen_liquefaction(
+        dataset.recorded_spt_n_values,
+        dataset.depths,
+        soil_profile,
+        peak_ground_acceleration=0.3,
+        rod_length=dataset.rod_lengths,
+    )
+    assert res.factor_of_safety[0] == res.factor_of_safety[2]
+
+
+def test_errors(soil_profile):
+    with pytest.raises(ValueError):
+        screen_liquefaction([10, 12], [4.0], soil_profile, 0.3)
+    with pytest.raises(ValidationError):
+        screen_liquefaction([10], [4.0], soil_profile, 0.3, fines_contents=120.0)
+    with pytest.raises(ValidationError):
+        screen_liquefaction([10], [4.0], soil_profile, -0.3)
@@ -0,0 +1,93 @@
+import math
+
+import pytest
+
+from geolysis.borehole import SPTDataset
+from geolysis.io import open_spt_archive, write_spt_archive
+from geolysis.parallel import correct_boreholes
+from geolysis.soil_profile import SoilProfile
+from geolysis.spt import SPT
+
+
+@pytest.fixture
+def dataset():
+    return SPTDataset(
+        borehole_ids=["BH1", "BH2", "BH1", "BH3", "BH2", "BH1"],
+        depths=[1.5, 1.5, 3.0, 2.0, 3.0, 4.5],
+        recorded_spt_n_values=[10, 12, 14, 8, 20, 25],
+        hammer_types=["automatic", "donut_1", "automatic", "safety", "donut_1", "drop"],
+    )
+
+
+@pytest.fixture
+def soil_profile():
+    return SoilProfile([10.0], [18.0], [20.0], ground_water_level=2.0)
+
+
+@pytest.mark.parametrize(
+    ["max_workers", "chunk_size"], [(1, None), (2, 1), (2, None)]
+)
+def test_correct_boreholes(dataset, soil_profile, max_workers, chunk_size):
+    results = correct_boreholes(
+        dataset,
+        eop=soil_profile,
+        method="avg",
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+    )
+
+    assert [res.borehole_id for res in results] == ["BH1", "BH2", "BH3"]
+    for res in results:
+        expected = dataset.correct(dataset.rows(res.borehole_id), eop=soil_profile)
+        assert res.corrected_spt_n_values == expected.corrected_spt_n_values
+
+    bh1 = results[0]
+    assert bh1.n_design == SPT(bh1.corrected_spt_n_values, "avg").n_design()
+    assert math.isnan(results[2].n_design)
+
+
+def test_correct_archived_boreholes(tmp_path, dataset):
+    path = tmp_path / "spt.bin"
+    with open(path, "wb") as file:
+        write_spt_archive(file, dataset)
+
+    eop = [30.0, 55.0, 80.0, 30.0, 55.0, 40.0]
+    expected = correct_boreholes(dataset, eop=eop, max_workers=1)
+    archived = correct_boreholes(
+        open_spt_archive(path), eop=eop, max_workers=2, chunk_size=2
+    )
+    # BH3 has a nan N-design, which never compares equal.
+    assert archived[:2] == expected[:2]
+    assert archived[2].corrected_spt_n_values == expected[2].corrected_spt_n_values
+
+
+def test_errors(dataset):
+    with pytest.raises(ValueError):
+        correct_boreholes(dataset, eop=[50.0])
+
+
+def test_errors_per_borehole():
+    dataset = SPTDataset(
+        borehole_ids=["BH1", "BH1", "BH2", "BH2"],
+        depths=[1.5, 3.0, 1.5, 3.0],
+        recorded_spt_n_values=[0, 10, 12, 14],
+    )
+    results = correct_boreholes(
+        dataset, eop=[30.0, 55.0, 30.0, 55.0], method="min", max_workers=1
+    )
+
+    # SPT rejects the corrected N-value of 0 of BH1.
+    bh1, bh2 = results
+    assert math.isnan(bh1.n_design)
+    assert bh1.error is not None
+    assert list(bh1.corrected_spt_n_values)[0] == 0.0
+    assert bh2.error is None
+    assert bh2.n_design == SPT(bh2.corrected_spt_n_values, "min").n_design()
+
+    # An eop that cannot be corrected only fails BH1.
+    bh1, bh2 = correct_boreholes(
+        dataset, eop=[-30.0, 55.0, 30.0, 55.0], method="min", max_workers=1
+    )
+    assert bh1.error is not None
+    assert len(bh1.corrected_spt_n_values) == 0
+    assert bh2 == results[1]
@@ -1,12 +1,23 @@
+import random
+
 import pytest
 
 from geolysis.soil_classifier import (
     PSD,
+    USCS_RESULTS,
     AtterbergLimits,
+    atterberg_indices,
+    classifier_cache_info,
+    classify_aashto,
+    classify_uscs,
     create_aashto_classifier,
     create_uscs_classifier,
+    disable_classifier_cache,
+    enable_classifier_cache,
+    plasticity_chart_raster,
 )
 from geolysis.exceptions import ValidationError
+from geolysis.utils import isnan
 
 
 class TestAtterbergLimits:
@@ -157,3 +168,249 @@ class TestUSCS:
     def test_single_classification(self, al, psd, organic, expected):
         uscs_clf = create_uscs_classifier(*al, *psd, organic=organic)
         assert uscs_clf.classify().symbol == expected
+
+
+class TestClassifyUSCS:
+    def test_matches_scalar_classifier(self):
+        rng = random.Random(7)
+        samples = []
+        for _ in range(2000):
+            liquid_lmt = round(rng.uniform(5, 90), 2)
+            plastic_lmt = round(rng.uniform(0, liquid_lmt), 2)
+            fines = round(rng.uniform(0, 100), 2)
+            sand = round(rng.uniform(0, 100 - fines), 2)
+            if rng.random() < 0.5:
+                d_10 = round(rng.uniform(0.01, 1), 3)
+                d_30 = round(d_10 * rng.uniform(1, 10), 3)
+                d_60 = round(d_30 * rng.uniform(1, 10), 3)
+            else:
+                d_10 = d_30 = d_60 = None
+            organic = rng.random() < 0.2
+            samples.append(
+                (liquid_lmt, plastic_lmt, fines, sand, d_10, d_30, d_60, organic)
+            )
+
+        res = classify_uscs(*map(list, zip(*samples)))
+
+        assert len(res) == len(samples)
+        for clf, sample in zip(res, samples):
+            uscs_clf = create_uscs_classifier(*sample)
+            assert clf == uscs_clf.classify()
+
+    def test_ambiguous_classification(self):
+        res = classify_uscs(
+            [30.8, 32.78], [20.7, 22.99], [10.29, 3.87], [81.89, 15.42]
+        )
+        assert [clf.symbol for clf in res] == ["SW-SC,SP-SC", "GW,GP"]
+
+    def test_missing_particle_sizes(self):
+        nan = float("nan")
+        res = classify_uscs(
+            [30.8, 30.8],
+            [20.7, 20.7],
+            [10.29, 10.29],
+            [81.89, 81.89],
+            d_10=[0.07, nan],
+            d_30=[0.3, 0.3],
+            d_60=[0.8, 0.8],
+        )
+        assert [clf.symbol for clf in res] == ["SW-SC", "SW-SC,SP-SC"]
+
+    def test_errors(self):
+        with pytest.raises(ValidationError):
+            classify_uscs([20.0, 30.0], [10.0, 40.0], [60.0, 60.0], [20.0, 20.0])
+
+        with pytest.raises(ValidationError):
+            classify_uscs([30.8], [20.7], [10.29], [81.89], -0.07, 0.3, 0.8)
+
+        with pytest.raises(ValueError):
+            classify_uscs([30.8, 30.0], [20.7], [10.29], [81.89])
+
+
+class TestClassifyAASHTO:
+    def test_matches_scalar_classifier(self):
+        rng = random.Random(11)
+        samples = []
+        for _ in range(2000):
+            liquid_lmt = round(rng.uniform(0, 90), 1)
+            plastic_lmt = rng.choice([liquid_lmt, round(rng.uniform(0, liquid_lmt), 1)])
+            fines = round(rng.uniform(0, 100), 2)
+            samples.append((liquid_lmt, plastic_lmt, fines))
+
+        res = classify_aashto(*map(list, zip(*samples)))
+
+        assert len(res) == len(samples)
+        for i, sample in enumerate(samples):
+            asshto_clf = create_aashto_classifier(*sample)
+            assert res[i] == asshto_clf.classify()
+
+    def test_group_indices(self):
+        res = classify_aashto([61.7, 70.0, 45.0], [32.3, 38.0, 16.0], [52.09, 86, 60])
+        assert list(res.group_indices) == [12, 20, 13]
+        assert res[1].symbol == "A-7-5(20)"
+
+    def test_errors(self):
+        with pytest.raises(ValidationError):
+            classify_aashto([30.0], [40.0], [20.0])
+
+        with pytest.raises(ValidationError):
+            classify_aashto([30.0], [20.0], [-20.0])
+
+        with pytest.raises(ValueError):
+            classify_aashto([30.0, 35.0], [20.0], [20.0])
+
+
+class TestSoilClassifications:
+    @pytest.fixture
+    def uscs_res(self):
+        return classify_uscs(
+            [27.5, 34.1, 27.5, 64.1, 34.1],
+            [13.8, 21.1, 13.8, 29.0, 21.1],
+            [54.23, 47.88, 54.23, 57.17, 47.88],
+            [45.69, 37.84, 45.69, 42.58, 37.84],
+        )
+
+    def test_shared_results(self, uscs_res):
+        assert uscs_res[0] is uscs_res[2] is USCS_RESULTS[uscs_res.codes[0]]
+        assert uscs_res[-1].symbol == "SC"
+
+    def test_slice(self, uscs_res):
+        view = uscs_res[1:4]
+        assert isinstance(view.codes, memoryview)
+        assert view.codes.obj is uscs_res.codes
+        assert [clf.symbol for clf in view] == ["SC", "CL", "CH"]
+
+    def test_filter(self, uscs_res):
+        assert list(uscs_res.rows("CL", "CH")) == [0, 2, 3]
+        filtered = uscs_res.filter("SC")
+        assert len(filtered) == 2
+        assert filtered.table is USCS_RESULTS
+        assert [clf.symbol for clf in filtered] == ["SC", "SC"]
+        assert uscs_res[1:].filter("CL").counts() == {"CL": 1}
+
+        # The filtered samples share the codes of the batch.
+        assert filtered.codes.codes is uscs_res.codes
+        assert list(filtered.codes.rows) == [1, 4]
+        assert filtered[1:].codes.codes is uscs_res.codes
+        assert [clf.symbol for clf in filtered[1:]] == ["SC"]
+        assert filtered.filter("SC").codes.codes is uscs_res.codes
+
+    def test_counts(self, uscs_res):
+        assert uscs_res.counts() == {"CL": 2, "SC": 2, "CH": 1}
+
+    def test_aashto(self):
+        res = classify_aashto(
+            [61.7, 37.7, 52.6], [32.3, 23.8, 27.6], [52.09, 47.44, 45.8]
+        )
+        assert [clf.symbol for clf in res] == ["A-7-5(12)", "A-6(4)", "A-7-6(7)"]
+        assert res.counts("symbol_no_group_idx") == {"A-7-5": 1, "A-6": 1, "A-7-6": 1}
+        assert list(res.rows("A-6")) == [1]
+        filtered = res.filter("A-7-5(12)", "A-7-6")
+        assert filtered.counts() == {"A-7-5(12)": 1, "A-7-6(7)": 1}
+        assert list(res[1:].group_indices) == [4, 7]
+
+
+class TestClassifierCache:
+    @pytest.fixture(autouse=True)
+    def cache(self):
+        enable_classifier_cache(maxsize=8)
+        yield
+        disable_classifier_cache()
+
+    def test_uscs(self):
+        first = create_uscs_classifier(30.8, 20.7, 10.29, 81.89, 0.07, 0.3, 0.8)
+        second = create_uscs_classifier(30.83, 20.7, 10.3, 81.9, 0.07001, 0.3, 0.8)
+
+        res = first.classify()
+        assert res.symbol == "SW-SC"
+        assert second.classify() is res
+        assert res is classify_uscs([30.8], [20.7], [10.29], [81.89], 0.07, 0.3, 0.8)[0]
+
+        info = classifier_cache_info()["uscs"]
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+        assert info.hit_rate == pytest.approx(0.5)
+
+    def test_aashto(self):
+        res = create_aashto_classifier(61.7, 32.3, 52.09).classify()
+        assert res.symbol == "A-7-5(12)"
+        assert create_aashto_classifier(61.71, 32.3, 52.1).classify() is res
+
+        info = classifier_cache_info()["aashto"]
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_bounded(self):
+        for fines in range(20):
+            create_aashto_classifier(30.0, 20.0, fines).classify()
+        assert classifier_cache_info()["aashto"].currsize == 8
+
+    def test_disabled(self):
+        disable_classifier_cache()
+        assert classifier_cache_info() is None
+
+        clf = create_uscs_classifier(27.5, 13.8, 54.23, 45.69)
+        assert clf.classify() == clf.classify()
+        assert clf.classify() is not clf.classify()
+
+
+class TestAtterbergIndices:
+    def test_matches_atterberg_limits(self):
+        rng = random.Random(3)
+        samples = []
+        for _ in range(500):
+            liquid_lmt = round(rng.uniform(5, 90), 1)
+            plastic_lmt = round(rng.uniform(0, liquid_lmt - 0.1), 1)
+            nmc = round(rng.uniform(0, 100), 1)
+            samples.append((liquid_lmt, plastic_lmt, nmc))
+
+        res = atterberg_indices(*map(list, zip(*samples)))
+
+        for i, (liquid_lmt, plastic_lmt, nmc) in enumerate(samples):
+            al = AtterbergLimits(liquid_lmt, plastic_lmt)
+            assert res.plasticity_indices[i] == al.plasticity_index
+            assert res.above_a_line[i] == al.above_A_LINE()
+            assert res.in_hatched_zone[i] == al.limit_plot_in_hatched_zone()
+            assert res.liquidity_indices[i] == al.liquidity_index(nmc)
+            assert res.consistency_indices[i] == al.consistency_index(nmc)
+
+    def test_line_offsets(self):
+        res = atterberg_indices([50.0, 20.0], [20.0, 20.0], [30.0, 20.0])
+        assert list(res.a_line_offsets) == pytest.approx([8.1, 0.0])
+        assert list(res.u_line_offsets) == pytest.approx([-7.8, -10.8])
+        assert res.liquidity_indices is not None
+        assert isnan(res.liquidity_indices[1])
+
+    def test_errors(self):
+        with pytest.raises(ValidationError):
+            atterberg_indices([20.0], [30.0])
+
+        with pytest.raises(ValueError):
+            atterberg_indices([20.0, 30.0], [10.0])
+
+
+class TestPlasticityChartRaster:
+    def test_matches_classifier(self):
+        raster = plasticity_chart_raster(step=1.0)
+        assert raster is plasticity_chart_raster(step=1.0)
+
+        for liquid_lmt in range(0, 101, 3):
+            for plasticity_idx in range(0, min(liquid_lmt, 60) + 1, 2):
+                uscs_clf = create_uscs_classifier(
+                    liquid_lmt, liquid_lmt - plasticity_idx, 80.0, 15.0
+                )
+                clf = raster.classify(liquid_lmt, plasticity_idx)
+                assert clf == uscs_clf.classify()
+
+    def test_organic(self):
+        raster = plasticity_chart_raster(organic=True)
+        assert raster.classify(60.0, 10.0).symbol == "OH"
+        assert raster.classify(40.0, 5.0).symbol == "OL"
+
+    def test_density(self):
+        raster = plasticity_chart_raster()
+        counts = raster.density([40.0, 40.1, 60.0, 150.0], [20.0, 19.9, 10.0, 10.0])
+        assert counts[raster.index(40.0, 20.0)] == 2
+        assert counts[raster.index(60.0, 10.0)] == 1
+        assert sum(counts) == 3
+
+        with pytest.raises(ValueError):
+            raster.index(150.0, 10.0)
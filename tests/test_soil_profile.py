@@ -0,0 +1,156 @@
+import pytest
+
+from geolysis.exceptions import ValidationError
+from geolysis.soil_classifier import (
+    classify_aashto,
+    classify_uscs,
+    create_uscs_classifier,
+)
+from geolysis.soil_profile import SoilProfile, compact_strata
+from geolysis.spt import correct_spt_n_value, correct_spt_n_values
+from geolysis.utils import nan
+
+
+@pytest.fixture
+def soil_profile():
+    return SoilProfile(
+        layer_boundaries=[2.0, 5.0],
+        moist_unit_wgts=[18.0, 19.0],
+        saturated_unit_wgts=[20.0, 21.0],
+        ground_water_level=3.0,
+    )
+
+
+class TestSoilProfile:
+
+    @pytest.mark.parametrize(
+        ["depth", "total_stress", "eop"],
+        [
+            (0.0, 0.0, 0.0),
+            (1.0, 18.0, 18.0),
+            (2.0, 36.0, 36.0),
+            (3.0, 55.0, 55.0),
+            (4.0, 76.0, 66.19),
+            (6.0, 118.0, 88.57),
+        ],
+    )
+    def test_stresses(self, soil_profile, depth, total_stress, eop):
+        assert soil_profile.total_stress(depth) == pytest.approx(total_stress)
+        assert soil_profile.eop(depth) == pytest.approx(eop)
+
+    def test_stresses_for_arrays(self, soil_profile):
+        depths = [1.0, 4.0, 6.0]
+        assert list(soil_profile.eop(depths)) == pytest.approx([18.0, 66.19, 88.57])
+        assert list(soil_profile.pore_pressure(depths)) == pytest.approx(
+            [0.0, 9.81, 29.43]
+        )
+
+    def test_dry_profile(self):
+        profile = SoilProfile([10.0], moist_unit_wgts=[18.0], saturated_unit_wgts=[20.0])
+        assert profile.eop(5.0) == pytest.approx(90.0)
+
+    def test_ground_water_at_surface(self):
+        profile = SoilProfile([10.0], [18.0], [20.0], ground_water_level=0.0)
+        assert profile.eop(5.0) == pytest.approx(100.0 - 5.0 * 9.81)
+
+    def test_errors(self, soil_profile):
+        # Layer boundaries are not in ascending order
+        with pytest.raises(ValueError):
+            SoilProfile([5.0, 2.0], [18.0, 19.0], [20.0, 21.0])
+
+        # Missing unit weight for a layer
+        with pytest.raises(ValueError):
+            SoilProfile([2.0, 5.0], [18.0], [20.0, 21.0])
+
+        # Non-positive unit weight
+        with pytest.raises(ValidationError):
+            SoilProfile([2.0], [0.0], [20.0])
+
+        # Negative ground water level
+        with pytest.raises(ValidationError):
+            SoilProfile([2.0], [18.0], [20.0], ground_water_level=-1.0)
+
+        # Negative depth
+        with pytest.raises(ValueError):
+            soil_profile.eop(-1.0)
+
+
+def test_correct_spt_n_values_with_soil_profile(soil_profile):
+    depths = [1.5, 3.0, 4.5]
+    res = correct_spt_n_values([12, 18, 25], eop=soil_profile, depth=depths)
+    expected = [
+        correct_spt_n_value(n, eop=soil_profile.eop(d))
+        for n, d in zip([12, 18, 25], depths)
+    ]
+    assert list(res.corrected_spt_n_values) == expected
+
+    with pytest.raises(ValueError):
+        correct_spt_n_values([12, 18, 25], eop=soil_profile)
+
+
+class TestCompactStrata:
+    @pytest.fixture
+    def log(self):
+        depths = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        classifications = classify_uscs(
+            [27.5, 27.5, 64.1, 64.1, 64.1, 27.5],
+            [13.8, 13.8, 29.0, 29.0, 29.0, 13.8],
+            [54.23] * 6,
+            [45.69] * 6,
+        )
+        return depths, classifications
+
+    def test_strata(self, log):
+        depths, classifications = log
+        unit_wgts = [18.0, 19.0, 17.0, 17.5, nan, 20.0]
+        strata = compact_strata(
+            depths, classifications, properties={"unit_wgt": unit_wgts}
+        )
+
+        assert len(strata) == 3
+        assert strata.classifications == ("CL", "CH", "CL")
+        assert list(strata.tops) == [0.0, 2.5, 5.5]
+        assert list(strata.bottoms) == [2.5, 5.5, 6.0]
+        assert list(strata.sample_offsets) == [0, 2, 5, 6]
+        assert list(strata.properties["unit_wgt"]) == [18.5, 17.25, 20.0]
+
+        stratum = strata[-1]
+        assert (stratum.top, stratum.bottom, stratum.num_samples) == (5.5, 6.0, 1)
+        assert stratum.properties == {"unit_wgt": 20.0}
+
+    def test_scalar_results(self, log):
+        depths, classifications = log
+        limits = [(27.5, 13.8)] * 2 + [(64.1, 29.0)] * 3 + [(27.5, 13.8)]
+        results = [
+            create_uscs_classifier(ll, pl, 54.23, 45.69).classify()
+            for ll, pl in limits
+        ]
+        strata = compact_strata(depths, results)
+        assert strata == compact_strata(depths, classifications)
+
+    def test_key(self):
+        classifications = classify_aashto([61.7, 70.0], [32.3, 38.0], [52.09, 86])
+        assert len(compact_strata([1.0, 2.0], classifications)) == 2
+        strata = compact_strata(
+            [1.0, 2.0], classifications, key="symbol_no_group_idx"
+        )
+        assert strata.classifications == ("A-7-5",)
+
+    def test_soil_profile(self, log):
+        depths, classifications = log
+        strata = compact_strata(
+            depths,
+            classifications,
+            properties={"moist": [18.0] * 6, "saturated": [20.0] * 6},
+        )
+        soil_profile = strata.soil_profile("moist", "saturated")
+        assert soil_profile.layer_boundaries == (2.5, 5.5, 6.0)
+        assert soil_profile.total_stress(6.0) == pytest.approx(108.0)
+
+    def test_errors(self, log):
+        depths, classifications = log
+        with pytest.raises(ValueError):
+            compact_strata(depths[::-1], classifications)
+
+        with pytest.raises(ValueError):
+            compact_strata(depths[:-1], classifications)
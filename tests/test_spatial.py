@@ -0,0 +1,71 @@
+import math
+import random
+
+import pytest
+
+from geolysis.borehole import Borehole
+from geolysis.exceptions import ValidationError
+from geolysis.spatial import BoreholeIndex
+
+
+@pytest.fixture
+def index():
+    boreholes = [
+        Borehole([1.5, 3.0, 4.5], [10.0, 20.0, 30.0], borehole_id="BH1"),
+        Borehole([1.5, 3.0, 4.5], [20.0, 30.0, 40.0], borehole_id="BH2"),
+        Borehole([1.5, 3.0], [5.0, 15.0], borehole_id="BH3"),
+        Borehole([1.5, 3.0, 4.5, 6.0], [12.0, 18.0, 24.0, 30.0], borehole_id="BH4"),
+    ]
+    coordinates = [(0.0, 0.0), (10.0, 0.0), (0.0, 10.0), (50.0, 50.0)]
+    return BoreholeIndex(coordinates, boreholes)
+
+
+class TestBoreholeIndex:
+
+    def test_nearest(self, index):
+        (bh, dist), = index.nearest(1.0, 1.0)
+        assert bh.borehole_id == "BH1"
+        assert dist == pytest.approx(math.sqrt(2.0))
+
+        ids = [bh.borehole_id for bh, _ in index.nearest(4.0, 1.0, k=3)]
+        assert ids == ["BH1", "BH2", "BH3"]
+
+        assert len(index.nearest(0.0, 0.0, k=10)) == 4
+
+    def test_nearest_matches_brute_force(self):
+        rng = random.Random(42)
+        coordinates = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(200)]
+        boreholes = [Borehole([1.5, 3.0], [10.0, 20.0]) for _ in coordinates]
+        index = BoreholeIndex(coordinates, boreholes)
+
+        for _ in range(50):
+            x, y = rng.uniform(0, 100), rng.uniform(0, 100)
+            expected = sorted(math.dist((x, y), c) for c in coordinates)[:5]
+            dists = [d for _, d in index.nearest(x, y, k=5)]
+            assert dists == pytest.approx(expected)
+
+    def test_n_value_profile(self, index):
+        # Midway between BH1 and BH2 both boreholes weigh the same.
+        profile = index.n_value_profile(5.0, 0.0, [1.5, 2.25], k=2)
+        assert list(profile) == pytest.approx([15.0, 20.0])
+
+        # At a borehole, its own readings are returned.
+        profile = index.n_value_profile(0.0, 0.0, [3.0, 6.0], k=2)
+        assert profile[0] == 20.0
+        assert math.isnan(profile[1])
+
+    def test_n_design_grid(self, index):
+        grid = list(index.n_design_grid([0.0, 5.0], [0.0, 10.0], 3.0, 1.0, "avg", k=3))
+
+        assert len(grid) == 2
+        assert grid[0][0] == index.boreholes[0].n_design(3.0, 1.0, "avg")
+        # BH3 has no readings below 3.0 m and is ignored, leaving BH1
+        # (N = 25, 10 m away) and BH2 (N = 35, 14.1 m away).
+        assert grid[1][0] == pytest.approx((25.0 / 100 + 35.0 / 200) / (3 / 200))
+        assert not any(math.isnan(v) for row in grid for v in row)
+
+    def test_errors(self, index):
+        with pytest.raises(ValueError):
+            BoreholeIndex([(0.0, 0.0)], [])
+        with pytest.raises(ValidationError):
+            index.nearest(0.0, 0.0, k=0)
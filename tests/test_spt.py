@@ -1,14 +1,22 @@
+import math
+
 import pytest
 from geolysis.exceptions import ValidationError
 
 from geolysis.spt import (
     DilatancyCorrection,
     EnergyCorrection,
+    OPC,
     HammerType,
     SamplerType,
+    OPCMethod,
     SPT,
+    compare_opc_methods,
+    correct_spt_n_value,
+    correct_spt_n_values,
     create_overburden_pressure_correction,
 )
+from geolysis.foundation import create_foundation
 
 
 def test_create_spt_correction_errors():
@@ -161,6 +169,15 @@ class TestSkemptonOPC:
         assert opc_corr.corrected_spt_n_value() == pytest.approx(expected)
 
 
+def test_custom_opc_subclass():
+    # Subclasses only need to override `correction`.
+    class HalfOPC(OPC):
+        def correction(self) -> float:
+            return 0.5
+
+    assert HalfOPC(std_spt_n_value=20.0, eop=50.0).corrected_spt_n_value() == 10.0
+
+
 class TestDilatancyCorrection:
 
     @pytest.mark.parametrize(
@@ -169,3 +186,91 @@ class TestDilatancyCorrection:
     def test_correction(self, std_spt_n_value, expected):
         corr = DilatancyCorrection(corr_spt_n_value=std_spt_n_value)
         assert corr.corrected_spt_n_value() == pytest.approx(expected)
+
+
+class TestCorrectSPTNValues:
+
+    @pytest.mark.parametrize("opc_method", ["gibbs", "bazaraa", "peck", "liao", "skempton"])
+    @pytest.mark.parametrize(
+        "dilatancy_corr_method", [None, "non_water_aware", "water_aware"]
+    )
+    def test_matches_scalar_path(self, opc_method, dilatancy_corr_method):
+        rec_n_vals = [5, 12, 18, 25, 30]
+        eops = [30.0, 60.0, 71.8, 120.0, 250.0]
+        rod_lengths = [3.0, 5.0, 8.0, 12.0, 12.0]
+        hammer_types = ["donut_1", "automatic", "safety", "donut_2", "drop"]
+        fnd_size = create_foundation(depth=1.5, width=1.2, ground_water_level=2.0)
+
+        res = correct_spt_n_values(
+            rec_n_vals,
+            eop=eops,
+            rod_length=rod_lengths,
+            hammer_type=hammer_types,
+            borehole_diameter=120.0,
+            opc_method=opc_method,
+            dilatancy_corr_method=dilatancy_corr_method,
+            foundation_size=fnd_size,
+        )
+        expected = [
+            correct_spt_n_value(
+                n,
+                eop=eop,
+                rod_length=rod_len,
+                hammer_type=hammer_type,
+                borehole_diameter=120.0,
+                opc_method=opc_method,
+                dilatancy_corr_method=dilatancy_corr_method,
+                foundation_size=fnd_size,
+            )
+            for n, eop, rod_len, hammer_type in zip(
+                rec_n_vals, eops, rod_lengths, hammer_types
+            )
+        ]
+        assert list(res.corrected_spt_n_values) == expected
+        assert len(res.std_spt_n_values) == len(rec_n_vals)
+
+    def test_errors(self):
+        # eop outside the range of Gibbs & Holtz correction
+        with pytest.raises(ValidationError):
+            correct_spt_n_values([10, 12], eop=[100.0, 300.0], opc_method="gibbs")
+
+        # eop below the range of Peck correction
+        with pytest.raises(ValidationError):
+            correct_spt_n_values([10, 12], eop=[10.0, 100.0], opc_method="peck")
+
+        # Invalid hammer type
+        with pytest.raises(ValidationError):
+            correct_spt_n_values([10, 12], eop=[50.0, 100.0], hammer_type="manual")
+
+        # Column lengths do not match
+        with pytest.raises(ValueError):
+            correct_spt_n_values([10, 12], eop=[50.0, 100.0], rod_length=[3.0])
+
+
+class TestCompareOPCMethods:
+
+    def test_compare_opc_methods(self):
+        std_n_vals = [22.5, 11.4, 22.5, 30.0]
+        eops = [100.0, 20.0, 300.0, 0.0]
+        table = compare_opc_methods(std_n_vals, eops)
+
+        assert set(table) == set(OPCMethod)
+        for opc_method, corrected in table.items():
+            assert len(corrected) == len(std_n_vals)
+            for std_n, eop, corr_n in zip(std_n_vals, eops, corrected):
+                try:
+                    opc = create_overburden_pressure_correction(
+                        std_spt_n_value=std_n, eop=eop, opc_method=opc_method
+                    )
+                    expected = opc.corrected_spt_n_value()
+                except (ValidationError, ZeroDivisionError):
+                    assert math.isnan(corr_n)
+                else:
+                    assert corr_n == expected
+
+    def test_masked_cells(self):
+        table = compare_opc_methods([22.5, 22.5], eop=[20.0, 300.0])
+        # Peck is not valid below 24 kPa, Gibbs is not valid above 280 kPa.
+        assert math.isnan(table[OPCMethod.PECK][0])
+        assert math.isnan(table[OPCMethod.GIBBS][1])
+        assert table[OPCMethod.SKEMPTON][1] == pytest.approx(10.9)
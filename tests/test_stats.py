@@ -0,0 +1,134 @@
+import math
+import random
+import statistics
+
+import pytest
+
+from geolysis.exceptions import ValidationError
+from geolysis.spt import SPT
+from geolysis.stats import LayerStatistics, P2Quantile, RunningStatistics
+
+
+@pytest.fixture
+def n_values():
+    rng = random.Random(7)
+    return [round(rng.gauss(20.0, 5.0), 1) for _ in range(5000)]
+
+
+class TestP2Quantile:
+
+    def test_exact_for_few_values(self):
+        q = P2Quantile(0.5)
+        assert math.isnan(q.value)
+        q.extend([3.0, 1.0, 2.0])
+        assert q.value == 2.0
+
+    @pytest.mark.parametrize("p", [0.05, 0.5, 0.9])
+    def test_estimate(self, n_values, p):
+        q = P2Quantile(p)
+        q.extend(n_values)
+        expected = statistics.quantiles(n_values, n=100, method="inclusive")
+        assert q.value == pytest.approx(expected[round(p * 100) - 1], abs=0.3)
+
+    def test_merge(self, n_values):
+        a, b = P2Quantile(0.05), P2Quantile(0.05)
+        a.extend(n_values[:1500])
+        b.extend(n_values[1500:])
+        merged = a.merge(b)
+
+        expected = statistics.quantiles(n_values, n=20, method="inclusive")[0]
+        assert merged.count == len(n_values)
+        assert merged.value == pytest.approx(expected, abs=0.5)
+
+        with pytest.raises(ValueError):
+            a.merge(P2Quantile(0.5))
+
+    def test_invalid_probability(self):
+        with pytest.raises(ValidationError):
+            P2Quantile(1.5)
+
+
+class TestRunningStatistics:
+
+    def test_moments(self, n_values):
+        stats = RunningStatistics()
+        stats.extend(n_values)
+
+        assert stats.count == len(n_values)
+        assert stats.mean == pytest.approx(statistics.fmean(n_values))
+        assert stats.std == pytest.approx(statistics.stdev(n_values))
+        assert stats.min == min(n_values)
+
+    def test_merge(self, n_values):
+        parts = [RunningStatistics() for _ in range(3)]
+        for i, value in enumerate(n_values):
+            parts[i % 3].add(value)
+        merged = parts[0].merge(parts[1]).merge(parts[2]).merge(RunningStatistics())
+
+        assert merged.count == len(n_values)
+        assert merged.mean == pytest.approx(statistics.fmean(n_values))
+        assert merged.variance == pytest.approx(statistics.variance(n_values))
+        assert merged.max == max(n_values)
+
+    @pytest.mark.parametrize("method", ["min", "avg", "wgt"])
+    def test_n_design(self, method):
+        n_values = [7.0, 15.0, 18.0, 22.0]
+        stats = RunningStatistics()
+        stats.extend(n_values)
+        assert stats.n_design(method) == SPT(n_values, method=method).n_design()
+
+    def test_n_design_errors(self):
+        with pytest.raises(ValueError):
+            RunningStatistics().n_design("avg")
+
+        stats = RunningStatistics()
+        stats.extend([10.0, 12.0])
+        merged = stats.merge(stats)
+        assert merged.n_design("avg") == 11.0
+        with pytest.raises(ValueError):
+            merged.n_design("wgt")
+
+    def test_characteristic_values(self):
+        stats = RunningStatistics()
+        stats.extend([10.0, 12.0, 14.0, 16.0, 18.0])
+        values = stats.characteristic_values()
+
+        assert values.count == 5
+        assert values.mean == 14.0
+        assert values.fractile_5 == pytest.approx(10.4)
+        # t(0.95, 4) = 2.132
+        assert values.lower_bound == pytest.approx(14.0 - 2.132 * values.std / 5**0.5)
+
+        single = RunningStatistics()
+        single.add(10.0)
+        assert math.isnan(single.characteristic_values().lower_bound)
+
+
+class TestLayerStatistics:
+
+    def test_layers(self):
+        stats = LayerStatistics([3.0, 6.0])
+        stats.extend([1.5, 3.0, 4.5, 6.0, 9.0], [10.0, 12.0, 20.0, 22.0, 30.0])
+
+        assert len(stats) == 2
+        assert stats[0].count == 1
+        assert stats[1].mean == 21.0
+
+        other = LayerStatistics([3.0, 6.0])
+        other.add(2.0, 14.0)
+        merged = stats.merge(other)
+        assert merged[0].mean == 12.0
+        assert [v.count for v in merged.characteristic_values()] == [2, 4]
+
+    def test_reading_on_boundary(self):
+        # As in SoilProfile, a boundary is the top of the layer below it.
+        stats = LayerStatistics([3.0, 6.0])
+        stats.add(3.0, 12.0)
+        stats.add(6.0, 22.0)
+        assert [layer.count for layer in (stats[0], stats[1])] == [0, 2]
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            LayerStatistics([6.0, 3.0])
+        with pytest.raises(ValueError):
+            LayerStatistics([3.0]).merge(LayerStatistics([4.0]))